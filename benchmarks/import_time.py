@@ -0,0 +1,60 @@
+"""Import-time benchmark for ``aiodynamodb``.
+
+Every statement runs in a fresh interpreter, so each sample is a cold import.
+Reports the median wall time of the statement and which heavy dependencies it
+loaded.
+
+Usage::
+
+    python benchmarks/import_time.py [--repeat 15]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import aiodynamodb": "import aiodynamodb",
+    "models": "from aiodynamodb import DynamoModel, HashKey, table",
+    "client": "from aiodynamodb import DynamoDB",
+    "everything": "from aiodynamodb import *",
+}
+
+HEAVY_MODULES = ("boto3", "botocore", "aioboto3", "aiobotocore", "aiohttp", "types_aiobotocore_dynamodb")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> tuple[float, list[str]]:
+    samples: list[float] = []
+    loaded: list[str] = []
+    for _ in range(repeat):
+        probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+        result = json.loads(output)
+        samples.append(result["ms"])
+        loaded = result["loaded"]
+    return statistics.median(samples), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15, help="cold imports per statement")
+    args = parser.parse_args()
+
+    print(f"{'statement':<20} {'median ms':>10}  loaded")
+    for name, statement in STATEMENTS.items():
+        median, loaded = measure(statement, args.repeat)
+        print(f"{name:<20} {median:>10.1f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
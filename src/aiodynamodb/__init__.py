@@ -2,7 +2,8 @@
 aiodynamodb - Async DynamoDB ORM with Pydantic.
 
 An async-first DynamoDB ORM built on aioboto3 and Pydantic v2.
-Note, not threadsafe.
+Note, a ``DynamoDB`` instance is bound to one event loop unless it is created
+with ``per_loop=True``.
 
 Example:
     from aiodynamodb import table, DynamoDB, DynamoModel, HashKey
@@ -23,40 +24,83 @@ Example:
         print(fetched.name)
 """
 
-from importlib.metadata import PackageNotFoundError, version
-
-from aiodynamodb import custom_types
-from aiodynamodb.client import (
-    DynamoDB,
-)
-from aiodynamodb.custom_types import HashKey, RangeKey, ReturnValues
-from aiodynamodb.models import (
-    BatchDelete,
-    BatchGet,
-    BatchGetResult,
-    BatchPut,
-    BatchWriteResult,
-    DynamoModel,
-    TableMeta,
-    TransactConditionCheck,
-    TransactDelete,
-    TransactGet,
-    TransactPut,
-    TransactUpdate,
-    table,
-)
-from aiodynamodb.projection import ProjectionAttr
-from aiodynamodb.updates import UpdateAttr
-
-try:
-    __version__ = version("aiodynamodb")
-except PackageNotFoundError:
-    __version__ = "0.0.0.dev0"
-
-VERSION = __version__
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiodynamodb import custom_types
+    from aiodynamodb.capacity import CapacityLimit
+    from aiodynamodb.client import DynamoDB
+    from aiodynamodb.conditions import Param
+    from aiodynamodb.custom_types import HashKey, RangeKey, ReturnValues
+    from aiodynamodb.models import (
+        BatchDelete,
+        BatchGet,
+        BatchGetResult,
+        BatchPut,
+        BatchStatement,
+        BatchStatementResult,
+        BatchWriteResult,
+        DynamoModel,
+        StatementResult,
+        TableMeta,
+        TransactConditionCheck,
+        TransactDelete,
+        TransactGet,
+        TransactPut,
+        TransactUpdate,
+        table,
+    )
+    from aiodynamodb.prepared import PreparedQuery, PreparedUpdate
+    from aiodynamodb.projection import ProjectionAttr
+    from aiodynamodb.retry import RetryPolicy
+    from aiodynamodb.sync import SyncDynamoDB
+    from aiodynamodb.updates import UpdateAttr
+
+    __version__: str
+    VERSION: str
+
+# Public names and the module defining them. Nothing is imported until a name
+# is first accessed, so ``import aiodynamodb`` does not load aioboto3,
+# aiobotocore or boto3; models and conditions only load boto3's conditions
+# and types, and the client stack comes in with ``DynamoDB``.
+_EXPORTS: dict[str, str] = {
+    "DynamoDB": "aiodynamodb.client",
+    "SyncDynamoDB": "aiodynamodb.sync",
+    "PreparedQuery": "aiodynamodb.prepared",
+    "PreparedUpdate": "aiodynamodb.prepared",
+    "Param": "aiodynamodb.conditions",
+    "DynamoModel": "aiodynamodb.models",
+    "TableMeta": "aiodynamodb.models",
+    "BatchGet": "aiodynamodb.models",
+    "BatchPut": "aiodynamodb.models",
+    "BatchDelete": "aiodynamodb.models",
+    "BatchGetResult": "aiodynamodb.models",
+    "BatchWriteResult": "aiodynamodb.models",
+    "BatchStatement": "aiodynamodb.models",
+    "BatchStatementResult": "aiodynamodb.models",
+    "StatementResult": "aiodynamodb.models",
+    "TransactGet": "aiodynamodb.models",
+    "TransactPut": "aiodynamodb.models",
+    "TransactDelete": "aiodynamodb.models",
+    "TransactConditionCheck": "aiodynamodb.models",
+    "TransactUpdate": "aiodynamodb.models",
+    "ProjectionAttr": "aiodynamodb.projection",
+    "RetryPolicy": "aiodynamodb.retry",
+    "CapacityLimit": "aiodynamodb.capacity",
+    "UpdateAttr": "aiodynamodb.updates",
+    "table": "aiodynamodb.models",
+    "HashKey": "aiodynamodb.custom_types",
+    "RangeKey": "aiodynamodb.custom_types",
+    "ReturnValues": "aiodynamodb.custom_types",
+}
 
 __all__ = [
     "DynamoDB",
+    "SyncDynamoDB",
+    "PreparedQuery",
+    "PreparedUpdate",
+    "Param",
     "DynamoModel",
     "TableMeta",
     "BatchGet",
@@ -64,12 +108,17 @@ __all__ = [
     "BatchDelete",
     "BatchGetResult",
     "BatchWriteResult",
+    "BatchStatement",
+    "BatchStatementResult",
+    "StatementResult",
     "TransactGet",
     "TransactPut",
     "TransactDelete",
     "TransactConditionCheck",
     "TransactUpdate",
     "ProjectionAttr",
+    "RetryPolicy",
+    "CapacityLimit",
     "UpdateAttr",
     "table",
     "VERSION",
@@ -78,3 +127,30 @@ __all__ = [
     "RangeKey",
     "ReturnValues",
 ]
+
+
+def _package_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("aiodynamodb")
+    except PackageNotFoundError:
+        return "0.0.0.dev0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562) and cache them on the package."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    elif name == "custom_types":
+        value = importlib.import_module("aiodynamodb.custom_types")
+    elif name in ("__version__", "VERSION"):
+        value = _package_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, "__version__"})
@@ -0,0 +1,114 @@
+"""Splitting of oversized items across sibling items for ``@table(..., chunked=True)``.
+
+An item whose serialized form exceeds the DynamoDB item size limit is stored as
+a *head* item under its own key, holding only the key attributes and the chunk
+count, followed by chunk items under derived sort keys
+``<sort key> + "\\x00" + <index>``. Each chunk holds a slice of the item's
+DynamoDB JSON. The separator is the lowest code point, so a single ``BETWEEN``
+key condition selects the head and its chunks and nothing else.
+"""
+
+import json
+from typing import Any
+
+from aiodynamodb._serializers import AttributeValue, _decode_binary
+from aiodynamodb._wire import _wire_body
+
+# Hard DynamoDB item size limit.
+_MAX_ITEM_BYTES = 400 * 1024
+# Payload bytes per chunk, leaving room for the key and attribute names.
+_CHUNK_BYTES = 380 * 1024
+# TransactWriteItems caps the aggregate size of the written items at 4 MB.
+_MAX_CHUNKS = (4 * 1024 * 1024) // _CHUNK_BYTES
+
+_CHUNK_SEPARATOR = "\x00"
+_CHUNK_COUNT_ATTR = "__chunks"
+_CHUNK_DATA_ATTR = "__chunk"
+
+
+def _chunk_sort_key(range_value: str, index: int) -> str:
+    return f"{range_value}{_CHUNK_SEPARATOR}{index:04d}"
+
+
+def _chunk_key_bounds(range_value: str) -> tuple[str, str]:
+    """Inclusive sort key bounds covering a head item and all of its chunks."""
+    return range_value, f"{range_value}{_CHUNK_SEPARATOR}\uffff"
+
+
+def _split_item(
+    item: dict[str, AttributeValue],
+    *,
+    hash_key: str,
+    range_key: str,
+) -> list[dict[str, AttributeValue]] | None:
+    """Split ``item`` into a head item and chunk items, or ``None`` if it fits.
+
+    The size check uses the DynamoDB JSON body, which is never smaller than
+    DynamoDB's own item size accounting.
+    """
+    payload = _wire_body(item)
+    if len(payload) <= _MAX_ITEM_BYTES:
+        return None
+    slices = [payload[start : start + _CHUNK_BYTES] for start in range(0, len(payload), _CHUNK_BYTES)]
+    if len(slices) > _MAX_CHUNKS:
+        raise ValueError(
+            f"Item is too large to chunk: {len(payload)} bytes needs {len(slices)} chunks, the limit is {_MAX_CHUNKS}."
+        )
+    range_value = item[range_key]["S"]
+    head: dict[str, AttributeValue] = {
+        hash_key: item[hash_key],
+        range_key: item[range_key],
+        _CHUNK_COUNT_ATTR: {"N": str(len(slices))},
+    }
+    chunks = [
+        {
+            hash_key: item[hash_key],
+            range_key: {"S": _chunk_sort_key(range_value, index)},
+            _CHUNK_DATA_ATTR: {"B": data},
+        }
+        for index, data in enumerate(slices)
+    ]
+    return [head, *chunks]
+
+
+def _is_chunk(item: dict[str, Any]) -> bool:
+    return _CHUNK_DATA_ATTR in item
+
+
+def _is_chunked_head(item: dict[str, Any]) -> bool:
+    return _CHUNK_COUNT_ATTR in item
+
+
+def _chunk_id(item: dict[str, Any], hash_key: str, range_key: str) -> tuple[str, Any, str]:
+    """Hashable identity of a stored item's key, used to match chunks to their head."""
+    ((hash_type, hash_value),) = item[hash_key].items()
+    return hash_type, hash_value, item[range_key]["S"]
+
+
+def _chunks_in_page(
+    head: dict[str, Any],
+    chunks_by_id: dict[tuple[str, Any, str], dict[str, Any]],
+    *,
+    hash_key: str,
+    range_key: str,
+) -> list[dict[str, Any]] | None:
+    """The chunks of ``head`` in order, when all of them are in ``chunks_by_id``; otherwise ``None``."""
+    hash_type, hash_value, range_value = _chunk_id(head, hash_key, range_key)
+    chunks = []
+    for index in range(int(head[_CHUNK_COUNT_ATTR]["N"])):
+        chunk = chunks_by_id.get((hash_type, hash_value, _chunk_sort_key(range_value, index)))
+        if chunk is None:
+            return None
+        chunks.append(chunk)
+    return chunks
+
+
+def _assemble_item(head: dict[str, Any], chunks: list[dict[str, Any]]) -> dict[str, AttributeValue]:
+    """Rebuild the original raw item from its head and chunk items (in sort key order)."""
+    expected = int(head[_CHUNK_COUNT_ATTR]["N"])
+    if len(chunks) < expected:
+        raise ValueError(f"Chunked item is incomplete: expected {expected} chunks, found {len(chunks)}.")
+    # writes delete the chunks of a previously larger version, but items
+    # stored before that may still be followed by stale chunks
+    payload = b"".join(_decode_binary(chunk[_CHUNK_DATA_ATTR]["B"]) for chunk in chunks[:expected])
+    return json.loads(payload)
@@ -0,0 +1,60 @@
+"""A fixed set of low-level clients that requests are spread across."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+from aiobotocore.session import ClientCreatorContext
+from types_aiobotocore_dynamodb.client import DynamoDBClient
+
+type PoolStrategy = Literal["least_loaded", "round_robin"]
+
+type _OpenedClient = tuple[ClientCreatorContext[DynamoDBClient], DynamoDBClient]
+
+
+class _ClientPool:
+    """``size`` clients, each with its own connector, and their in-flight request counts.
+
+    ``acquire`` picks a client and counts the request against it until
+    ``release``. ``round_robin`` cycles through the clients; ``least_loaded``
+    picks the client with the fewest requests in flight, starting the search
+    after the previously picked client so ties are spread evenly.
+    """
+
+    def __init__(self, opened: list[_OpenedClient], strategy: PoolStrategy):
+        self._contexts = [context for context, _ in opened]
+        self.clients = [client for _, client in opened]
+        self.in_flight = [0] * len(opened)
+        self._strategy = strategy
+        self._next = 0
+
+    @classmethod
+    async def open(
+        cls, open_client: Callable[[], Awaitable[_OpenedClient]], size: int, strategy: PoolStrategy
+    ) -> "_ClientPool":
+        """Open ``size`` clients concurrently; if any fails, the opened ones are closed again."""
+        results = await asyncio.gather(*(open_client() for _ in range(size)), return_exceptions=True)
+        opened = [result for result in results if not isinstance(result, BaseException)]
+        if len(opened) < size:
+            await cls(opened, strategy).close()
+            raise next(result for result in results if isinstance(result, BaseException))
+        return cls(opened, strategy)
+
+    def acquire(self) -> int:
+        size = len(self.clients)
+        index = self._next
+        if self._strategy == "least_loaded" and size > 1:
+            in_flight = self.in_flight
+            for candidate in range(index + 1, index + size):
+                candidate %= size
+                if in_flight[candidate] < in_flight[index]:
+                    index = candidate
+        self._next = (index + 1) % size
+        self.in_flight[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        self.in_flight[index] -= 1
+
+    async def close(self) -> None:
+        await asyncio.gather(*(context.__aexit__(None, None, None) for context in self._contexts))
@@ -1,12 +1,34 @@
+import base64
+import math
+import types
 import typing
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, cast, get_args, get_origin
 
-from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
-from pydantic import BaseModel, TypeAdapter
-
-from aiodynamodb.custom_types import KeyT
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, Binary, TypeDeserializer, TypeSerializer
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    PlainSerializer,
+    PlainValidator,
+    RootModel,
+    TypeAdapter,
+    WrapSerializer,
+    WrapValidator,
+)
+
+from aiodynamodb.custom_types import Compression, KeyT, Timestamp, TimestampMicros, TimestampMillis, TimestampNanos
+
+type AttributeValue = dict[str, Any]
+type Encoder = Callable[[Any], AttributeValue]
+type ModelEncoder = Callable[[BaseModel], dict[str, AttributeValue]]
+type Decoder = Callable[[AttributeValue], Any]
+type ModelDecoder = Callable[[dict[str, AttributeValue]], dict[str, Any]]
+type Converter = Callable[[Any], Any]
+type ModelConstructor = Callable[[dict[str, Any]], BaseModel]
 
 
 def _model_has_float_fields(model: type[BaseModel]) -> bool:
@@ -69,14 +91,54 @@ def _to_dynamo_compatible(value: Any) -> Any:
     return _serialize_dynamo_primitives(value)
 
 
-class DynamoSerializer:
-    """Wrapper around boto3 serializer with float-to-Decimal coercion."""
+_BOTO_SERIALIZER = TypeSerializer()
+_MAX_EXACT_INT = 10**38
+
+
+def _boto_encode(value: Any) -> AttributeValue:
+    """Slow path: coerce primitives and defer to boto3's ``TypeSerializer``."""
+    return _BOTO_SERIALIZER.serialize(_serialize_dynamo_primitives(value))  # type: ignore[return-value]
+
+
+def _encode_value(value: Any) -> AttributeValue:
+    """Serialize a plain python value to a DynamoDB AttributeValue in one pass.
+
+    Produces exactly what ``TypeSerializer`` produces after
+    ``_serialize_dynamo_primitives``; the common exact types are handled inline
+    and everything else (sets, ``Decimal``, subclasses, out-of-range numbers)
+    falls back to boto3.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return {"S": value}
+    if value_type is bool:
+        return {"BOOL": value}
+    if value_type is int:
+        if -_MAX_EXACT_INT < value < _MAX_EXACT_INT:
+            return {"N": str(value)}
+        return _boto_encode(value)
+    if value is None:
+        return {"NULL": True}
+    if value_type is float:
+        if math.isfinite(value):
+            return {"N": str(Decimal(str(value)))}
+        return _boto_encode(value)
+    if value_type is dict:
+        return {"M": {k: _encode_value(v) for k, v in value.items()}}
+    if value_type is list or value_type is tuple:
+        return {"L": [_encode_value(v) for v in value]}
+    if value_type is bytes:
+        return {"B": value}
+    if value_type is datetime:
+        return {"S": value.isoformat()}
+    return _boto_encode(value)
 
-    def __init__(self):
-        self._serializer = TypeSerializer()
+
+class DynamoSerializer:
+    """Serialize python values to DynamoDB AttributeValues with float-to-Decimal coercion."""
 
     def _to_dynamo(self, value: Any) -> dict[str, Any]:
-        return self._serializer.serialize(_serialize_dynamo_primitives(value))  # type: ignore[return-value]
+        return _encode_value(value)
 
     def serialize(self, value: Any) -> dict[str, Any]:
         return self._to_dynamo(value)
@@ -95,14 +157,54 @@ def _unwrap_binary(value: Any) -> Any:
     return value
 
 
+_BOTO_DESERIALIZER = TypeDeserializer()
+
+
+def _decode_value(value: AttributeValue) -> Any:
+    """Schema-less decode of one AttributeValue (numbers become ``Decimal``).
+
+    Produces what ``TypeDeserializer`` plus ``_unwrap_binary`` produce, in one
+    pass. Binary values may be raw ``bytes`` (botocore-parsed responses) or
+    base64 text (responses decoded straight from the HTTP body).
+    """
+    if len(value) == 1:
+        ((tag, data),) = value.items()
+        if tag == "S":
+            return data
+        if tag == "N":
+            return DYNAMODB_CONTEXT.create_decimal(data)
+        if tag == "M":
+            return {k: _decode_value(v) for k, v in data.items()}
+        if tag == "L":
+            return [_decode_value(v) for v in data]
+        if tag == "BOOL":
+            return data
+        if tag == "NULL":
+            return None
+        if tag == "B":
+            return _decode_binary(data)
+        if tag == "SS":
+            return set(data)
+        if tag == "NS":
+            return {DYNAMODB_CONTEXT.create_decimal(n) for n in data}
+        if tag == "BS":
+            return {_decode_binary(b) for b in data}
+    return _unwrap_binary(_BOTO_DESERIALIZER.deserialize(value))  # type: ignore[arg-type]
+
+
+def _decode_binary(data: Any) -> bytes:
+    if type(data) is bytes:
+        return data
+    if isinstance(data, str):
+        return base64.b64decode(data)
+    return bytes(data)
+
+
 class DynamoDeserializer:
     """Wrapper around boto3 deserializer."""
 
-    def __init__(self):
-        self._deserializer = TypeDeserializer()
-
     def _to_dynamo(self, value: dict[str, Any]) -> Any:
-        return _unwrap_binary(self._deserializer.deserialize(value))  # type: ignore[arg-type]
+        return _decode_value(value)
 
     def deserialize(self, value: dict[str, Any]) -> Any:
         return self._to_dynamo(value)
@@ -174,5 +276,624 @@ def _extract_nested_model(annotation: Any) -> type[BaseModel] | None:
     return None
 
 
+_TIMESTAMP_FACTORS: tuple[tuple[Any, int], ...] = (
+    (Timestamp, 1),
+    (TimestampMillis, 1_000),
+    (TimestampMicros, 1_000_000),
+    (TimestampNanos, 1_000_000_000),
+)
+# Leaf types whose ``model_dump(mode="python")`` output is the value itself, so
+# ``_encode_value`` can consume them without a pydantic serializer call.
+_PASSTHROUGH_TYPES: frozenset[Any] = frozenset({str, int, float, bool, bytes, Decimal, datetime, type(None)})
+
+# Annotated metadata that replaces the dumped value, so the annotation must be
+# serialized through pydantic.
+_SERIALIZER_METADATA = (PlainSerializer, WrapSerializer, Compression)
+
+_model_encoder_cache: dict[type[BaseModel], ModelEncoder | None] = {}
+_model_encoders_building: set[type[BaseModel]] = set()
+# per-field encoders of the compiled plans, for encoding a subset of fields
+_field_encoder_cache: dict[type[BaseModel], dict[str, Encoder]] = {}
+
+
+def _model_encoder(model: type[BaseModel]) -> ModelEncoder | None:
+    """Return the compiled AttributeValue encoder for ``model``.
+
+    The plan is built once per model (``@table`` primes it at decoration time)
+    and cached. ``None`` means the model customizes its own serialization and
+    must go through ``model_dump``.
+    """
+    try:
+        return _model_encoder_cache[model]
+    except KeyError:
+        pass
+    if model in _model_encoders_building:
+        # self-referencing model: resolve lazily once the outer build finishes
+        return lambda instance: _model_encoder_cache[model](instance)  # type: ignore[misc]
+    _model_encoders_building.add(model)
+    try:
+        encoder = _build_model_encoder(model)
+    finally:
+        _model_encoders_building.discard(model)
+    _model_encoder_cache[model] = encoder
+    return encoder
+
+
+def _encode_fields(instance: BaseModel, field_names: Iterable[str]) -> dict[str, AttributeValue | None]:
+    """Encode only ``field_names`` of ``instance``; ``None`` marks fields without a value.
+
+    Uses the per-field encoders of the compiled plan, falling back to
+    ``to_dynamo`` for models that customize their serialization.
+    """
+    model = type(instance)
+    encoders = _field_encoder_cache.get(model) if _model_encoder(model) is not None else None
+    if encoders is None:
+        encoded = instance.to_dynamo()  # type: ignore[attr-defined]
+        fields = model.model_fields
+        return {name: encoded.get(name) for name in field_names if not fields[name].exclude}
+    values = instance.__dict__
+    return {
+        name: None if (value := values.get(name)) is None else encoders[name](value)
+        for name in field_names
+        if name in encoders
+    }
+
+
+def _model_has_custom_serialization(model: type[BaseModel]) -> bool:
+    """Return True when ``model_dump`` output cannot be derived field by field."""
+    decorators = model.__pydantic_decorators__
+    config = model.model_config
+    return bool(
+        not model.__pydantic_complete__
+        or issubclass(model, RootModel)
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or model.model_computed_fields
+        or config.get("extra") == "allow"
+        or config.get("serialize_by_alias")
+        or any(getattr(info, "exclude_if", None) is not None for info in model.model_fields.values())
+    )
+
+
+def _build_model_encoder(model: type[BaseModel]) -> ModelEncoder | None:
+    if _model_has_custom_serialization(model):
+        return None
+    plan = tuple(
+        (name, _compile_encoder(info.rebuild_annotation()))
+        for name, info in model.model_fields.items()
+        if not info.exclude
+    )
+    _field_encoder_cache[model] = dict(plan)
+
+    def encode(instance: BaseModel) -> dict[str, AttributeValue]:
+        values = instance.__dict__
+        encoded: dict[str, AttributeValue] = {}
+        for name, encoder in plan:
+            value = values.get(name)
+            # mirrors model_dump(exclude_none=True)
+            if value is not None:
+                encoded[name] = encoder(value)
+        return encoded
+
+    return encode
+
+
+def _compile_encoder(annotation: Any) -> Encoder:
+    """Compile an annotation into a single-pass AttributeValue encoder.
+
+    Every compiled encoder checks the runtime type before taking its fast path
+    and otherwise defers to the pydantic serializer for ``annotation``, so
+    unvalidated assignments still serialize exactly like ``model_dump``.
+    """
+    for alias, factor in _TIMESTAMP_FACTORS:
+        if annotation is alias:
+            return _timestamp_encoder(annotation, factor)
+
+    origin = get_origin(annotation)
+    if origin is None:
+        if annotation in _PASSTHROUGH_TYPES:
+            return _encode_value
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return _nested_model_encoder(annotation)
+        return _adapter_encoder(annotation)
+
+    if origin is typing.Annotated:
+        inner, *metadata = get_args(annotation)
+        if any(isinstance(meta, _SERIALIZER_METADATA) for meta in metadata):
+            return _adapter_encoder(annotation)
+        return _compile_encoder(inner)
+
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _adapter_encoder(annotation)
+        inner_encoder = _compile_encoder(args[0])
+        if inner_encoder is _encode_value:
+            return _encode_value
+
+        def encode_optional(value: Any) -> AttributeValue:
+            if value is None:
+                return {"NULL": True}
+            return inner_encoder(value)
+
+        return encode_optional
+
+    if origin is list or origin is tuple:
+        element_args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        if len(set(element_args)) != 1:
+            return _adapter_encoder(annotation)
+        element_encoder = _compile_encoder(element_args[0])
+        if element_encoder is _encode_value:
+            return _encode_value
+        fallback = _adapter_encoder(annotation)
+
+        def encode_list(value: Any) -> AttributeValue:
+            if type(value) is origin:
+                return {"L": [element_encoder(v) for v in value]}
+            return fallback(value)
+
+        return encode_list
+
+    if origin is dict:
+        dict_args = get_args(annotation)
+        if len(dict_args) != 2:
+            return _adapter_encoder(annotation)
+        value_encoder = _compile_encoder(dict_args[1])
+        if value_encoder is _encode_value:
+            return _encode_value
+        fallback = _adapter_encoder(annotation)
+
+        def encode_dict(value: Any) -> AttributeValue:
+            if type(value) is dict:
+                return {"M": {k: value_encoder(v) for k, v in value.items()}}
+            return fallback(value)
+
+        return encode_dict
+
+    if origin is set or origin is frozenset:
+        set_args = get_args(annotation)
+        if len(set_args) == 1 and set_args[0] in _PASSTHROUGH_TYPES:
+            return _encode_value
+    return _adapter_encoder(annotation)
+
+
+def _timestamp_encoder(annotation: Any, factor: int) -> Encoder:
+    fallback = _adapter_encoder(annotation)
+
+    def encode(value: Any) -> AttributeValue:
+        if type(value) is datetime:
+            return {"N": str(int(value.timestamp() * factor))}
+        return fallback(value)
+
+    return encode
+
+
+def _nested_model_encoder(model: type[BaseModel]) -> Encoder:
+    nested = _model_encoder(model)
+    if nested is None:
+        return _adapter_encoder(model)
+    fallback = _adapter_encoder(model)
+
+    def encode(value: Any) -> AttributeValue:
+        if type(value) is model:
+            return {"M": nested(value)}
+        return fallback(value)
+
+    return encode
+
+
+def _adapter_encoder(annotation: Any) -> Encoder:
+    """Encode through pydantic's serializer for types with custom dump logic."""
+    adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+
+    def encode(value: Any) -> AttributeValue:
+        return _encode_value(adapter.dump_python(value, mode="python", exclude_none=True))
+
+    return encode
+
+
+_VALIDATOR_METADATA = (BeforeValidator, PlainValidator, WrapValidator, Compression)
+
+_model_decoder_cache: dict[type[BaseModel], ModelDecoder | None] = {}
+_model_decoders_building: set[type[BaseModel]] = set()
+
+
+def _model_decoder(model: type[BaseModel]) -> ModelDecoder | None:
+    """Return the compiled AttributeValue decoder for ``model``.
+
+    The decoder turns a raw DynamoDB item into the python values
+    ``model_validate`` expects (``int`` for ``int`` fields, ``bytes`` for
+    ``bytes`` fields, plain dicts for nested models) without building the
+    intermediate ``Decimal`` / ``Binary`` objects. ``None`` means the model has
+    validators that inspect raw input, so the schema-less decode must be used.
+    """
+    try:
+        return _model_decoder_cache[model]
+    except KeyError:
+        pass
+    if model in _model_decoders_building:
+        return lambda raw: _model_decoder_cache[model](raw)  # type: ignore[misc]
+    _model_decoders_building.add(model)
+    try:
+        decoder = _build_model_decoder(model)
+    finally:
+        _model_decoders_building.discard(model)
+    _model_decoder_cache[model] = decoder
+    return decoder
+
+
+def _decode_item(model: type[BaseModel], raw: dict[str, AttributeValue]) -> dict[str, Any]:
+    """Decode a raw DynamoDB item into validation-ready python values."""
+    decoder = _model_decoder(model)
+    if decoder is None:
+        return {k: _decode_value(v) for k, v in raw.items()}
+    return decoder(raw)
+
+
+def _fields_with_raw_input_validators(model: type[BaseModel]) -> set[str] | None:
+    """Return fields whose validators see the raw input, or ``None`` for all of them."""
+    decorators = model.__pydantic_decorators__
+    if decorators.root_validators or any(d.info.mode != "after" for d in decorators.model_validators.values()):
+        return None
+    names: set[str] = set()
+    validators = [(d.info.fields, d.info.mode) for d in decorators.field_validators.values()]
+    validators += [(d.info.fields, "before") for d in decorators.validators.values()]
+    for fields, mode in validators:
+        if mode == "after":
+            continue
+        if "*" in fields:
+            return None
+        names.update(fields)
+    return names
+
+
+def _build_model_decoder(model: type[BaseModel]) -> ModelDecoder | None:
+    if not model.__pydantic_complete__ or issubclass(model, RootModel):
+        return None
+    raw_input_fields = _fields_with_raw_input_validators(model)
+    if raw_input_fields is None:
+        return None
+
+    decoders: dict[str, Decoder] = {}
+    for name, info in model.model_fields.items():
+        if name in raw_input_fields:
+            decoder: Decoder = _decode_value
+        else:
+            decoder = _compile_decoder(info.rebuild_annotation())
+        decoders[name] = decoder
+        if isinstance(info.alias, str):
+            decoders.setdefault(info.alias, decoder)
+    # with the default ``extra="ignore"`` unknown attributes would be dropped by
+    # validation anyway, so skip decoding them at all
+    keep_unknown = model.model_config.get("extra") in ("allow", "forbid")
+
+    def decode(raw: dict[str, AttributeValue]) -> dict[str, Any]:
+        decoded: dict[str, Any] = {}
+        for name, value in raw.items():
+            decoder = decoders.get(name)
+            if decoder is not None:
+                decoded[name] = decoder(value)
+            elif keep_unknown:
+                decoded[name] = _decode_value(value)
+        return decoded
+
+    return decode
+
+
+def _compile_decoder(annotation: Any) -> Decoder:
+    """Compile an annotation into a decoder for a single AttributeValue.
+
+    Each decoder checks the type tag before taking its fast path and falls back
+    to the schema-less ``_decode_value`` for anything unexpected (``NULL``,
+    mismatched tags), leaving validation errors to pydantic.
+    """
+    for alias, _ in _TIMESTAMP_FACTORS:
+        if annotation is alias:
+            # stored as integral epoch numbers
+            return _decode_int
+
+    origin = get_origin(annotation)
+    if origin is None:
+        scalar = _SCALAR_DECODERS.get(annotation)
+        if scalar is not None:
+            return scalar
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return _nested_model_decoder(annotation)
+        return _decode_value
+
+    if origin is typing.Annotated:
+        inner, *metadata = get_args(annotation)
+        if any(isinstance(meta, _VALIDATOR_METADATA) for meta in metadata):
+            return _decode_value
+        return _compile_decoder(inner)
+
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _compile_decoder(args[0])
+        if set(args) == {int, float}:
+            return _decode_int_or_float
+        return _decode_value
+
+    if origin is set or origin is frozenset:
+        set_args = get_args(annotation)
+        parse = _NUMBER_PARSERS.get(set_args[0]) if set_args else None
+        if parse is None:
+            return _decode_value
+
+        def decode_number_set(value: AttributeValue) -> Any:
+            numbers = value.get("NS")
+            if numbers is None:
+                return _decode_value(value)
+            return {parse(n) for n in numbers}
+
+        return decode_number_set
+
+    if origin is list or origin is tuple:
+        element_args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        if len(set(element_args)) != 1:
+            return _decode_value
+        element_decoder = _compile_decoder(element_args[0])
+
+        def decode_list(value: AttributeValue) -> Any:
+            elements = value.get("L")
+            if elements is None:
+                return _decode_value(value)
+            return [element_decoder(v) for v in elements]
+
+        return decode_list
+
+    if origin is dict:
+        dict_args = get_args(annotation)
+        if len(dict_args) != 2:
+            return _decode_value
+        value_decoder = _compile_decoder(dict_args[1])
+
+        def decode_dict(value: AttributeValue) -> Any:
+            entries = value.get("M")
+            if entries is None:
+                return _decode_value(value)
+            return {k: value_decoder(v) for k, v in entries.items()}
+
+        return decode_dict
+
+    return _decode_value
+
+
+def _decode_str(value: AttributeValue) -> Any:
+    decoded = value.get("S")
+    if decoded is None:
+        return _decode_value(value)
+    return decoded
+
+
+def _parse_int(number: str) -> Any:
+    try:
+        return int(number)
+    except ValueError:
+        # e.g. "1E+2" or "1.5" - let pydantic coerce or reject the Decimal
+        return Decimal(number)
+
+
+def _parse_int_or_float(number: str) -> int | float:
+    try:
+        return int(number)
+    except ValueError:
+        return float(number)
+
+
+def _decode_int(value: AttributeValue) -> Any:
+    number = value.get("N")
+    if number is None:
+        return _decode_value(value)
+    return _parse_int(number)
+
+
+def _decode_int_or_float(value: AttributeValue) -> Any:
+    number = value.get("N")
+    if number is None:
+        return _decode_value(value)
+    return _parse_int_or_float(number)
+
+
+def _decode_float(value: AttributeValue) -> Any:
+    number = value.get("N")
+    if number is None:
+        return _decode_value(value)
+    return float(number)
+
+
+def _decode_decimal(value: AttributeValue) -> Any:
+    number = value.get("N")
+    if number is None:
+        return _decode_value(value)
+    return Decimal(number)
+
+
+def _decode_bool(value: AttributeValue) -> Any:
+    decoded = value.get("BOOL")
+    if decoded is None:
+        return _decode_value(value)
+    return decoded
+
+
+def _decode_bytes(value: AttributeValue) -> Any:
+    decoded = value.get("B")
+    if decoded is None:
+        return _decode_value(value)
+    return _decode_binary(decoded)
+
+
+_NUMBER_PARSERS: dict[Any, Callable[[str], Any]] = {
+    int: _parse_int,
+    float: float,
+    Decimal: Decimal,
+}
+
+_SCALAR_DECODERS: dict[Any, Decoder] = {
+    str: _decode_str,
+    int: _decode_int,
+    float: _decode_float,
+    Decimal: _decode_decimal,
+    bool: _decode_bool,
+    bytes: _decode_bytes,
+}
+
+
+def _nested_model_decoder(model: type[BaseModel]) -> Decoder:
+    nested = _model_decoder(model)
+    if nested is None:
+        return _decode_value
+
+    def decode(value: AttributeValue) -> Any:
+        entries = value.get("M")
+        if entries is None:
+            return _decode_value(value)
+        return nested(entries)
+
+    return decode
+
+
+_model_constructor_cache: dict[type[BaseModel], ModelConstructor | None] = {}
+_model_constructors_building: set[type[BaseModel]] = set()
+
+
+def _model_constructor(model: type[BaseModel]) -> ModelConstructor | None:
+    """Return the trusted-read constructor for ``model``.
+
+    The constructor takes the output of the model decoder and builds the
+    instance with ``model_construct``, skipping validation. Only the fields
+    whose stored form differs from the python value (``Timestamp*``,
+    ``JSONStr``, ``datetime``, tuples, enums, nested models...) are converted.
+    ``None`` means the model relies on validators to shape its input and has to
+    go through ``model_validate``.
+    """
+    try:
+        return _model_constructor_cache[model]
+    except KeyError:
+        pass
+    if model in _model_constructors_building:
+        return lambda values: _model_constructor_cache[model](values)  # type: ignore[misc]
+    _model_constructors_building.add(model)
+    try:
+        constructor = _build_model_constructor(model)
+    finally:
+        _model_constructors_building.discard(model)
+    _model_constructor_cache[model] = constructor
+    return constructor
+
+
+def _build_model_constructor(model: type[BaseModel]) -> ModelConstructor | None:
+    if _model_decoder(model) is None or _fields_with_raw_input_validators(model):
+        return None
+    converters: list[tuple[str, Converter]] = []
+    for name, info in model.model_fields.items():
+        converter = _compile_converter(info.rebuild_annotation())
+        if converter is not None:
+            converters.append((name, converter))
+            if isinstance(info.alias, str) and info.alias != name:
+                converters.append((info.alias, converter))
+    construct = model.model_construct
+
+    def build(values: dict[str, Any]) -> BaseModel:
+        for name, converter in converters:
+            if name in values:
+                values[name] = converter(values[name])
+        return construct(**values)
+
+    return build
+
+
+def _compile_converter(annotation: Any) -> Converter | None:
+    """Compile the conversion from a decoded value to the field's python value.
+
+    Returns ``None`` when the decoded value already is the python value.
+    Anything without a cheap exact conversion is validated through a
+    ``TypeAdapter`` for that field alone.
+    """
+    origin = get_origin(annotation)
+    if origin is None:
+        if annotation in _PASSTHROUGH_TYPES or annotation is Any:
+            if annotation is datetime:
+                return _datetime_converter()
+            return None
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return _nested_model_converter(annotation)
+        return _adapter_converter(annotation)
+
+    if origin is typing.Annotated:
+        inner, *metadata = get_args(annotation)
+        if any(isinstance(meta, (*_VALIDATOR_METADATA, AfterValidator)) for meta in metadata):
+            return _adapter_converter(annotation)
+        return _compile_converter(inner)
+
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _adapter_converter(annotation)
+        inner_converter = _compile_converter(args[0])
+        if inner_converter is None:
+            return None
+        return lambda value: None if value is None else inner_converter(value)
+
+    if origin is list or origin is tuple:
+        element_args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        if len(set(element_args)) != 1:
+            return _adapter_converter(annotation)
+        element_converter = _compile_converter(element_args[0])
+        if element_converter is None:
+            return None if origin is list else tuple
+        if origin is list:
+            return lambda value: [element_converter(v) for v in value]
+        return lambda value: tuple(element_converter(v) for v in value)
+
+    if origin is dict:
+        dict_args = get_args(annotation)
+        if len(dict_args) != 2 or dict_args[0] is not str:
+            return _adapter_converter(annotation)
+        value_converter = _compile_converter(dict_args[1])
+        if value_converter is None:
+            return None
+        return lambda value: {k: value_converter(v) for k, v in value.items()}
+
+    if origin is set:
+        set_args = get_args(annotation)
+        if len(set_args) == 1 and set_args[0] in (str, bytes):
+            return None
+    return _adapter_converter(annotation)
+
+
+def _datetime_converter() -> Converter:
+    fallback = _adapter_converter(datetime)
+
+    def convert(value: Any) -> Any:
+        if type(value) is str:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        return fallback(value)
+
+    return convert
+
+
+def _nested_model_converter(model: type[BaseModel]) -> Converter:
+    nested = _model_constructor(model)
+    if nested is None:
+        return _adapter_converter(model)
+    fallback = _adapter_converter(model)
+
+    def convert(value: Any) -> Any:
+        if type(value) is dict:
+            return nested(value)
+        return fallback(value)
+
+    return convert
+
+
+def _adapter_converter(annotation: Any) -> Converter:
+    return TypeAdapter(annotation).validate_python
+
+
 SERIALIZER = DynamoSerializer()
 DESERIALIZER = DynamoDeserializer()
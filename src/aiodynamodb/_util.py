@@ -5,12 +5,14 @@ request fragments expected by boto/aioboto3. They are shared across read and
 write APIs so placeholder handling stays consistent.
 """
 
+from collections.abc import Collection, Hashable
+from dataclasses import dataclass
 from typing import Any, TypedDict
 
-from boto3.dynamodb.conditions import ConditionBase
+from boto3.dynamodb.conditions import AttributeBase, ConditionBase
 from pydantic import BaseModel
 
-from aiodynamodb.conditions import CustomConditionExpressionBuilder
+from aiodynamodb.conditions import CustomConditionExpressionBuilder, _serialize_condition_value
 from aiodynamodb.models import DynamoModel
 from aiodynamodb.projection import BuiltProjectionExpression, ProjectionExpressionArg, ProjectionExpressionBuilder
 
@@ -46,6 +48,146 @@ class ProjectionExpression(TypedDict, total=False):
     ExpressionAttributeNames: dict[str, str]
 
 
+# Upper bound on cached expression templates; shapes beyond it are built uncached.
+_EXPRESSION_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class _ConditionTemplate:
+    """A built condition expression with its values left as numbered slots."""
+
+    expression: str
+    names: dict[str, str]
+    value_placeholders: tuple[str, ...]
+    # builder state after the build, restored on cache hits so that later
+    # expressions sharing the builder get the same placeholders
+    name_count: int
+    value_count: int
+    current_attribute_name: str | None
+    name_placeholders: tuple[tuple[str, str], ...]
+
+
+_condition_templates: dict[Hashable, _ConditionTemplate] = {}
+
+
+def _condition_shape(
+    condition: ConditionBase,
+    slots: list[tuple[str | None, Any]],
+    current_attribute_name: str | None,
+) -> tuple[Hashable, str | None] | None:
+    """Return the structural shape of ``condition`` and collect its values.
+
+    Mirrors the traversal of boto3's ``ConditionExpressionBuilder``: the shape
+    keeps operators, attribute names and the number of values, every value is
+    appended to ``slots`` in placeholder order together with the attribute it
+    is serialized against. Returns ``None`` for trees that cannot be cached.
+    """
+    expression = condition.get_expression()
+    parts: list[Hashable] = []
+    for value in expression["values"]:
+        if isinstance(value, AttributeBase):
+            current_attribute_name = value.name
+        if isinstance(value, ConditionBase):
+            nested = _condition_shape(value, slots, current_attribute_name)
+            if nested is None:
+                return None
+            shape, current_attribute_name = nested
+            parts.append(shape)
+        elif isinstance(value, AttributeBase):
+            parts.append((type(value), value.name))
+        elif condition.has_grouped_values:
+            if not isinstance(value, Collection):
+                return None
+            slots.extend((current_attribute_name, v) for v in value)
+            parts.append(len(value))
+        else:
+            slots.append((current_attribute_name, value))
+            parts.append(None)
+    return (type(condition), expression["format"], expression["operator"], tuple(parts)), current_attribute_name
+
+
+def _condition_template(
+    model: type[BaseModel],
+    expression: ConditionBase,
+    *,
+    is_key_condition: bool,
+    custom_builder: CustomConditionExpressionBuilder,
+    slots: list[tuple[str | None, Any]],
+) -> _ConditionTemplate | None:
+    """Return the template for ``expression`` and advance ``custom_builder`` past it.
+
+    The values of ``expression`` are collected into ``slots``, aligned with
+    the template's ``value_placeholders``. The template is built (and cached)
+    on the first occurrence of a shape. Returns ``None``, leaving the builder
+    untouched, when the tree cannot be templated.
+    """
+    starting_attribute_name = getattr(custom_builder, "_current_attribute_name", None)
+    shaped = _condition_shape(expression, slots, starting_attribute_name)
+    if shaped is None:
+        return None
+
+    key = (
+        model,
+        is_key_condition,
+        custom_builder._name_count,  # type: ignore[attr-defined]
+        custom_builder._value_count,  # type: ignore[attr-defined]
+        starting_attribute_name,
+        tuple(custom_builder._name_placeholders.items()),
+        shaped[0],
+    )
+    template = _condition_templates.get(key)
+    if template is None:
+        built = custom_builder.build_expression(expression, is_key_condition=is_key_condition)
+        template = _ConditionTemplate(
+            expression=built.condition_expression,
+            names=built.attribute_name_placeholders,
+            value_placeholders=tuple(built.attribute_value_placeholders),
+            name_count=custom_builder._name_count,  # type: ignore[attr-defined]
+            value_count=custom_builder._value_count,  # type: ignore[attr-defined]
+            current_attribute_name=getattr(custom_builder, "_current_attribute_name", None),
+            name_placeholders=tuple(custom_builder._name_placeholders.items()),
+        )
+        if len(_condition_templates) < _EXPRESSION_CACHE_SIZE:
+            _condition_templates[key] = template
+        return template
+
+    custom_builder._name_count = template.name_count  # type: ignore[attr-defined]
+    custom_builder._value_count = template.value_count  # type: ignore[attr-defined]
+    if template.current_attribute_name is not None:
+        custom_builder._current_attribute_name = template.current_attribute_name
+    custom_builder._name_placeholders = dict(template.name_placeholders)
+    return template
+
+
+def _build_cached_condition_expression(
+    model: type[BaseModel],
+    expression: ConditionBase,
+    *,
+    is_key_condition: bool,
+    custom_builder: CustomConditionExpressionBuilder,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Build ``expression``, reusing the template of a structurally equal one.
+
+    Only the value placeholders differ between conditions of the same shape,
+    so a cache hit skips the builder (and boto3's attribute name regexes)
+    entirely and just serializes the new values into the known slots.
+    """
+    slots: list[tuple[str | None, Any]] = []
+    template = _condition_template(
+        model, expression, is_key_condition=is_key_condition, custom_builder=custom_builder, slots=slots
+    )
+    if template is None:
+        built = custom_builder.build_expression(expression, is_key_condition=is_key_condition)
+        return built.condition_expression, built.attribute_name_placeholders, built.attribute_value_placeholders
+
+    values = {
+        placeholder: _serialize_condition_value(model, attribute_name, value)
+        for placeholder, (attribute_name, value) in zip(template.value_placeholders, slots, strict=True)
+    }
+    # callers merge into the returned names, so hand out a copy
+    return template.expression, dict(template.names), values
+
+
 def _build_condition_expression(
     model: type[BaseModel],
     expression: ConditionBase | None,
@@ -58,18 +200,16 @@ def _build_condition_expression(
 
     When ``expression`` is already a plain string, it is passed through and no
     placeholders are generated. Otherwise the custom builder expands attribute
-    paths and serializes values based on the model schema.
+    paths and serializes values based on the model schema; the result is
+    cached per structural shape (see ``_build_cached_condition_expression``).
     """
     if expression is None:
         return None, None, None
     if not isinstance(expression, ConditionBase):
         return expression, {}, {}
     custom_builder = custom_builder or CustomConditionExpressionBuilder(model)
-    built = custom_builder.build_expression(expression, is_key_condition=is_key_condition)
-    return (
-        built.condition_expression,
-        built.attribute_name_placeholders,
-        built.attribute_value_placeholders,
+    return _build_cached_condition_expression(
+        model, expression, is_key_condition=is_key_condition, custom_builder=custom_builder
     )
 
 
@@ -151,22 +291,31 @@ def _projection_expression(
     """Build a request fragment for projection expressions.
 
     When ``builder`` is supplied (e.g. a shared condition-expression builder
-    from the same query/scan call), the projection builder's name-placeholder
-    counter is initialised to the builder's current count so that ``#n0`` etc.
-    never collide between the two expression fragments.
+    from the same query/scan call), the projection builder starts from the
+    builder's name placeholders, so ``#n0`` etc. never collide between the
+    expression fragments and names already used are reused.
     """
     if projection_expression is None:
         return {}
 
-    proj_builder = ProjectionExpressionBuilder(model)
-    if builder is not None:
-        proj_builder._name_count = builder._name_count  # type: ignore[attr-defined]
-
-    built: BuiltProjectionExpression = proj_builder.build_projection_expression(projection_expression)
+    name_count = builder._name_count if builder is not None else 0  # type: ignore[attr-defined]
+    name_placeholders = tuple(builder._name_placeholders.items()) if builder is not None else ()
+    key = (model, name_count, name_placeholders, tuple(attribute.name for attribute in projection_expression))
+    built = _projection_templates.get(key)
+    if built is None:
+        proj_builder = ProjectionExpressionBuilder(model)
+        proj_builder._name_count = name_count  # type: ignore[attr-defined]
+        proj_builder._name_placeholders = dict(name_placeholders)
+        built = proj_builder.build_projection_expression(projection_expression)
+        if len(_projection_templates) < _EXPRESSION_CACHE_SIZE:
+            _projection_templates[key] = built
 
     payload: ProjectionExpression = {
         "ProjectionExpression": built.projection_expression,
     }
     if built.expression_attribute_names:
-        payload["ExpressionAttributeNames"] = built.expression_attribute_names
+        payload["ExpressionAttributeNames"] = dict(built.expression_attribute_names)
     return payload
+
+
+_projection_templates: dict[Hashable, BuiltProjectionExpression] = {}
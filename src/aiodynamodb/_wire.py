@@ -0,0 +1,119 @@
+"""Raw DynamoDB JSON handling that bypasses botocore's shape-driven (de)serialization."""
+
+import base64
+import json
+from collections.abc import Callable
+from typing import Any
+
+from types_aiobotocore_dynamodb.client import DynamoDBClient
+
+_loads: Callable[[bytes], Any]
+_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+# Operations whose item payloads are decoded straight from the response body.
+_DIRECT_DECODE_OPERATIONS = ("GetItem", "Query", "Scan", "BatchGetItem", "ExecuteStatement", "BatchExecuteStatement")
+
+# Response members holding items. Everything else (keys, capacity, counts) is
+# small and still goes through botocore so its shape stays exactly the same.
+_ITEM_MEMBERS = ("Item", "Items", "Responses")
+
+_EMPTY_BODY = b"{}"
+
+
+def _decode_item_payload(
+    response_dict: dict[str, Any],
+    customized_response_dict: dict[str, Any],
+    **kwargs: Any,
+) -> None:
+    """``before-parse`` handler that lifts item payloads out of the raw body.
+
+    The body is parsed once with the fastest available JSON parser and the item
+    members are handed over as DynamoDB JSON, untouched. botocore only parses
+    whatever is left, so the per-attribute shape walk over every item is
+    skipped. Binary values keep their base64 wire form; the model decoders
+    accept both forms.
+    """
+    if response_dict["status_code"] >= 300:
+        return
+    body = response_dict.get("body")
+    if not body:
+        return
+    parsed = _loads(body)
+    for member in _ITEM_MEMBERS:
+        if member in parsed:
+            customized_response_dict[member] = parsed.pop(member)
+    response_dict["body"] = _dumps(parsed) if parsed else _EMPTY_BODY
+
+
+def _register_direct_decoding(client: DynamoDBClient) -> None:
+    """Route item payloads of read operations around botocore's response parser."""
+    for operation in _DIRECT_DECODE_OPERATIONS:
+        client.meta.events.register(
+            f"before-parse.dynamodb.{operation}",
+            _decode_item_payload,
+            unique_id=f"aiodynamodb-direct-decode-{operation}",
+        )
+
+
+# Write operations whose parameters are built entirely by the client, already
+# as DynamoDB JSON, and can therefore be emitted without botocore's shape walk.
+_WIRE_OPERATIONS = frozenset({"PutItem", "BatchWriteItem", "TransactWriteItems"})
+
+
+def _encode_blob(value: Any) -> str:
+    """``json.dumps`` fallback for binary values, base64 encoded like botocore does."""
+    if isinstance(value, bytes | bytearray):
+        return base64.b64encode(value).strip().decode("utf-8")
+    raise TypeError(f"Object of type {type(value).__name__} is not DynamoDB JSON serializable")
+
+
+def _wire_body(parameters: dict[str, Any]) -> bytes:
+    """Serialize request parameters into the exact body botocore would send.
+
+    botocore's JSON serializer walks the input shape copying members in input
+    order, base64-encodes blobs and finally calls ``json.dumps`` with default
+    settings; for DynamoDB JSON built by this library that reduces to a single
+    ``json.dumps`` call.
+    """
+    return json.dumps(parameters, default=_encode_blob).encode("utf-8")
+
+
+class _WireSerializer:
+    """Request serializer that emits pre-built DynamoDB JSON for write operations.
+
+    Wraps the client's own serializer. Operations in ``_WIRE_OPERATIONS`` skip
+    parameter validation and shape serialization; their headers still come
+    from botocore (serializing an empty parameter set) and signing, endpoint
+    resolution and retries are untouched. Every other operation is delegated
+    unchanged.
+    """
+
+    def __init__(self, serializer: Any):
+        self._serializer = serializer
+        # ``ParamValidationDecorator`` wraps the shape serializer; keep the bare one
+        self._shape_serializer = getattr(serializer, "_serializer", serializer)
+
+    def serialize_to_request(self, parameters: dict[str, Any], operation_model: Any) -> dict[str, Any]:
+        if operation_model.name not in _WIRE_OPERATIONS:
+            return self._serializer.serialize_to_request(parameters, operation_model)
+        request = self._shape_serializer.serialize_to_request({}, operation_model)
+        request["body"] = _wire_body(parameters)
+        return request
+
+
+def _enable_wire_mode(client: DynamoDBClient) -> None:
+    """Install ``_WireSerializer`` on a botocore client (idempotent)."""
+    serializer = client._serializer  # type: ignore[attr-defined]
+    if not isinstance(serializer, _WireSerializer):
+        client._serializer = _WireSerializer(serializer)  # type: ignore[attr-defined]
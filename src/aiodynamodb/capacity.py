@@ -0,0 +1,171 @@
+"""Client-side pacing of requests against a read/write capacity budget."""
+
+import asyncio
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from aiodynamodb.models import DynamoModel
+
+type _Kind = Literal["read", "write"]
+# (table name, index name or None for the table itself, kind)
+type _BucketKey = tuple[str, str | None, _Kind]
+# (bucket, units debited up front, table name, index name, whether it is a query/scan page)
+type _Reservation = list[tuple["_TokenBucket", float, str, str | None, bool]]
+
+_READ_OPERATIONS = frozenset({"get_item", "query", "scan", "batch_get_item", "transact_get_items"})
+_WRITE_OPERATIONS = frozenset({"put_item", "update_item", "delete_item", "batch_write_item", "transact_write_items"})
+_PAGED_OPERATIONS = frozenset({"query", "scan"})
+# pages averaged exactly before the page estimate becomes a moving average
+_PAGE_AVERAGE_WINDOW = 10
+
+
+@dataclass(frozen=True)
+class CapacityLimit:
+    """Capacity budget, in capacity units per second, for a table or one of its indexes.
+
+    Attributes:
+        model: ``DynamoModel`` subclass whose table the budget applies to.
+        read: Read capacity units per second, or ``None`` for no read limit.
+        write: Write capacity units per second, or ``None`` for no write limit.
+        index: Name of a secondary index; the budget then applies to that
+            index instead of the table.
+        burst: Seconds of unused capacity that may accumulate and be spent
+            at once.
+    """
+
+    model: type[DynamoModel]
+    read: float | None = None
+    write: float | None = None
+    index: str | None = None
+    burst: float = 1.0
+
+    def __post_init__(self) -> None:
+        for name, rate in (("read", self.read), ("write", self.write)):
+            if rate is not None and rate <= 0:
+                raise ValueError(f"{name} capacity must be positive, got {rate}.")
+
+
+class _TokenBucket:
+    """Capacity units refilled at ``rate`` per second, up to ``rate * burst``.
+
+    The balance may go negative when a request consumed more than was
+    available; later requests then wait until it is paid back.
+    ``page_units`` is the running average of the units one query or scan
+    page consumed, used as the estimate for the next page.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(rate * burst, 1.0)
+        self.tokens = self.capacity
+        self.page_units = 1.0
+        self._pages = 0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def take(self, units: float) -> None:
+        """Wait until the balance is positive, then debit ``units``."""
+        self._refill()
+        while self.tokens <= 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+            self._refill()
+        self.tokens -= units
+
+    def adjust(self, units: float) -> None:
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + units)
+
+    def record_page(self, units: float) -> None:
+        self._pages += 1
+        self.page_units += (units - self.page_units) / min(self._pages, _PAGE_AVERAGE_WINDOW)
+
+
+class _CapacityLimiter:
+    """Token buckets per table and index, debited with the capacity requests really consume.
+
+    Before a request, every bucket it draws from must have a positive
+    balance and is debited an estimate (one unit per item, two inside
+    transactions, the average of earlier pages for a query or scan page). The request asks for ``ReturnConsumedCapacity="INDEXES"``,
+    and once it returns, the estimate is replaced by the consumed units that
+    DynamoDB reports for the table and each index. Failed requests are
+    refunded.
+    """
+
+    def __init__(self, limits: Collection[CapacityLimit]):
+        self._buckets: dict[_BucketKey, _TokenBucket] = {}
+        self._indexes: dict[str, list[str]] = {}
+        for limit in limits:
+            table_name = limit.model.Meta.table_name
+            for kind, rate in (("read", limit.read), ("write", limit.write)):
+                if rate is not None:
+                    self._buckets[table_name, limit.index, kind] = _TokenBucket(rate, limit.burst)  # type: ignore[index]
+            if limit.index is not None:
+                self._indexes.setdefault(table_name, []).append(limit.index)
+
+    async def acquire(self, operation: str, table_names: Collection[str], args: dict[str, Any]) -> _Reservation:
+        """Wait for and debit the buckets ``operation`` draws from; adds ``ReturnConsumedCapacity``."""
+        if operation in _READ_OPERATIONS:
+            kind: _Kind = "read"
+        elif operation in _WRITE_OPERATIONS:
+            kind = "write"
+        else:
+            return []
+        paged = operation in _PAGED_OPERATIONS
+        reservation: _Reservation = []
+        for table_name in table_names:
+            estimate = _estimate(operation, table_name, args)
+            # reads use the table or the queried index; writes also update every index
+            indexes = [args.get("IndexName")] if kind == "read" else [None, *self._indexes.get(table_name, ())]
+            for index in indexes:
+                bucket = self._buckets.get((table_name, index, kind))
+                if bucket is not None:
+                    units = bucket.page_units if paged else estimate
+                    await bucket.take(units)
+                    reservation.append((bucket, units, table_name, index, paged))
+        if reservation:
+            args["ReturnConsumedCapacity"] = "INDEXES"
+        return reservation
+
+    def settle(self, reservation: _Reservation, consumed: Any) -> None:
+        """Replace the estimates of ``reservation`` by the consumed units (refund them if ``None``)."""
+        if consumed is None:
+            for bucket, estimate, _, _, _ in reservation:
+                bucket.adjust(estimate)
+            return
+        by_table = {entry["TableName"]: entry for entry in (consumed if isinstance(consumed, list) else [consumed])}
+        for bucket, estimate, table_name, index, paged in reservation:
+            units = _consumed_units(by_table.get(table_name), index)
+            if units is not None:
+                bucket.adjust(estimate - units)
+                if paged:
+                    bucket.record_page(units)
+
+
+def _estimate(operation: str, table_name: str, args: dict[str, Any]) -> float:
+    if operation == "batch_write_item":
+        return float(len(args["RequestItems"].get(table_name, ())))
+    if operation == "batch_get_item":
+        return float(len(args["RequestItems"].get(table_name, {}).get("Keys", ())))
+    if operation in ("transact_get_items", "transact_write_items"):
+        return 2.0 * sum(1 for item in args["TransactItems"] if next(iter(item.values()))["TableName"] == table_name)
+    return 1.0
+
+
+def _consumed_units(entry: dict[str, Any] | None, index: str | None) -> float | None:
+    """Units consumed on the table (``index=None``) or an index, from one ``ConsumedCapacity`` entry."""
+    if entry is None:
+        return None
+    if index is None:
+        table = entry.get("Table")
+        return float(table["CapacityUnits"] if table is not None else entry.get("CapacityUnits", 0.0))
+    for member in ("GlobalSecondaryIndexes", "LocalSecondaryIndexes"):
+        consumed = entry.get(member, {}).get(index)
+        if consumed is not None:
+            return float(consumed["CapacityUnits"])
+    return 0.0
@@ -1,18 +1,17 @@
 import asyncio
-from collections.abc import AsyncIterator
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Collection, Mapping, Sequence
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Literal, Self, assert_never, cast
+from typing import Any, Literal, Self, TypedDict, assert_never, cast
 
 import aioboto3
-from aioboto3.session import ResourceCreatorContext
-from aiobotocore.session import ClientCreatorContext
 from boto3.dynamodb.conditions import ConditionBase
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from pydantic import TypeAdapter
-from types_aiobotocore_dynamodb import DynamoDBServiceResource
 from types_aiobotocore_dynamodb.client import DynamoDBClient, Exceptions
 from types_aiobotocore_dynamodb.literals import BillingModeType, TableClassType
-from types_aiobotocore_dynamodb.service_resource import Table
 from types_aiobotocore_dynamodb.type_defs import (
     AttributeDefinitionTypeDef,
     CreateGlobalTableInputTypeDef,
@@ -28,13 +27,25 @@ from types_aiobotocore_dynamodb.type_defs import (
     TransactWriteItemsOutputTypeDef,
 )
 
+from aiodynamodb._chunking import (
+    _CHUNK_COUNT_ATTR,
+    _assemble_item,
+    _chunk_id,
+    _chunk_key_bounds,
+    _chunks_in_page,
+    _is_chunk,
+    _is_chunked_head,
+    _split_item,
+)
+from aiodynamodb._pool import PoolStrategy, _ClientPool, _OpenedClient
 from aiodynamodb._serializers import (
     DESERIALIZER,
     SERIALIZER,
+    _decode_item,
+    _encode_fields,
+    _model_constructor,
     _resolve_key_annotation,
     _serialize_custom_attribute,
-    _to_dynamo_compatible,
-    _unwrap_binary,
 )
 from aiodynamodb._util import (
     ConditionExpression,
@@ -43,6 +54,8 @@ from aiodynamodb._util import (
     _key_condition_expressions,
     _projection_expression,
 )
+from aiodynamodb._wire import _enable_wire_mode, _register_direct_decoding
+from aiodynamodb.capacity import CapacityLimit, _CapacityLimiter
 from aiodynamodb.conditions import CustomConditionExpressionBuilder
 from aiodynamodb.custom_types import KeyT, ReturnValues, Timestamp, TimestampMicros, TimestampMillis, TimestampNanos
 from aiodynamodb.models import (
@@ -50,17 +63,24 @@ from aiodynamodb.models import (
     BatchGet,
     BatchGetResult,
     BatchPut,
+    BatchStatement,
+    BatchStatementResult,
     BatchWriteResult,
     DynamoModel,
     QueryResult,
     Raw,
+    StatementResult,
     TransactConditionCheck,
     TransactDelete,
     TransactGet,
     TransactPut,
     TransactUpdate,
+    _changed_fields,
+    _record_saved,
 )
+from aiodynamodb.prepared import PreparedQuery, PreparedUpdate
 from aiodynamodb.projection import ProjectionExpressionArg
+from aiodynamodb.retry import _TRANSIENT_ERRORS, RetryPolicy, _is_retryable, _RetryBudget
 from aiodynamodb.updates import UpdateAttr, UpdateExpressionBuilder
 
 _KEY_TO_TYPE = {
@@ -83,45 +103,138 @@ type TransactWriteOperation = (
 )
 type BatchWriteOperation = BatchPut[DynamoModel] | BatchDelete[DynamoModel]
 
-
-_partial_field_type_adapters: dict[tuple[type[DynamoModel], str], TypeAdapter[Any]] = {}
+# Statements accepted by one BatchExecuteStatement request.
+_BATCH_STATEMENT_LIMIT = 25
 
 
-def _to_partial_model[T: DynamoModel](item: Raw, model: type[T]) -> T:
-    """Construct a model from a partial item (e.g. a projected result).
+class _ProjectedModel[T: DynamoModel]:
+    """Validation plan for one projection of a model, built once and cached.
 
-    Fields present in ``item`` are validated and coerced (so Decimal becomes
-    int, etc.).  Fields absent from ``item`` fall back to their declared
+    The projected top-level fields form a ``total=False`` TypedDict, so a whole
+    item (or a whole page, through ``page_adapter``) is validated in a single
+    pydantic-core call. Fields present in the item are validated and coerced
+    against their annotation; absent fields fall back to their declared
     default; required fields with no default are simply left unset on the
     resulting instance.
     """
-    validated: dict[str, Any] = {}
-    for fname, finfo in model.model_fields.items():
-        if fname in item:
-            cache_key = (model, fname)
-            ta = _partial_field_type_adapters.get(cache_key)
-            if ta is None:
-                ta = TypeAdapter(finfo.annotation)
-                _partial_field_type_adapters[cache_key] = ta
-            validated[fname] = ta.validate_python(item[fname])
-        elif not finfo.is_required():
-            validated[fname] = finfo.default_factory() if finfo.default_factory is not None else finfo.default  # type: ignore[call-arg]
-        # required field absent from projection — left unset on the instance
-    return model.model_construct(**validated)
-
-
-def _to_model[T: DynamoModel](item: Raw, model: type[T], _is_raw_dynamo: bool = False, _partial: bool = False) -> T:
-    if _is_raw_dynamo:
-        if _partial:
-            deserialized = {k: DESERIALIZER._to_dynamo(v) for k, v in item.items()}
-            return _to_partial_model(deserialized, model)
-        return model.from_dynamo(item)
-    # boto3 resource responses may contain Binary wrappers that Pydantic cannot
-    # validate as ``bytes`` directly — unwrap them first.
-    item = _unwrap_binary(item)
-    if _partial:
-        return _to_partial_model(item, model)
-    return model.model_validate(item)
+
+    def __init__(self, model: type[T], field_names: Collection[str]):
+        self.model = model
+        # ``rebuild_annotation`` keeps the ``Annotated`` metadata (validators, constraints, codecs)
+        fields = {fname: model.model_fields[fname].rebuild_annotation() for fname in field_names}
+        projection = TypedDict(f"{model.__name__}Projection", fields, total=False)  # type: ignore[misc]
+        self.adapter: TypeAdapter[dict[str, Any]] = TypeAdapter(projection)  # type: ignore[arg-type]
+        self.page_adapter: TypeAdapter[list[dict[str, Any]]] = TypeAdapter(list[projection])  # type: ignore[arg-type]
+        self._defaults = tuple(
+            (fname, finfo.default_factory, finfo.default)
+            for fname, finfo in model.model_fields.items()
+            if not finfo.is_required()
+        )
+
+    def construct(self, validated: dict[str, Any]) -> T:
+        for fname, default_factory, default in self._defaults:
+            if fname not in validated:
+                validated[fname] = default_factory() if default_factory is not None else default  # type: ignore[call-arg]
+        return self.model.model_construct(**validated)
+
+    def validate(self, item: dict[str, Any]) -> T:
+        return self.construct(self.adapter.validate_python(item))
+
+    def validate_page(self, items: list[dict[str, Any]]) -> list[T]:
+        return [self.construct(validated) for validated in self.page_adapter.validate_python(items)]
+
+
+# Upper bound on cached projected sub-models; projections beyond it are built uncached.
+_PROJECTED_MODEL_CACHE_SIZE = 1024
+_projected_models: dict[tuple[type[DynamoModel], tuple[str, ...] | None], _ProjectedModel[Any]] = {}
+
+
+def _projected_model[T: DynamoModel](
+    model: type[T], projection: ProjectionExpressionArg | None = None
+) -> _ProjectedModel[T]:
+    """Return the cached projected sub-model for ``projection`` (all fields when ``None``)."""
+    key = (model, None if projection is None else tuple(attr.name for attr in projection))
+    projected = _projected_models.get(key)
+    if projected is None:
+        field_names: Collection[str] = model.model_fields.keys()
+        if projection is not None:
+            roots = {attr.name.split(".", 1)[0].split("[", 1)[0] for attr in projection}
+            # paths that do not start at a field name (aliases, raw attributes) keep every field
+            if roots <= model.model_fields.keys():
+                field_names = [fname for fname in model.model_fields if fname in roots]
+        projected = _ProjectedModel(model, field_names)
+        if len(_projected_models) < _PROJECTED_MODEL_CACHE_SIZE:
+            _projected_models[key] = projected
+    return projected
+
+
+def _to_partial_model[T: DynamoModel](
+    item: Raw, model: type[T], projection: ProjectionExpressionArg | None = None
+) -> T:
+    """Construct a model from a partial item (e.g. a projected result)."""
+    return _projected_model(model, projection).validate(item)
+
+
+_page_adapters: dict[type[DynamoModel], TypeAdapter[list[Any]]] = {}
+
+
+def _page_adapter[T: DynamoModel](model: type[T]) -> TypeAdapter[list[T]]:
+    adapter = _page_adapters.get(model)
+    if adapter is None:
+        adapter = _page_adapters[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def _to_models[T: DynamoModel](
+    items: list[Raw],
+    model: type[T],
+    *,
+    partial: bool = False,
+    projection: ProjectionExpressionArg | None = None,
+    trusted: bool = False,
+) -> list[T]:
+    """Build a page of raw DynamoDB items.
+
+    Validation runs once for the whole page through a cached
+    ``TypeAdapter(list[model])`` (or the projected sub-model of
+    ``projection``), so pydantic-core loops over the items instead of Python.
+    """
+    if not items:
+        return []
+    models: list[T]
+    constructor = _model_constructor(model) if trusted else None
+    if constructor is not None:
+        models = [cast(T, constructor(_decode_item(model, item))) for item in items]
+    else:
+        decoded = [_decode_item(model, item) for item in items]
+        if partial:
+            models = _projected_model(model, projection).validate_page(decoded)
+        else:
+            models = _page_adapter(model).validate_python(decoded)
+    for instance in models:
+        instance._track_changes()
+    return models
+
+
+def _to_model[T: DynamoModel](
+    item: Raw,
+    model: type[T],
+    *,
+    partial: bool = False,
+    trusted: bool = False,
+    projection: ProjectionExpressionArg | None = None,
+) -> T:
+    """Build one raw DynamoDB item; ``trusted`` skips validation, ``partial`` leaves unprojected fields unset."""
+    instance: T
+    constructor = _model_constructor(model) if trusted else None
+    if constructor is not None:
+        instance = cast(T, constructor(_decode_item(model, item)))
+    elif partial:
+        instance = _to_partial_model(_decode_item(model, item), model, projection)
+    else:
+        instance = model.from_dynamo(item)
+    instance._track_changes()
+    return instance
 
 
 def _merge_expression_attribute_names(
@@ -160,6 +273,14 @@ class DynamoDB:
         self,
         session: aioboto3.Session | None = None,
         hash_key_types: dict[Any, str] = _KEY_TO_TYPE,
+        *,
+        trusted_reads: bool = False,
+        wire_mode: bool = False,
+        pool_size: int = 1,
+        pool_strategy: PoolStrategy = "least_loaded",
+        per_loop: bool = False,
+        retry: RetryPolicy | None = None,
+        capacity_limits: Collection[CapacityLimit] = (),
         **kwargs: Any,
     ):
         """Create a client instance.
@@ -167,24 +288,63 @@ class DynamoDB:
         Args:
             session: Optional ``aioboto3`` session. If omitted, a new session is created.
             hash_key_types: Mapping of Python types to DynamoDB type codes.
-            **kwargs: Extra keyword arguments forwarded to both
-                ``session.resource()`` and ``session.client()`` (e.g.
-                ``endpoint_url``, ``region_name``, ``config``).
+            trusted_reads: Default for the ``trusted`` flag of read methods.
+                When enabled, items are built with ``model_construct`` instead
+                of being validated. Only use this for tables whose items were
+                written through this library.
+            wire_mode: Emit the request bodies of ``put``, ``batch_write``
+                and ``transact_write`` directly as DynamoDB JSON, skipping
+                botocore's parameter validation and serialization. Malformed
+                requests are then only rejected by DynamoDB itself.
+            pool_size: Number of low-level clients to open. Each has its own
+                connection pool (``max_pool_connections`` connections), and
+                requests are spread across them.
+            pool_strategy: How a request picks its client when
+                ``pool_size > 1``: ``"least_loaded"`` (fewest requests in
+                flight) or ``"round_robin"``.
+            per_loop: Open separate clients (and locks) for every event loop
+                the instance is used from, so one instance can be shared by
+                several threads or loops. Each loop closes its own clients
+                with ``close``.
+            retry: Retry throttled and transiently failing requests with
+                jittered exponential backoff and per-table retry budgets
+                (see ``RetryPolicy``). Replaces botocore's own retries unless
+                ``config`` sets ``retries``.
+            capacity_limits: Read/write capacity budgets per table or index
+                (see ``CapacityLimit``). Requests against a limited table are
+                paced so that the capacity DynamoDB reports as consumed stays
+                within the budget.
+            **kwargs: Extra keyword arguments forwarded to
+                ``session.client()`` (e.g. ``endpoint_url``, ``region_name``,
+                ``config``).
         """
         self._session = session or aioboto3.Session()
         self.hash_key_types = hash_key_types
+        self.trusted_reads = trusted_reads
+        self.wire_mode = wire_mode
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got {pool_size}.")
+        self.pool_size = pool_size
+        self.pool_strategy = pool_strategy
+        self.per_loop = per_loop
+        self.retry = retry
+        self._retry_budgets: dict[str, _RetryBudget] = {}
+        if retry is not None:
+            config: Config | None = kwargs.get("config")
+            if getattr(config, "retries", None) is None:
+                # a single attempt per botocore call; this client does the retrying
+                kwargs["config"] = (config or Config()).merge(Config(retries={"total_max_attempts": 1}))
+        self._capacity_limiter = _CapacityLimiter(capacity_limits) if capacity_limits else None
         self._boto_kwargs = kwargs
         self._exceptions: Exceptions | None = None
-        self._held_resource: DynamoDBServiceResource | None = None
-        self._held_client: DynamoDBClient | None = None
-        self._resource_ctx: ResourceCreatorContext[DynamoDBServiceResource] | None = None
-        self._client_ctx: ClientCreatorContext[DynamoDBClient] | None = None
-        self._resource_lock: asyncio.Lock = asyncio.Lock()
+        self._pool: _ClientPool | None = None
         self._client_lock: asyncio.Lock = asyncio.Lock()
-        self._table_cache: dict[str, Table] = {}
+        # per_loop mode: clients and locks keyed by event loop, never used across loops
+        self._loop_pools: dict[asyncio.AbstractEventLoop, _ClientPool] = {}
+        self._loop_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._loop_locks_guard = threading.Lock()
 
     async def __aenter__(self) -> Self:
-        await self._ensure_resource()
         await self._ensure_client()
         return self
 
@@ -192,42 +352,88 @@ class DynamoDB:
         await self.close()
 
     async def close(self) -> None:
-        """Release held connections. Call when done if not using as a context manager."""
-        self._table_cache.clear()
-        if self._resource_ctx is not None:
-            await self._resource_ctx.__aexit__(None, None, None)
-            self._held_resource = None
-            self._resource_ctx = None
-        if self._client_ctx is not None:
-            await self._client_ctx.__aexit__(None, None, None)
-            self._held_client = None
-            self._client_ctx = None
-
-    async def _table(self, table_name: str) -> Table:
-        if table_name not in self._table_cache:
-            resource = await self._ensure_resource()
-            self._table_cache[table_name] = await resource.Table(table_name)
-        return self._table_cache[table_name]
-
-    async def _ensure_resource(self) -> DynamoDBServiceResource:
-        if self._held_resource is not None:
-            return self._held_resource
-        async with self._resource_lock:
-            if self._held_resource is None:
-                self._resource_ctx = self._session.resource("dynamodb", **self._boto_kwargs)
-                self._held_resource = await self._resource_ctx.__aenter__()
-        assert self._held_resource is not None
-        return self._held_resource
+        """Release held connections. Call when done if not using as a context manager.
 
-    async def _ensure_client(self) -> DynamoDBClient:
-        if self._held_client is not None:
-            return self._held_client
+        With ``per_loop=True`` only the clients of the running event loop are
+        closed; every loop that used the instance closes its own.
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+        if self.per_loop:
+            loop = asyncio.get_running_loop()
+            with self._loop_locks_guard:
+                self._loop_locks.pop(loop, None)
+                loop_pool = self._loop_pools.pop(loop, None)
+            if loop_pool is not None:
+                await loop_pool.close()
+
+    @property
+    def in_flight(self) -> list[int]:
+        """Number of requests currently running on each pooled client (empty until opened).
+
+        With ``per_loop=True`` these are the clients of the running event loop.
+        """
+        pool = self._pool
+        if self.per_loop:
+            try:
+                pool = self._loop_pools.get(asyncio.get_running_loop())
+            except RuntimeError:
+                pool = None
+        return list(pool.in_flight) if pool is not None else []
+
+    async def _open_client(self) -> _OpenedClient:
+        context = self._session.client("dynamodb", **self._boto_kwargs)
+        client = await context.__aenter__()
+        _register_direct_decoding(client)
+        if self.wire_mode:
+            _enable_wire_mode(client)
+        return context, client
+
+    async def _ensure_pool(self) -> _ClientPool:
+        if self.per_loop:
+            return await self._ensure_loop_pool()
+        if self._pool is not None:
+            return self._pool
         async with self._client_lock:
-            if self._held_client is None:
-                self._client_ctx = self._session.client("dynamodb", **self._boto_kwargs)
-                self._held_client = await self._client_ctx.__aenter__()
-        assert self._held_client is not None
-        return self._held_client
+            if self._pool is None:
+                self._pool = await _ClientPool.open(self._open_client, self.pool_size, self.pool_strategy)
+        return self._pool
+
+    async def _ensure_loop_pool(self) -> _ClientPool:
+        """Return the clients of the running event loop, opening them on first use."""
+        loop = asyncio.get_running_loop()
+        pool = self._loop_pools.get(loop)
+        if pool is not None:
+            return pool
+        with self._loop_locks_guard:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                self._drop_closed_loops()
+                lock = self._loop_locks[loop] = asyncio.Lock()
+        async with lock:
+            pool = self._loop_pools.get(loop)
+            if pool is None:
+                pool = await _ClientPool.open(self._open_client, self.pool_size, self.pool_strategy)
+                with self._loop_locks_guard:
+                    self._loop_pools[loop] = pool
+        return pool
+
+    def _drop_closed_loops(self) -> None:
+        """Forget the clients of loops that ended without ``close`` (call with the guard held).
+
+        Their connectors cannot be closed without their loop; dropping the
+        references leaves the sockets to garbage collection instead of
+        keeping them for the life of the instance.
+        """
+        # aiohttp connectors reference their loop, so weak keys would never expire
+        for loop in [loop for loop in self._loop_locks if loop.is_closed()]:
+            del self._loop_locks[loop]
+            self._loop_pools.pop(loop, None)
+
+    async def _ensure_client(self) -> DynamoDBClient:
+        """Open the clients if needed and return the first one."""
+        return (await self._ensure_pool()).clients[0]
 
     async def exceptions(self):
         """Return the boto3 DynamoDB exception namespace for error handling."""
@@ -236,6 +442,44 @@ class DynamoDB:
                 self._exceptions = client.exceptions
         return self._exceptions
 
+    async def warmup(
+        self,
+        models: Collection[type[DynamoModel]] = (),
+        *,
+        connections: int | None = None,
+    ) -> None:
+        """Pay the one-off costs of the first requests up front.
+
+        Opens the clients (credential and endpoint resolution), builds the
+        per-model page validators and trusted-read constructors, and sends
+        ``connections`` concurrent ``describe_table`` requests (cycling through
+        ``models``; ``describe_endpoints`` when none are given) so that many
+        keep-alive connections are established and TLS handshakes are done.
+
+        Args:
+            models: ``DynamoModel`` subclasses that will be read or written.
+            connections: Number of connections to open. Defaults to one per
+                pooled client. Connections beyond ``max_pool_connections``
+                per client are not kept alive.
+        """
+        pool = await self._ensure_pool()
+        for model in models:
+            _page_adapter(model)
+            _model_constructor(model)
+        await self.exceptions()
+        table_names = [model.Meta.table_name for model in models]
+
+        async def connect(index: int) -> None:
+            client: DynamoDBClient
+            async with self._client() as client:
+                if table_names:
+                    await client.describe_table(TableName=table_names[index % len(table_names)])
+                else:
+                    await client.describe_endpoints()
+
+        count = len(pool.clients) if connections is None else connections
+        await asyncio.gather(*(connect(index) for index in range(count)))
+
     async def put(self, item: DynamoModel, *, condition_expression: ConditionBase | None = None) -> None:
         """Insert or replace an item in DynamoDB.
 
@@ -244,9 +488,88 @@ class DynamoDB:
             condition_expression: Optional conditional expression for guarded
                 writes.
         """
-        args = _condition_expressions(type(item), condition_expression)
-        table = await self._table(item.Meta.table_name)
-        await table.put_item(Item=item.to_dynamo_compatible(), **args)
+        args = _condition_expressions_for_client(type(item), condition_expression)
+        dynamo_item = item.to_dynamo()
+        meta = item.Meta
+        if meta.chunked:
+            await self._put_chunked(type(item), dynamo_item, args)
+        else:
+            await self._request("put_item", (meta.table_name,), TableName=meta.table_name, Item=dynamo_item, **args)
+        item._track_changes()
+
+    async def save(self, item: DynamoModel, *, condition_expression: ConditionBase | None = None) -> bool:
+        """Persist the fields of ``item`` changed since it was read or written.
+
+        Instances returned by reads (and instances already passed to ``put``
+        or ``save``) remember their stored field values. Only fields whose
+        value changed are sent, as ``SET`` actions (``REMOVE`` for fields now
+        ``None``), and no request is made when nothing changed. Untracked instances and items of
+        chunked tables are written in full with ``put``. Fields mutated in
+        place must be flagged with ``item.mark_dirty(...)``.
+
+        Args:
+            item: The model instance to persist.
+            condition_expression: Optional conditional expression for guarded
+                writes.
+
+        Returns:
+            ``True`` when a request was sent, ``False`` when nothing changed.
+
+        Raises:
+            ValueError: If a key field was changed; put the item under its new
+                key instead.
+        """
+        changed = _changed_fields(item)
+        model = type(item)
+        meta = model.Meta
+        if changed is None or meta.chunked:
+            await self.put(item, condition_expression=condition_expression)
+            return True
+        if not changed:
+            return False
+        changed_keys = [name for name in changed if name in (meta.hash_key, meta.range_key)]
+        if changed_keys:
+            raise ValueError(f"Cannot save changed key field(s) {changed_keys} of {model.__name__}; use put instead.")
+
+        args: dict[str, Any] = {
+            "TableName": meta.table_name,
+            "Key": _build_dynamo_key(
+                model,
+                hash_key=getattr(item, meta.hash_key),
+                range_key=getattr(item, meta.range_key) if meta.range_key else None,
+            ),
+        }
+        args.update(_condition_expressions_for_client(model, condition_expression))
+        names: dict[str, str] = dict(args.get("ExpressionAttributeNames", {}))
+        values: dict[str, Any] = dict(args.get("ExpressionAttributeValues", {}))
+        set_actions: list[str] = []
+        remove_actions: list[str] = []
+        # values being written; fields assigned while the request is in flight stay changed
+        saved = {name: item.__dict__[name] for name in changed}
+        # "#s"/":s" placeholders never collide with the builder's "#n"/":v"
+        for index, (field_name, value) in enumerate(_encode_fields(item, changed).items()):
+            names[f"#s{index}"] = field_name
+            if value is None:
+                remove_actions.append(f"#s{index}")
+            else:
+                values[f":s{index}"] = value
+                set_actions.append(f"#s{index} = :s{index}")
+        clauses = []
+        if set_actions:
+            clauses.append("SET " + ", ".join(set_actions))
+        if remove_actions:
+            clauses.append("REMOVE " + ", ".join(remove_actions))
+        if not clauses:
+            _record_saved(item, saved)
+            return False
+        args["UpdateExpression"] = " ".join(clauses)
+        args["ExpressionAttributeNames"] = names
+        if values:
+            args["ExpressionAttributeValues"] = values
+
+        await self._request("update_item", (meta.table_name,), **args)
+        _record_saved(item, saved)
+        return True
 
     async def delete[T: DynamoModel](
         self,
@@ -265,10 +588,13 @@ class DynamoDB:
             condition_expression: Optional conditional expression that must match
                 for the delete to succeed.
         """
-        key = _build_key(model, hash_key=hash_key, range_key=range_key)
-        args = _condition_expressions(model, condition_expression)
-        table = await self._table(model.Meta.table_name)
-        await table.delete_item(Key=key, **args)
+        key = _build_dynamo_key(model, hash_key=hash_key, range_key=range_key)
+        args = _condition_expressions_for_client(model, condition_expression)
+        meta = model.Meta
+        if meta.chunked:
+            await self._delete_chunked(model, key, args)
+            return
+        await self._request("delete_item", (meta.table_name,), TableName=meta.table_name, Key=key, **args)
 
     async def update[T: DynamoModel](
         self,
@@ -297,7 +623,8 @@ class DynamoDB:
             otherwise ``None``.
         """
         args: dict[str, Any] = {
-            "Key": _build_key(model, hash_key=hash_key, range_key=range_key),
+            "TableName": model.Meta.table_name,
+            "Key": _build_dynamo_key(model, hash_key=hash_key, range_key=range_key),
         }
         if return_values is not None:
             args["ReturnValues"] = return_values
@@ -312,20 +639,59 @@ class DynamoDB:
         args["UpdateExpression"] = built.update_expression
         args["ExpressionAttributeNames"] = _merge_expression_attribute_names(
             args.get("ExpressionAttributeNames"),
-            _to_dynamo_compatible(built.expression_attribute_names),
+            built.expression_attribute_names,
         )
-        ev = args.get("ExpressionAttributeValues", {}) | _to_dynamo_compatible(built.expression_attribute_values)
+        ev = args.get("ExpressionAttributeValues", {}) | built.expression_attribute_values
         if ev:
-            args["ExpressionAttributeValues"] = ev
+            args["ExpressionAttributeValues"] = _to_dynamo_expression_values(ev)
+        return await self._update_item(model, args)
 
-        table = await self._table(model.Meta.table_name)
-        response = await table.update_item(**args)
+    async def _update_item[T: DynamoModel](self, model: type[T], args: dict[str, Any]) -> T | None:
+        """Send an ``update_item`` request and build the returned attributes, if any."""
+        response = await self._request("update_item", (model.Meta.table_name,), **args)
 
         item = response.get("Attributes")
         if not item:
             return None
-        _partial = return_values in ("UPDATED_NEW", "UPDATED_OLD")
-        return _to_model(item, model, _partial=_partial)
+        _partial = args.get("ReturnValues") in ("UPDATED_NEW", "UPDATED_OLD")
+        return _to_model(item, model, partial=_partial)
+
+    def prepare_update[T: DynamoModel](
+        self,
+        model: type[T],
+        *,
+        update_expression: set[UpdateAttr],
+        condition_expression: ConditionBase | None = None,
+        return_values: ReturnValues | None = None,
+    ) -> PreparedUpdate[T]:
+        """Build a reusable ``update`` whose key and values are bound per execution.
+
+        Values that change between calls are written as ``Param("name")`` in
+        ``update_expression`` and ``condition_expression``; all other values
+        are fixed at preparation.
+
+        Example:
+            increment = db.prepare_update(Counter, update_expression={UpdateAttr("hits").add(Param("by"))})
+            await increment.execute(hash_key="home", by=1)
+            await db.transact_write([increment.transact(hash_key="home", by=1), ...])
+
+        Args:
+            model: ``DynamoModel`` subclass mapped to the target table.
+            update_expression: Set of ``UpdateAttr(...)`` actions describing the
+                update to apply.
+            condition_expression: Optional conditional expression.
+            return_values: Optional DynamoDB return mode for ``execute``.
+
+        Returns:
+            A ``PreparedUpdate`` bound to this client.
+        """
+        return PreparedUpdate(
+            self,
+            model,
+            update_expression=update_expression,
+            condition_expression=condition_expression,
+            return_values=return_values,
+        )
 
     async def get[T: DynamoModel](
         self,
@@ -335,6 +701,7 @@ class DynamoDB:
         range_key: KeyT | None = None,
         consistent_reads: bool = False,
         projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
     ) -> T | None:
         """Get a single item by primary key.
 
@@ -345,28 +712,39 @@ class DynamoDB:
             consistent_reads: Whether to use strongly consistent reads.
             projection_expression: Optional list of ``ProjectionAttr(...)``
                 paths to project.
+            trusted: Build the result with ``model_construct`` instead of
+                validating it. Defaults to the client's ``trusted_reads``.
 
         Returns:
             Validated model instance when found, otherwise ``None``.
         """
-        meta = model.Meta
-        key = {meta.hash_key: _serialize_custom_attribute(model, meta.hash_key, hash_key)}
-        if meta.range_key and range_key is not None:
-            serialized = _serialize_custom_attribute(model, meta.range_key, range_key)
-            key[meta.range_key] = serialized
-
-        args: dict[str, Any] = {
-            "Key": key,
-            "ConsistentRead": consistent_reads,
-        }
-        args.update(_projection_expression(model, projection_expression))
+        key = _build_dynamo_key(model, hash_key=hash_key, range_key=range_key)
+        item: dict[str, Any] | None
+        if model.Meta.chunked:
+            # a single query returns the item and, when oversized, its chunks;
+            # projections are applied after reassembly
+            item = _assemble_chunk_group(
+                model, await self._query_chunk_group(model, key, consistent_read=consistent_reads)
+            )
+        else:
+            args: dict[str, Any] = {
+                "TableName": model.Meta.table_name,
+                "Key": key,
+                "ConsistentRead": consistent_reads,
+            }
+            args.update(_projection_expression(model, projection_expression))
 
-        table = await self._table(meta.table_name)
-        resp = await table.get_item(**args)
-        item = resp.get("Item")
+            resp = await self._request("get_item", (model.Meta.table_name,), **args)
+            item = cast(dict[str, Any] | None, resp.get("Item"))
         if item is None:
             return None
-        return _to_model(item, model, _partial=projection_expression is not None)
+        return _to_model(
+            item,
+            model,
+            partial=projection_expression is not None,
+            trusted=self._is_trusted(trusted),
+            projection=projection_expression,
+        )
 
     async def query[T: DynamoModel](
         self,
@@ -381,6 +759,7 @@ class DynamoDB:
         consistent_read: bool = False,
         scan_index_forward=True,
         projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
     ) -> AsyncIterator[QueryResult[T]]:
         """Query items and yield paginated results.
 
@@ -398,12 +777,13 @@ class DynamoDB:
                 ``False``.
             projection_expression: Optional list of ``ProjectionAttr(...)``
                 paths to project.
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
 
         Yields:
             ``QueryResult`` pages containing validated model instances.
         """
-        meta = model.Meta
-
+        _check_chunked_read(model, index_name, filter_expression)
         query_args: dict[str, Any] = {
             "ScanIndexForward": scan_index_forward,
             "ConsistentRead": consistent_read,
@@ -430,7 +810,9 @@ class DynamoDB:
             query_args=query_args,
             builder=condition_builder,
         )
-        projection_payload = _projection_expression(model, projection_expression, builder=condition_builder)
+        # chunked heads need all their attributes; their projection is applied after reassembly
+        request_projection = None if model.Meta.chunked else projection_expression
+        projection_payload = _projection_expression(model, request_projection, builder=condition_builder)
         if projection_payload:
             query_args["ProjectionExpression"] = projection_payload["ProjectionExpression"]
             merged_names = _merge_expression_attribute_names(
@@ -445,19 +827,14 @@ class DynamoDB:
         if return_consumed_capacity:
             query_args["ReturnConsumedCapacity"] = "TOTAL"
 
-        table = await self._table(meta.table_name)
-
-        while True:
-            page = await table.query(**query_args)
-            yield QueryResult(
-                items=[
-                    _to_model(item, model, _partial=projection_expression is not None) for item in page.get("Items", [])
-                ],
-                last_evaluated_key=page.get("LastEvaluatedKey"),
-            )
-            if "LastEvaluatedKey" not in page:
-                break
-            query_args["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+        async for result in self._paginate(
+            "query",
+            model,
+            query_args,
+            projection=projection_expression,
+            trusted=self._is_trusted(trusted),
+        ):
+            yield result
 
     async def scan[T: DynamoModel](
         self,
@@ -470,6 +847,7 @@ class DynamoDB:
         consistent_read: bool = False,
         return_consumed_capacity: bool = False,
         projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
     ) -> AsyncIterator[QueryResult[T]]:
         """Scan all items in a table (or index) and yield paginated results.
 
@@ -486,12 +864,13 @@ class DynamoDB:
             return_consumed_capacity: Include consumed capacity in the response.
             projection_expression: Optional list of ``ProjectionAttr(...)``
                 paths to project.
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
 
         Yields:
             ``QueryResult`` pages containing validated model instances.
         """
-        meta = model.Meta
-
+        _check_chunked_read(model, index_name, filter_expression)
         scan_args: dict[str, Any] = {"ConsistentRead": consistent_read}
         if index_name is not None:
             scan_args["IndexName"] = index_name
@@ -505,7 +884,9 @@ class DynamoDB:
         condition_builder = CustomConditionExpressionBuilder(model)
         _add_filter_expressions(model, filter_expression, query_args=scan_args, builder=condition_builder)
 
-        projection_payload = _projection_expression(model, projection_expression, builder=condition_builder)
+        # chunked heads need all their attributes; their projection is applied after reassembly
+        request_projection = None if model.Meta.chunked else projection_expression
+        projection_payload = _projection_expression(model, request_projection, builder=condition_builder)
         if projection_payload:
             scan_args["ProjectionExpression"] = projection_payload["ProjectionExpression"]
             merged_names = _merge_expression_attribute_names(
@@ -515,22 +896,226 @@ class DynamoDB:
             if merged_names:
                 scan_args["ExpressionAttributeNames"] = merged_names
 
-        table = await self._table(meta.table_name)
+        async for result in self._paginate(
+            "scan",
+            model,
+            scan_args,
+            projection=projection_expression,
+            trusted=self._is_trusted(trusted),
+        ):
+            yield result
 
-        while True:
-            page = await table.scan(**scan_args)
-            yield QueryResult(
-                items=[
-                    _to_model(item, model, _partial=projection_expression is not None) for item in page.get("Items", [])
-                ],
-                last_evaluated_key=page.get("LastEvaluatedKey"),
+    def prepare_query[T: DynamoModel](
+        self,
+        model: type[T],
+        *,
+        key_condition_expression: ConditionBase,
+        index_name: str | None = None,
+        limit: int | None = None,
+        filter_expression: ConditionBase | None = None,
+        return_consumed_capacity: bool = False,
+        consistent_read: bool = False,
+        scan_index_forward: bool = True,
+        projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
+    ) -> PreparedQuery[T]:
+        """Build a reusable ``query`` whose values are bound per execution.
+
+        Values that change between calls are written as ``Param("name")`` in
+        the expressions and passed to ``PreparedQuery.execute``/``items`` as
+        keyword arguments; all other values are fixed at preparation.
+
+        Example:
+            by_user = db.prepare_query(Order, key_condition_expression=Key("user_id").eq(Param("user_id")))
+            async for order in by_user.items(user_id="u1"):
+                ...
+
+        Args:
+            model: ``DynamoModel`` subclass mapped to the target table.
+            key_condition_expression: Key condition expression for the query.
+            index_name: Optional index name to query.
+            limit: Maximum number of items to evaluate per page.
+            filter_expression: Optional post-key filter expression.
+            return_consumed_capacity: Include consumed capacity information
+                (`"TOTAL"` in DynamoDB request).
+            consistent_read: Whether to use strongly consistent reads.
+            scan_index_forward: Sort ascending when ``True``, descending when
+                ``False``.
+            projection_expression: Optional list of ``ProjectionAttr(...)``
+                paths to project.
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
+
+        Returns:
+            A ``PreparedQuery`` bound to this client.
+        """
+        _check_chunked_read(model, index_name, filter_expression)
+        query_args: dict[str, Any] = {
+            "ScanIndexForward": scan_index_forward,
+            "ConsistentRead": consistent_read,
+        }
+        if index_name is not None:
+            query_args["IndexName"] = index_name
+        if limit is not None:
+            query_args["Limit"] = limit
+        if return_consumed_capacity:
+            query_args["ReturnConsumedCapacity"] = "TOTAL"
+        return PreparedQuery(
+            self,
+            "query",
+            model,
+            query_args,
+            key_condition_expression=key_condition_expression,
+            filter_expression=filter_expression,
+            projection_expression=projection_expression,
+            trusted=trusted,
+        )
+
+    def prepare_scan[T: DynamoModel](
+        self,
+        model: type[T],
+        *,
+        index_name: str | None = None,
+        limit: int | None = None,
+        filter_expression: ConditionBase | None = None,
+        consistent_read: bool = False,
+        return_consumed_capacity: bool = False,
+        projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
+    ) -> PreparedQuery[T]:
+        """Build a reusable ``scan`` whose filter values are bound per execution.
+
+        See ``prepare_query``; the arguments match those of ``scan``.
+
+        Returns:
+            A ``PreparedQuery`` bound to this client.
+        """
+        _check_chunked_read(model, index_name, filter_expression)
+        scan_args: dict[str, Any] = {"ConsistentRead": consistent_read}
+        if index_name is not None:
+            scan_args["IndexName"] = index_name
+        if limit is not None:
+            scan_args["Limit"] = limit
+        if return_consumed_capacity:
+            scan_args["ReturnConsumedCapacity"] = "TOTAL"
+        return PreparedQuery(
+            self,
+            "scan",
+            model,
+            scan_args,
+            filter_expression=filter_expression,
+            projection_expression=projection_expression,
+            trusted=trusted,
+        )
+
+    async def execute[T: DynamoModel](
+        self,
+        model: type[T],
+        statement: str,
+        parameters: Sequence[Any] | None = None,
+        *,
+        consistent_read: bool = False,
+        limit: int | None = None,
+        next_token: str | None = None,
+        trusted: bool | None = None,
+    ) -> StatementResult[T]:
+        """Run one PartiQL statement using DynamoDB ``execute_statement``.
+
+        Items returned by the statement (``SELECT`` results, or the item of a
+        write with a ``RETURNING`` clause) are decoded into ``model``.
+
+        Args:
+            model: ``DynamoModel`` subclass the statement's items belong to.
+            statement: PartiQL statement with ``?`` placeholders.
+            parameters: Values for the ``?`` placeholders, in order. They are
+                serialized like condition values (``datetime`` to ISO-8601,
+                ``float`` to ``N``, sets to ``SS``/``NS``/``BS``...).
+            consistent_read: Whether to use strongly consistent reads.
+            limit: Maximum number of items to evaluate.
+            next_token: Pagination token from a previous ``StatementResult``.
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
+
+        Returns:
+            A ``StatementResult`` page; its ``next_token`` is ``None`` on the
+            last page.
+        """
+        args: dict[str, Any] = {"Statement": statement, "ConsistentRead": consistent_read}
+        if parameters:
+            args["Parameters"] = [SERIALIZER._to_dynamo(value) for value in parameters]
+        if limit is not None:
+            args["Limit"] = limit
+        if next_token is not None:
+            args["NextToken"] = next_token
+
+        response = await self._request("execute_statement", (model.Meta.table_name,), **args)
+
+        items: list[Any] = response.get("Items", [])
+        if model.Meta.chunked:
+            items = await self._assemble_chunked_items(model, items, consistent_read=consistent_read)
+        return StatementResult(
+            items=_to_models(items, model, trusted=self._is_trusted(trusted)),
+            next_token=response.get("NextToken"),
+        )
+
+    async def batch_execute(
+        self,
+        statements: list[BatchStatement[DynamoModel]],
+        *,
+        trusted: bool | None = None,
+    ) -> list[BatchStatementResult[DynamoModel]]:
+        """Run PartiQL statements using DynamoDB ``batch_execute_statement``.
+
+        Statements are sent 25 per request (the DynamoDB limit), with all
+        requests in flight at once. Every request must contain only reads or
+        only writes.
+
+        Args:
+            statements: Ordered list of batch statements.
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
+
+        Returns:
+            One ``BatchStatementResult`` per statement, in order. Statements
+            that fail (e.g. a conditional write) carry DynamoDB's ``Error``
+            instead of raising.
+        """
+        groups = [
+            statements[start : start + _BATCH_STATEMENT_LIMIT]
+            for start in range(0, len(statements), _BATCH_STATEMENT_LIMIT)
+        ]
+        # each request only spends the retry budgets of the tables in its own group
+        responses = await asyncio.gather(
+            *(
+                self._request(
+                    "batch_execute_statement",
+                    {request.model.Meta.table_name for request in group},
+                    Statements=[_batch_statement_request(request) for request in group],
+                )
+                for group in groups
             )
-            if "LastEvaluatedKey" not in page:
-                break
-            scan_args["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+        )
+
+        is_trusted = self._is_trusted(trusted)
+        results: list[BatchStatementResult[DynamoModel]] = []
+        entries = (entry for response in responses for entry in response.get("Responses", []))
+        for request, entry in zip(statements, entries, strict=True):
+            model = request.model
+            error = cast(dict[str, Any] | None, entry.get("Error"))
+            raw: Any = entry.get("Item")
+            if raw is not None and model.Meta.chunked:
+                assembled = await self._assemble_chunked_items(model, [raw], consistent_read=request.consistent_read)
+                raw = assembled[0] if assembled else None
+            item = None if raw is None else _to_model(raw, model, trusted=is_trusted)
+            results.append(BatchStatementResult(item=item, error=error))
+        return results
 
     async def transact_get[T: DynamoModel](
-        self, requests: list[TransactGet[T]], *, return_consumed_capacity=False
+        self,
+        requests: list[TransactGet[T]],
+        *,
+        return_consumed_capacity=False,
+        trusted: bool | None = None,
     ) -> list[T | None]:
         """Read up to 100 items atomically across one or more tables.
 
@@ -538,6 +1123,8 @@ class DynamoDB:
             requests: Ordered list of transaction get requests.
             return_consumed_capacity: Include consumed capacity information
                 (`"TOTAL"` in DynamoDB request).
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
 
         Returns:
             Ordered list of validated model instances or ``None`` for missing
@@ -549,25 +1136,39 @@ class DynamoDB:
                 "TableName": request.model.Meta.table_name,
                 "Key": _build_dynamo_key(request.model, hash_key=request.hash_key, range_key=request.range_key),
             }
-            get_item.update(_projection_expression(request.model, request.projection_expression))
+            if not request.model.Meta.chunked:
+                # chunked items need their head attributes; projections are applied after reassembly
+                get_item.update(_projection_expression(request.model, request.projection_expression))
             transact_items.append({"Get": get_item})
 
         args: dict[str, Any] = {"TransactItems": transact_items}
         if return_consumed_capacity:
             args["ReturnConsumedCapacity"] = "TOTAL"
 
-        client: DynamoDBClient
-        async with self._client() as client:
-            response = await client.transact_get_items(**args)
+        table_names = {request.model.Meta.table_name for request in requests}
+        response = await self._request("transact_get_items", table_names, **args)
 
         items = response.get("Responses", [])
+        is_trusted = self._is_trusted(trusted)
         results: list[T | None] = []
         for request, item_response in zip(requests, items, strict=False):
             item = item_response.get("Item")
+            if item is not None and request.model.Meta.chunked:
+                # chunks are read after the transaction, with a consistent read
+                assembled = await self._assemble_chunked_items(request.model, [item], consistent_read=True)
+                item = assembled[0] if assembled else None
             if item is None:
                 results.append(None)
                 continue
-            results.append(_to_model(item, request.model, True))
+            results.append(
+                _to_model(
+                    item,
+                    request.model,
+                    partial=request.projection_expression is not None,
+                    trusted=is_trusted,
+                    projection=request.projection_expression,
+                )
+            )
         if len(results) < len(requests):
             results.extend([None] * (len(requests) - len(results)))
         return results
@@ -594,8 +1195,16 @@ class DynamoDB:
                         "Item": p.item.to_dynamo(),
                     }
                     dynamo_condition = _condition_expressions_for_client(p.model, condition_expression)
+                    _check_chunked_condition(p.model, dynamo_condition)
                     put_item.update(dynamo_condition)
-                    transact_items.append({"Put": put_item})
+                    chunked_items = (
+                        await self._chunked_put_items(
+                            p.model, put_item["Item"], _split_chunked(p.model, put_item["Item"]), dynamo_condition
+                        )
+                        if p.model.Meta.chunked
+                        else None
+                    )
+                    transact_items.extend(chunked_items or [{"Put": put_item}])
 
                 case TransactDelete(
                     model=model, hash_key=hash_key, range_key=range_key, condition_expression=condition_expression
@@ -605,9 +1214,14 @@ class DynamoDB:
                         "Key": _build_dynamo_key(model, hash_key=hash_key, range_key=range_key),
                     }
                     dynamo_condition = _condition_expressions_for_client(model, condition_expression)
+                    _check_chunked_condition(model, dynamo_condition)
                     delete_item.update(dynamo_condition)
-                    transact_items.append({"Delete": delete_item})
-                    continue
+                    chunked_items = (
+                        await self._chunked_delete_items(model, delete_item["Key"], dynamo_condition)
+                        if model.Meta.chunked
+                        else None
+                    )
+                    transact_items.extend(chunked_items or [{"Delete": delete_item}])
 
                 case TransactConditionCheck(
                     model=model, hash_key=hash_key, range_key=range_key, condition_expression=condition_expression
@@ -617,9 +1231,21 @@ class DynamoDB:
                         "Key": _build_dynamo_key(model, hash_key=hash_key, range_key=range_key),
                     }
                     dynamo_condition = _condition_expressions_for_client(model, condition_expression)
+                    _check_chunked_condition(model, dynamo_condition)
                     condition_item.update(dynamo_condition)
                     transact_items.append({"ConditionCheck": condition_item})
 
+                case TransactUpdate(
+                    hash_key=hash_key,
+                    range_key=range_key,
+                    update_expression=PreparedUpdate() as prepared,
+                    condition_expression=condition_expression,
+                    params=params,
+                ):
+                    if condition_expression is not None:
+                        raise ValueError("A prepared TransactUpdate takes its condition from prepare_update().")
+                    transact_items.append({"Update": prepared._request(hash_key, range_key, params or {})})
+
                 case TransactUpdate(
                     model=model,
                     hash_key=hash_key,
@@ -636,7 +1262,7 @@ class DynamoDB:
                     condition_builder = UpdateExpressionBuilder(model)
                     condition_payload = _condition_expressions(model, condition_expression, builder=condition_builder)
                     update_item.update(condition_payload)
-                    built = condition_builder.build_update_expression(update_expression)
+                    built = condition_builder.build_update_expression(cast(set[UpdateAttr], update_expression))
 
                     update_item["UpdateExpression"] = built.update_expression
                     update_item["ExpressionAttributeNames"] = _merge_expression_attribute_names(
@@ -661,15 +1287,15 @@ class DynamoDB:
         if return_item_collection_metrics:
             args["ReturnItemCollectionMetrics"] = "SIZE"
 
-        client: DynamoDBClient
-        async with self._client() as client:
-            return await client.transact_write_items(**args)
+        table_names = {next(iter(operation.values()))["TableName"] for operation in transact_items}
+        return await self._request("transact_write_items", table_names, **args)
 
     async def batch_get(
         self,
         requests: list[BatchGet[DynamoModel]],
         *,
         return_consumed_capacity=False,
+        trusted: bool | None = None,
     ) -> BatchGetResult:
         """Fetch up to 100 items using DynamoDB ``batch_get_item``.
 
@@ -680,9 +1306,11 @@ class DynamoDB:
             requests: Ordered list of batch get requests.
             return_consumed_capacity: Include consumed capacity information
                 (`"TOTAL"` in DynamoDB request).
+            trusted: Build items with ``model_construct`` instead of validating
+                them. Defaults to the client's ``trusted_reads``.
         """
         table_to_model: dict[str, type[DynamoModel]] = {}
-        tables_with_projection: set[str] = set()
+        table_projections: dict[str, ProjectionExpressionArg] = {}
         request_items: dict[str, dict[str, Any]] = {}
         for request in requests:
             table_name = request.model.Meta.table_name
@@ -698,7 +1326,10 @@ class DynamoDB:
                     raise ValueError(f"Conflicting consistent_read values for table '{table_name}'.")
                 table_entry["ConsistentRead"] = True
             if request.projection_expression is not None:
-                tables_with_projection.add(table_name)
+                table_projections[table_name] = request.projection_expression
+                if request.model.Meta.chunked:
+                    # chunked items need their head attributes; projections are applied after reassembly
+                    continue
                 projection_payload = _projection_expression(
                     request.model,
                     request.projection_expression,
@@ -719,20 +1350,37 @@ class DynamoDB:
         if return_consumed_capacity:
             args["ReturnConsumedCapacity"] = "TOTAL"
 
-        client: DynamoDBClient
-        async with self._client() as client:
-            response = await client.batch_get_item(**args)
+        response = await self._request("batch_get_item", request_items.keys(), **args)
+        responses: dict[str, list[Any]] = {name: list(items) for name, items in response.get("Responses", {}).items()}
+        unprocessed = response.get("UnprocessedKeys", {})
+        attempt = 1
+        while unprocessed and self._may_retry(attempt, unprocessed.keys()):
+            await asyncio.sleep(self.retry.delay(attempt))  # type: ignore[union-attr]
+            attempt += 1
+            response = await self._request(
+                "batch_get_item", unprocessed.keys(), **{**args, "RequestItems": unprocessed}
+            )
+            for table_name, items in response.get("Responses", {}).items():
+                responses.setdefault(table_name, []).extend(items)
+            unprocessed = response.get("UnprocessedKeys", {})
 
+        is_trusted = self._is_trusted(trusted)
         parsed_items: dict[type[DynamoModel], list[DynamoModel]] = {}
-        for table_name, items in response.get("Responses", {}).items():
+        for table_name, items in responses.items():
             model = table_to_model.get(table_name)
             if model is None:
                 continue
-            is_partial = table_name in tables_with_projection
-            parsed_items[model] = [_to_model(item, model, True, _partial=is_partial) for item in items]
+            if model.Meta.chunked:
+                items = await self._assemble_chunked_items(
+                    model, items, consistent_read=bool(request_items[table_name].get("ConsistentRead"))
+                )
+            projection = table_projections.get(table_name)
+            parsed_items[model] = _to_models(
+                items, model, partial=projection is not None, projection=projection, trusted=is_trusted
+            )
         return BatchGetResult(
             items=parsed_items,
-            unprocessed_keys=response.get("UnprocessedKeys", {}),
+            unprocessed_keys=unprocessed,
         )
 
     async def batch_write(
@@ -742,33 +1390,61 @@ class DynamoDB:
         return_consumed_capacity=False,
         return_item_collection_metrics=False,
     ) -> BatchWriteResult:
-        """Write up to 25 items per request using DynamoDB ``batch_write_item``."""
+        """Write up to 25 items per request using DynamoDB ``batch_write_item``.
 
-        request_items: dict[str, list[dict[str, Any]]] = {}
+        On chunked tables, oversized items, and items whose stored version
+        has chunks, are written with their chunks in one
+        ``transact_write_items`` call each, sent alongside the batch.
+        """
+
+        entries: list[tuple[type[DynamoModel], dict[str, Any]]] = []
         for operation in operations:
             match operation:
                 case BatchPut(item=item) as p:
-                    request_items.setdefault(p.model.Meta.table_name, []).append({
-                        "PutRequest": {"Item": item.to_dynamo()}
-                    })
+                    entries.append((p.model, {"PutRequest": {"Item": item.to_dynamo()}}))
                 case BatchDelete(model=model, hash_key=hash_key, range_key=range_key):
-                    request_items.setdefault(model.Meta.table_name, []).append({
-                        "DeleteRequest": {"Key": _build_dynamo_key(model, hash_key=hash_key, range_key=range_key)}
-                    })
+                    entries.append((
+                        model,
+                        {"DeleteRequest": {"Key": _build_dynamo_key(model, hash_key=hash_key, range_key=range_key)}},
+                    ))
                 case _ as impossible:
                     assert_never(impossible)
 
+        chunked = [index for index, (model, _) in enumerate(entries) if model.Meta.chunked]
+        chunked_writes = await asyncio.gather(*(self._chunked_batch_entry(*entries[index]) for index in chunked))
+        transactions = {index: items for index, items in zip(chunked, chunked_writes, strict=True) if items is not None}
+        request_items: dict[str, list[dict[str, Any]]] = {}
+        for index, (model, entry) in enumerate(entries):
+            if index not in transactions:
+                request_items.setdefault(model.Meta.table_name, []).append(entry)
+        if transactions:
+            await asyncio.gather(
+                *(
+                    self._request("transact_write_items", (entries[index][0].Meta.table_name,), TransactItems=items)
+                    for index, items in transactions.items()
+                )
+            )
+            if not request_items:
+                return BatchWriteResult(unprocessed_items={})
+
         args: dict[str, Any] = {"RequestItems": request_items}
         if return_consumed_capacity:
             args["ReturnConsumedCapacity"] = "TOTAL"
         if return_item_collection_metrics:
             args["ReturnItemCollectionMetrics"] = "SIZE"
 
-        client: DynamoDBClient
-        async with self._client() as client:
-            response = await client.batch_write_item(**args)
+        response = await self._request("batch_write_item", request_items.keys(), **args)
+        unprocessed = response.get("UnprocessedItems", {})
+        attempt = 1
+        while unprocessed and self._may_retry(attempt, unprocessed.keys()):
+            await asyncio.sleep(self.retry.delay(attempt))  # type: ignore[union-attr]
+            attempt += 1
+            response = await self._request(
+                "batch_write_item", unprocessed.keys(), **{**args, "RequestItems": unprocessed}
+            )
+            unprocessed = response.get("UnprocessedItems", {})
 
-        return BatchWriteResult(unprocessed_items=response.get("UnprocessedItems", {}))
+        return BatchWriteResult(unprocessed_items=unprocessed)
 
     async def create_table[T: DynamoModel](
         self,
@@ -884,13 +1560,368 @@ class DynamoDB:
         async with self._client() as client:
             return await client.delete_table(TableName=meta.table_name)
 
-    @asynccontextmanager
-    async def _resource(self) -> AsyncIterator[DynamoDBServiceResource]:
-        yield await self._ensure_resource()
+    async def _request(self, operation: str, table_names: Collection[str], **args: Any) -> Any:
+        """Send one data-plane request on a pooled client, retrying it according to ``retry``.
+
+        ``table_names`` are the tables the request touches; their retry
+        budgets record the outcome and must all allow a retry, and their
+        capacity limits pace every attempt.
+        """
+        client: DynamoDBClient
+        if self.retry is None and self._capacity_limiter is None:
+            async with self._client() as client:
+                return await getattr(client, operation)(**args)
+        if self.retry is None:
+            return await self._send(operation, table_names, args)
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(operation, table_names, args)
+            except (ClientError, *_TRANSIENT_ERRORS) as error:
+                retryable = _is_retryable(error)
+                for table_name in table_names:
+                    self._retry_budget(table_name).record(failed=retryable)
+                if not retryable or not self._may_retry(attempt, table_names):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+            else:
+                for table_name in table_names:
+                    self._retry_budget(table_name).record(failed=False)
+                return response
+
+    async def _send(self, operation: str, table_names: Collection[str], args: dict[str, Any]) -> Any:
+        """Send one attempt of a request, paced by the capacity limiter when one is configured."""
+        client: DynamoDBClient
+        limiter = self._capacity_limiter
+        if limiter is None:
+            async with self._client() as client:
+                return await getattr(client, operation)(**args)
+        reservation = await limiter.acquire(operation, table_names, args)
+        try:
+            async with self._client() as client:
+                response = await getattr(client, operation)(**args)
+        except BaseException:
+            limiter.settle(reservation, None)
+            raise
+        limiter.settle(reservation, response.get("ConsumedCapacity"))
+        return response
+
+    def _retry_budget(self, table_name: str) -> _RetryBudget:
+        budget = self._retry_budgets.get(table_name)
+        if budget is None:
+            assert self.retry is not None
+            budget = self._retry_budgets.setdefault(table_name, _RetryBudget(self.retry))
+        return budget
+
+    def _may_retry(self, attempt: int, table_names: Collection[str]) -> bool:
+        """Whether a request that failed ``attempt`` times may be sent again."""
+        return (
+            self.retry is not None
+            and attempt < self.retry.max_attempts
+            and all(self._retry_budget(table_name).allows_retry() for table_name in table_names)
+        )
+
+    def _is_trusted(self, trusted: bool | None) -> bool:
+        return self.trusted_reads if trusted is None else trusted
+
+    async def _paginate[T: DynamoModel](
+        self,
+        operation: Literal["query", "scan"],
+        model: type[T],
+        request_args: dict[str, Any],
+        *,
+        projection: ProjectionExpressionArg | None,
+        trusted: bool,
+        serialized_values: bool = False,
+    ) -> AsyncIterator[QueryResult[T]]:
+        """Follow ``LastEvaluatedKey`` for ``query``/``scan`` on the low-level client.
+
+        ``request_args`` carry python values; expression values and pagination
+        keys are converted to and from AttributeValues here so callers keep
+        passing and receiving plain python keys. ``serialized_values`` marks
+        expression values that are already AttributeValues.
+        """
+        client_args = dict(request_args)
+        client_args["TableName"] = model.Meta.table_name
+        if "ExpressionAttributeValues" in client_args and not serialized_values:
+            client_args["ExpressionAttributeValues"] = _to_dynamo_expression_values(
+                client_args["ExpressionAttributeValues"]
+            )
+        if "ExclusiveStartKey" in client_args:
+            client_args["ExclusiveStartKey"] = _to_dynamo_expression_values(client_args["ExclusiveStartKey"])
+
+        while True:
+            page = await self._request(operation, (model.Meta.table_name,), **client_args)
+            last_key = page.get("LastEvaluatedKey")
+            items: list[Any] = page.get("Items", [])
+            if model.Meta.chunked:
+                items = await self._assemble_chunked_items(
+                    model, items, consistent_read=bool(request_args.get("ConsistentRead"))
+                )
+            yield QueryResult(
+                items=_to_models(
+                    items,
+                    model,
+                    partial=projection is not None,
+                    projection=projection,
+                    trusted=trusted,
+                ),
+                last_evaluated_key=(
+                    None
+                    if last_key is None
+                    else {k: DESERIALIZER._to_dynamo(cast(dict[str, Any], v)) for k, v in last_key.items()}
+                ),
+            )
+            if last_key is None:
+                break
+            client_args["ExclusiveStartKey"] = last_key
+
+    async def _query_chunk_group(
+        self,
+        model: type[DynamoModel],
+        key: dict[str, Any],
+        *,
+        consistent_read: bool = False,
+        keys_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Query a chunked model's item together with its chunk items, in sort key order."""
+        meta = model.Meta
+        assert meta.range_key is not None
+        low, high = _chunk_key_bounds(key[meta.range_key]["S"])
+        client_args: dict[str, Any] = {
+            "TableName": meta.table_name,
+            "KeyConditionExpression": "#h = :h AND #r BETWEEN :low AND :high",
+            "ExpressionAttributeNames": {"#h": meta.hash_key, "#r": meta.range_key},
+            "ExpressionAttributeValues": {":h": key[meta.hash_key], ":low": {"S": low}, ":high": {"S": high}},
+            "ConsistentRead": consistent_read,
+        }
+        if keys_only:
+            client_args["ProjectionExpression"] = "#h, #r"
+        items: list[dict[str, Any]] = []
+        while True:
+            page = await self._request("query", (meta.table_name,), **client_args)
+            items.extend(page.get("Items", []))
+            last_key = page.get("LastEvaluatedKey")
+            if last_key is None:
+                return items
+            client_args["ExclusiveStartKey"] = last_key
+
+    async def _stored_chunk_keys(self, model: type[DynamoModel], key: dict[str, Any]) -> list[dict[str, Any]]:
+        """Keys of the chunk items currently stored for the item at ``key`` (without the head)."""
+        range_key = model.Meta.range_key
+        assert range_key is not None
+        return [
+            item
+            for item in await self._query_chunk_group(model, key, consistent_read=True, keys_only=True)
+            if item[range_key] != key[range_key]
+        ]
+
+    async def _put_chunked(
+        self, model: type[DynamoModel], dynamo_item: dict[str, Any], args: Mapping[str, Any]
+    ) -> None:
+        """Write an item of a chunked model, looking up stored chunks only when they may need deleting.
+
+        An item that fits is sent as a ``put_item`` conditioned on the stored
+        item not being chunked. Only when that condition fails, or the item
+        itself is oversized, are the stored chunk keys queried and the item
+        written in a transaction.
+        """
+        _check_chunked_condition(model, args)
+        table_name = model.Meta.table_name
+        split = _split_chunked(model, dynamo_item)
+        if split is not None:
+            transact_items = await self._chunked_put_items(model, dynamo_item, split, args)
+        else:
+            try:
+                await self._request(
+                    "put_item", (table_name,), TableName=table_name, Item=dynamo_item, **_unless_chunked(args)
+                )
+                return
+            except ClientError as error:
+                if error.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
+                # the stored item is chunked, or the caller's own condition failed
+                transact_items = await self._chunked_put_items(model, dynamo_item, None, args)
+                if transact_items is None:
+                    raise
+        assert transact_items is not None
+        await self._request("transact_write_items", (table_name,), TransactItems=transact_items)
+
+    async def _delete_chunked(self, model: type[DynamoModel], key: dict[str, Any], args: Mapping[str, Any]) -> None:
+        """Delete an item of a chunked model, looking up its chunks only when the item is chunked."""
+        _check_chunked_condition(model, args)
+        table_name = model.Meta.table_name
+        try:
+            await self._request("delete_item", (table_name,), TableName=table_name, Key=key, **_unless_chunked(args))
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            transact_items = await self._chunked_delete_items(model, key, args)
+            if transact_items is None:
+                raise
+            await self._request("transact_write_items", (table_name,), TransactItems=transact_items)
+
+    async def _chunked_put_items(
+        self,
+        model: type[DynamoModel],
+        dynamo_item: dict[str, Any],
+        split: list[dict[str, Any]] | None,
+        args: Mapping[str, Any],
+    ) -> list[dict[str, Any]] | None:
+        """Transaction writing an item of a chunked model, or ``None`` when a plain ``put_item`` does.
+
+        Oversized items (``split`` by ``_split_chunked``) are written as their
+        head (carrying ``args``) and chunks. Chunks left by a larger stored
+        version that the new version does not overwrite are deleted in the
+        same transaction. The chunk keys are read beforehand, so a concurrent
+        write of the same key in between can leave stale chunks behind; reads
+        ignore them, as every head records its chunk count.
+        """
+        meta = model.Meta
+        assert meta.range_key is not None
+        key = {meta.hash_key: dynamo_item[meta.hash_key], meta.range_key: dynamo_item[meta.range_key]}
+        written = split or [dynamo_item]
+        written_keys = {item[meta.range_key]["S"] for item in written}
+        stale = [
+            chunk_key
+            for chunk_key in await self._stored_chunk_keys(model, key)
+            if chunk_key[meta.range_key]["S"] not in written_keys
+        ]
+        if split is None and not stale:
+            return None
+        head, *chunks = written
+        transact_items: list[dict[str, Any]] = [{"Put": {"TableName": meta.table_name, "Item": head, **args}}]
+        transact_items.extend({"Put": {"TableName": meta.table_name, "Item": chunk}} for chunk in chunks)
+        transact_items.extend({"Delete": {"TableName": meta.table_name, "Key": chunk_key}} for chunk_key in stale)
+        return transact_items
+
+    async def _chunked_delete_items(
+        self, model: type[DynamoModel], key: dict[str, Any], args: Mapping[str, Any]
+    ) -> list[dict[str, Any]] | None:
+        """Transaction deleting an item of a chunked model and its chunks, or ``None`` when it has none."""
+        chunk_keys = await self._stored_chunk_keys(model, key)
+        if not chunk_keys:
+            return None
+        table_name = model.Meta.table_name
+        transact_items: list[dict[str, Any]] = [{"Delete": {"TableName": table_name, "Key": key, **args}}]
+        transact_items.extend({"Delete": {"TableName": table_name, "Key": chunk_key}} for chunk_key in chunk_keys)
+        return transact_items
+
+    async def _chunked_batch_entry(
+        self, model: type[DynamoModel], entry: dict[str, Any]
+    ) -> list[dict[str, Any]] | None:
+        """Transaction replacing a ``batch_write_item`` entry of a chunked model, if the entry is not enough."""
+        if "PutRequest" in entry:
+            item = entry["PutRequest"]["Item"]
+            return await self._chunked_put_items(model, item, _split_chunked(model, item), {})
+        return await self._chunked_delete_items(model, entry["DeleteRequest"]["Key"], {})
+
+    async def _assemble_chunked_items(
+        self,
+        model: type[DynamoModel],
+        items: list[dict[str, Any]],
+        *,
+        consistent_read: bool,
+    ) -> list[dict[str, Any]]:
+        """Drop chunk items from a query/scan page and reassemble oversized items.
+
+        Chunks are stored right after their head, so a page usually holds all
+        of them; only heads whose chunks are cut off by the page boundary are
+        read again with ``_query_chunk_group``.
+        """
+        meta = model.Meta
+        hash_key, range_key = meta.hash_key, meta.range_key
+        assert range_key is not None
+        chunks_by_id = {_chunk_id(item, hash_key, range_key): item for item in items if _is_chunk(item)}
+        assembled: list[dict[str, Any]] = []
+        for item in items:
+            if _is_chunk(item):
+                continue
+            if _is_chunked_head(item):
+                chunks = _chunks_in_page(item, chunks_by_id, hash_key=hash_key, range_key=range_key)
+                if chunks is not None:
+                    item = _assemble_item(item, chunks)
+                else:
+                    key = {hash_key: item[hash_key], range_key: item[range_key]}
+                    group = await self._query_chunk_group(model, key, consistent_read=consistent_read)
+                    full = _assemble_chunk_group(model, group)
+                    if full is None:
+                        continue
+                    item = full
+            assembled.append(item)
+        return assembled
 
     @asynccontextmanager
-    async def _client(self) -> AsyncIterator[DynamoDBClient]:
-        yield await self._ensure_client()
+    async def _client(self) -> AsyncGenerator[DynamoDBClient]:
+        """Lend a pooled client for one request, counting it as in flight meanwhile."""
+        pool = self._pool or await self._ensure_pool()
+        index = pool.acquire()
+        try:
+            yield pool.clients[index]
+        finally:
+            pool.release(index)
+
+
+def _assemble_chunk_group(model: type[DynamoModel], items: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Rebuild the raw item from the result of ``_query_chunk_group``."""
+    if not items or _is_chunk(items[0]):
+        return None
+    head, *chunks = items
+    if not _is_chunked_head(head):
+        return head
+    return _assemble_item(head, chunks)
+
+
+def _check_chunked_read(
+    model: type[DynamoModel], index_name: str | None, filter_expression: ConditionBase | None
+) -> None:
+    """Reject indexes and filters on chunked models, which would silently miss oversized items.
+
+    The head item of an oversized item holds only its key and chunk count,
+    so DynamoDB cannot match it against a filter or project it into an index.
+    """
+    if not model.Meta.chunked:
+        return
+    if index_name is not None:
+        raise ValueError(
+            f"Cannot read index '{index_name}' of chunked model {model.__name__}: oversized items are not in it."
+        )
+    if filter_expression is not None:
+        raise ValueError(
+            f"Cannot filter chunked model {model.__name__}: oversized items keep their attributes in chunks."
+        )
+
+
+def _check_chunked_condition(model: type[DynamoModel], condition: Mapping[str, Any]) -> None:
+    """Reject conditions on data attributes of chunked models; the head of an oversized item lacks them."""
+    meta = model.Meta
+    if not meta.chunked:
+        return
+    names = set(condition.get("ExpressionAttributeNames", {}).values()) - {meta.hash_key, meta.range_key}
+    if names:
+        raise ValueError(
+            f"Cannot condition chunked model {model.__name__} on {sorted(names)}: "
+            "oversized items keep their attributes in chunks."
+        )
+
+
+def _split_chunked(model: type[DynamoModel], dynamo_item: dict[str, Any]) -> list[dict[str, Any]] | None:
+    meta = model.Meta
+    assert meta.range_key is not None
+    return _split_item(dynamo_item, hash_key=meta.hash_key, range_key=meta.range_key)
+
+
+def _unless_chunked(args: Mapping[str, Any]) -> dict[str, Any]:
+    """``args`` with their condition extended to require that the stored item is not a chunked head."""
+    # "#chunks" never collides with the builder's "#n" placeholders
+    guard = "attribute_not_exists(#chunks)"
+    condition = args.get("ConditionExpression")
+    return {
+        **args,
+        "ConditionExpression": guard if condition is None else f"({condition}) AND {guard}",
+        "ExpressionAttributeNames": {**args.get("ExpressionAttributeNames", {}), "#chunks": _CHUNK_COUNT_ATTR},
+    }
 
 
 def _build_key(model: type[DynamoModel], *, hash_key: KeyT, range_key: KeyT | None = None) -> dict[str, Any]:
@@ -906,9 +1937,15 @@ def _build_dynamo_key(model: type[DynamoModel], *, hash_key: KeyT, range_key: Ke
     return {k: SERIALIZER._to_dynamo(v) for k, v in key.items()}
 
 
+def _batch_statement_request(request: BatchStatement[DynamoModel]) -> dict[str, Any]:
+    entry: dict[str, Any] = {"Statement": request.statement, "ConsistentRead": request.consistent_read}
+    if request.parameters:
+        entry["Parameters"] = [SERIALIZER._to_dynamo(value) for value in request.parameters]
+    return entry
+
+
 def _to_dynamo_expression_values(values: dict[str, Any]) -> dict[str, Any]:
-    serialized = _to_dynamo_compatible(values)
-    return {k: SERIALIZER._to_dynamo(v) for k, v in serialized.items()}
+    return {k: SERIALIZER._to_dynamo(v) for k, v in values.items()}
 
 
 def _condition_expressions_for_client(
@@ -1,4 +1,5 @@
 import typing
+from dataclasses import dataclass
 from typing import Any, get_args, get_origin
 
 from boto3.dynamodb.conditions import ATTR_NAME_REGEX, AttributeBase, ConditionExpressionBuilder
@@ -7,12 +8,91 @@ from pydantic import BaseModel
 from aiodynamodb._serializers import _serialize_custom_attribute
 
 
+@dataclass(frozen=True)
+class Param:
+    """Named bind parameter standing in for a single condition value.
+
+    Used in the expressions of ``DynamoDB.prepare_query``/``prepare_scan``;
+    the actual value is supplied per call, e.g. ``Key("user_id").eq(Param("user_id"))``
+    executed with ``prepared.execute(user_id="u1")``.
+    """
+
+    name: str
+
+
+# An attribute path split into the names needing placeholders and the literal
+# text around them: ``literals[0] + name[0] + literals[1] + ... + literals[-1]``.
+type _AttributePath = tuple[tuple[str, ...], tuple[str, ...]]
+
+# Upper bound on cached attribute paths; paths beyond it are split on every build.
+_PATH_CACHE_SIZE = 4096
+_attribute_paths: dict[tuple[type[BaseModel], str], _AttributePath] = {}
+
+
+def _split_attribute_path(path: str) -> _AttributePath:
+    """Split a document path into attribute names and the literal text between them.
+
+    Names are the runs outside ``[...]`` delimited by ``.``, ``[`` and ``]``,
+    exactly what boto3's ``ATTR_NAME_REGEX`` matches; malformed brackets are
+    left to that regex so the result never differs from boto3's.
+    """
+    literals: list[str] = []
+    names: list[str] = []
+    literal_start = 0
+    name_start = -1
+    in_index = False
+    for position, char in enumerate(path):
+        if char == "[":
+            if in_index:
+                break
+            in_index = True
+        elif char == "]":
+            if not in_index:
+                break
+            in_index = False
+            continue
+        elif char == "." or in_index:
+            pass
+        else:
+            if name_start < 0:
+                name_start = position
+            continue
+        if name_start >= 0:
+            literals.append(path[literal_start:name_start])
+            names.append(path[name_start:position])
+            literal_start = position
+            name_start = -1
+    else:
+        if not in_index:
+            if name_start >= 0:
+                literals.append(path[literal_start:name_start])
+                names.append(path[name_start:])
+                literal_start = len(path)
+            literals.append(path[literal_start:])
+            return tuple(literals), tuple(names)
+    return tuple(ATTR_NAME_REGEX.split(path)), tuple(ATTR_NAME_REGEX.findall(path))
+
+
 class CustomConditionExpressionBuilder[T: BaseModel](ConditionExpressionBuilder):
-    """Build condition expressions and serialize placeholders for model keys."""
+    """Build condition expressions and serialize placeholders for model keys.
+
+    Attribute paths are normalized against the model and split into names
+    once per ``(model, path)``; each distinct attribute name gets a single
+    ``#nX`` placeholder for the lifetime of the builder, so expressions built
+    with a shared builder can merge their name maps.
+    """
 
     def __init__(self, model: type[T]):
         super().__init__()
         self._model = model
+        # attribute each value placeholder was serialized against
+        self._value_attribute_names: dict[str, str | None] = {}
+        self._name_placeholders: dict[str, str] = {}
+
+    def reset(self) -> None:
+        super().reset()
+        self._name_placeholders.clear()
+        self._value_attribute_names.clear()
 
     def _build_expression_component(
         self,
@@ -33,13 +113,9 @@ class CustomConditionExpressionBuilder[T: BaseModel](ConditionExpressionBuilder)
         )
 
     def _serialize_value(self, value: Any) -> Any:
-        attribute_name = getattr(self, "_current_attribute_name", None)
-        if not attribute_name:
-            return value
-        try:
-            return _serialize_custom_attribute(self._model, attribute_name, value)
-        except (KeyError, TypeError, ValueError):
+        if isinstance(value, Param):
             return value
+        return _serialize_condition_value(self._model, getattr(self, "_current_attribute_name", None), value)
 
     def _build_value_placeholder(
         self,
@@ -54,24 +130,35 @@ class CustomConditionExpressionBuilder[T: BaseModel](ConditionExpressionBuilder)
                 self._value_count += 1  # type: ignore[attr-defined]
                 placeholder_list.append(value_placeholder)
                 attribute_value_placeholders[value_placeholder] = self._serialize_value(v)
+                self._value_attribute_names[value_placeholder] = getattr(self, "_current_attribute_name", None)
             return "(" + ", ".join(placeholder_list) + ")"
         value_placeholder = self._get_value_placeholder()  # type: ignore[attr-defined]
         self._value_count += 1  # type: ignore[attr-defined]
         attribute_value_placeholders[value_placeholder] = self._serialize_value(value)
+        self._value_attribute_names[value_placeholder] = getattr(self, "_current_attribute_name", None)
         return value_placeholder
 
     def _build_name_placeholder(self, value, attribute_name_placeholders):
-        attribute_name = self._normalize_attribute_name(value.name)
-        attribute_name_parts = ATTR_NAME_REGEX.findall(attribute_name)
-
-        placeholder_format = ATTR_NAME_REGEX.sub("%s", attribute_name)
-        str_format_args = []
-        for part in attribute_name_parts:
-            name_placeholder = self._get_name_placeholder()  # type: ignore[attr-defined]
-            self._name_count += 1  # type: ignore[attr-defined]
-            str_format_args.append(name_placeholder)
-            attribute_name_placeholders[name_placeholder] = part
-        return placeholder_format % tuple(str_format_args)
+        literals, names = self._attribute_path(value.name)
+        pieces = [literals[0]]
+        for name, literal in zip(names, literals[1:], strict=True):
+            name_placeholder = self._name_placeholders.get(name)
+            if name_placeholder is None:
+                name_placeholder = self._name_placeholders[name] = self._get_name_placeholder()  # type: ignore[attr-defined]
+                self._name_count += 1  # type: ignore[attr-defined]
+            attribute_name_placeholders[name_placeholder] = name
+            pieces.append(name_placeholder)
+            pieces.append(literal)
+        return "".join(pieces)
+
+    def _attribute_path(self, attribute_name: str) -> _AttributePath:
+        key = (self._model, attribute_name)
+        path = _attribute_paths.get(key)
+        if path is None:
+            path = _split_attribute_path(self._normalize_attribute_name(attribute_name))
+            if len(_attribute_paths) < _PATH_CACHE_SIZE:
+                _attribute_paths[key] = path
+        return path
 
     def _normalize_attribute_name(self, attribute_name: str) -> str:
         parts = attribute_name.split(".")
@@ -155,3 +242,13 @@ class CustomConditionExpressionBuilder[T: BaseModel](ConditionExpressionBuilder)
         if len(non_none) == 1 and len(non_none) != len(args):
             return self._unwrap_optional_annotation(non_none[0])
         return annotation
+
+
+def _serialize_condition_value(model: type[BaseModel], attribute_name: str | None, value: Any) -> Any:
+    """Serialize a placeholder value with the field type of the attribute it is compared to."""
+    if not attribute_name:
+        return value
+    try:
+        return _serialize_custom_attribute(model, attribute_name, value)
+    except (KeyError, TypeError, ValueError):
+        return value
@@ -1,9 +1,12 @@
 import json
+import zlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from pydantic import BaseModel, BeforeValidator, PlainSerializer
+from pydantic import BaseModel, BeforeValidator, GetCoreSchemaHandler, PlainSerializer
+from pydantic_core import core_schema, to_json
 
 type Timestamp = Annotated[datetime, PlainSerializer(lambda d: int(d.timestamp()))]
 type TimestampMillis = Annotated[datetime, PlainSerializer(lambda d: int(d.timestamp() * 1_000))]
@@ -17,6 +20,106 @@ type JSONStr[T: BaseModel] = Annotated[
     BeforeValidator(lambda v: json.loads(v) if isinstance(v, str) else v),
 ]
 
+# Compressed values start with this marker followed by one algorithm byte.
+# JSON payloads never start with a NUL byte, so stored values are unambiguous.
+_COMPRESSED_MARKER = b"\x00adc"
+_STORED, _ZLIB, _ZSTD = 0, 1, 2
+
+
+def _zstd() -> Any:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compression requires the 'zstd' extra: pip install aiodynamodb[zstd]") from e
+    return zstandard
+
+
+def _zstd_compress(data: bytes, level: int | None) -> bytes:
+    zstd = _zstd()
+    if hasattr(zstd, "ZstdCompressor"):
+        return zstd.ZstdCompressor(level=3 if level is None else level).compress(data)
+    return zstd.compress(data, level)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    zstd = _zstd()
+    if hasattr(zstd, "ZstdDecompressor"):
+        return zstd.ZstdDecompressor().decompress(data)
+    return zstd.decompress(data)
+
+
+@dataclass(frozen=True)
+class Compression:
+    """Annotation metadata that stores a value compressed in a Binary (B) attribute.
+
+    Use through ``Compressed[T]`` (zlib, 1 KiB threshold) or directly, e.g.
+    ``Annotated[Config, Compression("zstd", threshold=4096)]``.
+
+    Args:
+        algorithm: ``"zlib"`` (standard library) or ``"zstd"`` (``compression.zstd``
+            on Python 3.14+, otherwise the ``zstd`` extra).
+        threshold: Payloads smaller than this many bytes are stored uncompressed.
+        level: Compression level; the algorithm's default when ``None``.
+    """
+
+    algorithm: Literal["zlib", "zstd"] = "zlib"
+    threshold: int = 1024
+    level: int | None = None
+
+    def compress(self, payload: bytes) -> bytes:
+        if len(payload) < self.threshold:
+            if payload.startswith(_COMPRESSED_MARKER):
+                return _COMPRESSED_MARKER + bytes([_STORED]) + payload
+            return payload
+        if self.algorithm == "zstd":
+            return _COMPRESSED_MARKER + bytes([_ZSTD]) + _zstd_compress(payload, self.level)
+        level = -1 if self.level is None else self.level
+        return _COMPRESSED_MARKER + bytes([_ZLIB]) + zlib.compress(payload, level)
+
+    @staticmethod
+    def decompress(stored: bytes) -> bytes:
+        if not stored.startswith(_COMPRESSED_MARKER):
+            return stored
+        algorithm = stored[len(_COMPRESSED_MARKER)]
+        data = stored[len(_COMPRESSED_MARKER) + 1 :]
+        if algorithm == _ZLIB:
+            return zlib.decompress(data)
+        if algorithm == _ZSTD:
+            return _zstd_decompress(data)
+        if algorithm == _STORED:
+            return data
+        raise ValueError(f"Unknown compression algorithm byte {algorithm}")
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        is_blob = source is bytes
+        to_payload: Callable[[Any], bytes] = bytes if is_blob else to_json
+        from_payload: Callable[[bytes], Any] = (lambda payload: payload) if is_blob else json.loads
+
+        def validate(value: Any) -> Any:
+            if isinstance(value, bytes | bytearray) and (not is_blob or value.startswith(_COMPRESSED_MARKER)):
+                return from_payload(self.decompress(bytes(value)))
+            return value
+
+        def serialize(value: Any, info: core_schema.SerializationInfo) -> Any:
+            if info.mode != "python":
+                return value
+            return self.compress(to_payload(value))
+
+        return core_schema.no_info_before_validator_function(
+            validate,
+            handler(source),
+            serialization=core_schema.plain_serializer_function_ser_schema(serialize, info_arg=True),
+        )
+
+
+type Compressed[T] = Annotated[T, Compression()]
+
 type KeyT = int | str | Timestamp | TimestampMillis | TimestampMicros | TimestampNanos | datetime
 
 type ReturnValues = Literal["NONE", "ALL_OLD", "UPDATED_OLD", "ALL_NEW", "UPDATED_NEW"]
@@ -71,6 +174,8 @@ __all__ = (
     "TimestampMicros",
     "TimestampNanos",
     "JSONStr",
+    "Compressed",
+    "Compression",
     "KeyT",
     "ReturnValues",
     "HashKey",
@@ -1,26 +1,50 @@
+import warnings
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Self, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
 
 from boto3.dynamodb.conditions import ConditionBase
 from pydantic import BaseModel
-from types_aiobotocore_dynamodb.literals import ProjectionTypeType
-from types_aiobotocore_dynamodb.type_defs import (
-    GlobalSecondaryIndexUnionTypeDef,
-    KeySchemaElementTypeDef,
-    LocalSecondaryIndexTypeDef,
-    OnDemandThroughputTypeDef,
-    ProvisionedThroughputTypeDef,
-    WarmThroughputTypeDef,
-    WriteRequestOutputTypeDef,
-)
 
-from aiodynamodb._serializers import DESERIALIZER, SERIALIZER, _model_has_float_fields, _to_dynamo_compatible
+from aiodynamodb._serializers import (
+    SERIALIZER,
+    _decode_item,
+    _model_decoder,
+    _model_encoder,
+    _model_has_float_fields,
+    _resolve_key_annotation,
+    _to_dynamo_compatible,
+)
 from aiodynamodb.custom_types import KeyT, _KeyMarker
 from aiodynamodb.projection import ProjectionExpressionArg
 from aiodynamodb.updates import UpdateAttr
 
+if TYPE_CHECKING:
+    # the stub package imports aiobotocore at runtime; keep it out of ``import aiodynamodb``
+    from types_aiobotocore_dynamodb.literals import ProjectionTypeType
+    from types_aiobotocore_dynamodb.type_defs import (
+        GlobalSecondaryIndexUnionTypeDef,
+        KeySchemaElementTypeDef,
+        LocalSecondaryIndexTypeDef,
+        OnDemandThroughputTypeDef,
+        ProvisionedThroughputTypeDef,
+        WarmThroughputTypeDef,
+        WriteRequestOutputTypeDef,
+    )
+
+    from aiodynamodb.prepared import PreparedUpdate
+
 type Raw = dict[str, Any]
 
+# ``__dict__`` key holding the field values an instance had when it was last
+# read or written; absent on instances built in code, which are not tracked.
+# Reads only store ``_UNCHANGED``: the values are copied on the first change.
+_SNAPSHOT = "__dynamo_snapshot__"
+# a bool so that ``copy.deepcopy`` keeps it identical
+_UNCHANGED = False
+_base_setattr = BaseModel.__setattr__
+_MISSING = object()
+
 
 @dataclass
 class GSI:
@@ -29,13 +53,13 @@ class GSI:
     name: str
     hash_key: str
     range_key: str | None = None
-    projection: ProjectionTypeType = "ALL"
+    projection: "ProjectionTypeType" = "ALL"
     non_key_attributes: list[str] | None = None
-    provisioned_throughput: None | ProvisionedThroughputTypeDef = None
-    on_demand_throughput: None | OnDemandThroughputTypeDef = None
-    warm_throughput: None | WarmThroughputTypeDef = None
+    provisioned_throughput: "ProvisionedThroughputTypeDef | None" = None
+    on_demand_throughput: "OnDemandThroughputTypeDef | None" = None
+    warm_throughput: "WarmThroughputTypeDef | None" = None
 
-    def to_dynamo(self) -> GlobalSecondaryIndexUnionTypeDef:
+    def to_dynamo(self) -> "GlobalSecondaryIndexUnionTypeDef":
         """Serialize this GSI definition to DynamoDB ``create_table`` format.
 
         Returns:
@@ -67,10 +91,10 @@ class LSI:
 
     name: str
     range_key: str
-    projection: ProjectionTypeType = "ALL"
+    projection: "ProjectionTypeType" = "ALL"
     non_key_attributes: list[str] | None = None
 
-    def to_dynamo(self, hash_key: str) -> LocalSecondaryIndexTypeDef:
+    def to_dynamo(self, hash_key: str) -> "LocalSecondaryIndexTypeDef":
         """Serialize this LSI definition to DynamoDB ``create_table`` format.
 
         Args:
@@ -101,6 +125,7 @@ class TableMeta:
     range_key: str | None = None
     global_secondary_indexes: dict[str, GSI] = field(default_factory=dict)
     local_secondary_indexes: dict[str, LSI] = field(default_factory=dict)
+    chunked: bool = False
 
 
 class DynamoModel(BaseModel):
@@ -110,21 +135,135 @@ class DynamoModel(BaseModel):
     # we can skip traversing model for converting Decimal -> float at runtime if it doesn't have floats.
     _has_float_fields: ClassVar[bool] = False
 
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """Fields changed since the instance was read from or written to DynamoDB.
+
+        A field is changed when it now holds a value that is not equal to the
+        one read or written. Always empty for instances that were not read or
+        written through the client; ``DynamoDB.save`` writes those in full.
+        """
+        return frozenset(_changed_fields(self) or ())
+
+    def mark_dirty(self, *field_names: str) -> None:
+        """Flag fields changed in place (e.g. ``item.tags.add(...)``) for ``DynamoDB.save``.
+
+        Raises:
+            ValueError: If a name is not a field of the model.
+        """
+        for field_name in field_names:
+            if field_name not in self.__pydantic_fields__:
+                raise ValueError(f"Unknown field '{field_name}' for model {type(self).__name__}")
+        snapshot = _materialized_snapshot(self.__dict__)
+        if snapshot is not None:
+            for field_name in field_names:
+                snapshot.pop(field_name, None)
+
+    def _track_changes(self) -> None:
+        """Remember the current field values as the stored state of the item."""
+        # kept in ``__dict__`` next to the field values, like a cached_property:
+        # pydantic ignores non-field entries in equality and dumps
+        self.__dict__[_SNAPSHOT] = _UNCHANGED
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # untracked and already snapshotted instances go straight to pydantic;
+        # a direct call instead of ``super()`` keeps the override cheap
+        if self.__dict__.get(_SNAPSHOT) is _UNCHANGED:
+            _materialized_snapshot(self.__dict__)
+        _base_setattr(self, name, value)
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        _detach_snapshot(copied)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        _detach_snapshot(copied)
+        return copied
+
     def to_dynamo(self) -> dict[str, Any]:
-        """Serialize model fields to DynamoDB AttributeValue objects."""
+        """Serialize model fields to DynamoDB AttributeValue objects.
+
+        Uses the per-model encoding plan compiled by ``@table`` so each value is
+        visited once; models with custom pydantic serializers fall back to
+        ``model_dump``.
+        """
+        encoder = _model_encoder(type(self))
+        if encoder is not None:
+            return encoder(self)
         dumped = self.model_dump(mode="python", exclude_none=True)
         return {k: SERIALIZER._to_dynamo(v) for k, v in dumped.items()}
 
     def to_dynamo_compatible(self) -> dict[str, Any]:
-        """Serialize model fields to a form accepted by boto3 resource put_item."""
+        """Serialize model fields to a form accepted by boto3 resource put_item.
+
+        .. deprecated::
+            The client only speaks AttributeValues; use ``to_dynamo``.
+        """
+        warnings.warn(
+            "DynamoModel.to_dynamo_compatible() is deprecated and will be removed; use to_dynamo().",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         dumped = self.model_dump(mode="python", exclude_none=True)
         return cast(dict[str, Any], _to_dynamo_compatible(dumped))
 
     @classmethod
     def from_dynamo(cls, raw: dict[str, Any]) -> Self:
-        """Deserialize DynamoDB AttributeValue objects into a model instance."""
-        dynamo_dict = {k: DESERIALIZER._to_dynamo(v) for k, v in raw.items()}
-        return cls.model_validate(dynamo_dict)
+        """Deserialize DynamoDB AttributeValue objects into a model instance.
+
+        Uses the per-model decoding plan compiled by ``@table`` so values reach
+        ``model_validate`` already in their field types.
+        """
+        return cls.model_validate(_decode_item(cls, raw))
+
+
+def _materialized_snapshot(values: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the snapshot in ``values``, copying the field values on the first change."""
+    snapshot = values.get(_SNAPSHOT)
+    if snapshot is _UNCHANGED:
+        snapshot = dict(values)
+        del snapshot[_SNAPSHOT]
+        values[_SNAPSHOT] = snapshot
+    return snapshot
+
+
+def _detach_snapshot(copied: DynamoModel) -> None:
+    """Give a copy its own snapshot, so that changes to either side stay apart."""
+    values = copied.__dict__
+    snapshot = values.get(_SNAPSHOT)
+    if snapshot is _UNCHANGED:
+        # taken before ``model_copy(update=...)`` applies, so updates count as changes
+        _materialized_snapshot(values)
+    elif snapshot is not None:
+        values[_SNAPSHOT] = dict(snapshot)
+
+
+def _changed_fields(instance: DynamoModel) -> list[str] | None:
+    """Return the changed fields of ``instance``, or ``None`` if it is not tracked."""
+    values = instance.__dict__
+    snapshot = values.get(_SNAPSHOT)
+    if snapshot is None:
+        return None
+    if snapshot is _UNCHANGED:
+        return []
+    changed = []
+    for name in instance.__pydantic_fields__:
+        value = values.get(name, _MISSING)
+        if value is _MISSING:
+            continue
+        stored = snapshot.get(name, _MISSING)
+        if value is not stored and (stored is _MISSING or value != stored):
+            changed.append(name)
+    return changed
+
+
+def _record_saved(instance: DynamoModel, saved: dict[str, Any]) -> None:
+    """Fold values written by ``DynamoDB.save`` into the tracked state of ``instance``."""
+    snapshot = instance.__dict__.get(_SNAPSHOT)
+    if isinstance(snapshot, dict):
+        snapshot.update(saved)
 
 
 def _extract_key_fields(cls: type["DynamoModel"]) -> tuple[str | None, str | None]:
@@ -156,6 +295,7 @@ def table(
     hash_key: str | None = None,
     range_key: str | None = None,
     indexes: list[GSI | LSI] | None = None,
+    chunked: bool = False,
 ):
     """Decorator that attaches DynamoDB table metadata to a Pydantic model.
 
@@ -182,6 +322,9 @@ def table(
         range_key: Optional sort key field name. Omit when using ``RangeKey[T]``.
         indexes: Optional list of ``GSI`` and ``LSI`` metadata objects.
             Names must be unique per index type.
+        chunked: Store items larger than the 400 KB DynamoDB limit as a head
+            item plus chunk items under derived sort keys. Requires a string
+            range key.
     """
 
     def decorator[T: DynamoModel](cls: type[T]) -> type[T]:
@@ -200,6 +343,11 @@ def table(
         if effective_range is not None and effective_range not in cls.model_fields:
             raise ValueError(f"range_key '{effective_range}' is not a field on {cls.__name__}")
 
+        if chunked and (
+            effective_range is None or _resolve_key_annotation(cls.model_fields[effective_range].annotation) is not str
+        ):
+            raise ValueError(f"chunked=True requires a str range_key on {cls.__name__}")
+
         idxs = indexes or []
         _validate_index_names(idxs, GSI)
         _validate_index_names(idxs, LSI)
@@ -209,8 +357,11 @@ def table(
             range_key=effective_range,
             global_secondary_indexes={i.name: i for i in idxs if isinstance(i, GSI)},
             local_secondary_indexes={i.name: i for i in idxs if isinstance(i, LSI)},
+            chunked=chunked,
         )
         cls._has_float_fields = _model_has_float_fields(cls)
+        _model_encoder(cls)
+        _model_decoder(cls)
         return cls
 
     return decorator
@@ -297,13 +448,19 @@ class TransactConditionCheck[T: DynamoModel]:
 
 @dataclass(frozen=True)
 class TransactUpdate[T: DynamoModel]:
-    """Update operation used by ``transact_write``."""
+    """Update operation used by ``transact_write``.
+
+    ``update_expression`` may also be a ``PreparedUpdate``; its condition is
+    then part of the prepared update and ``params`` binds its parameters
+    (see ``PreparedUpdate.transact``).
+    """
 
     model: type[T]
     hash_key: KeyT
-    update_expression: set[UpdateAttr]
+    update_expression: "set[UpdateAttr] | PreparedUpdate[T]"
     range_key: KeyT | None = None
     condition_expression: ConditionBase | None = None
+    params: dict[str, Any] | None = None
 
 
 @dataclass(frozen=True)
@@ -337,6 +494,35 @@ class BatchDelete[T: DynamoModel]:
     range_key: KeyT | None = None
 
 
+@dataclass(frozen=True)
+class BatchStatement[T: DynamoModel]:
+    """PartiQL statement used by ``batch_execute``.
+
+    ``parameters`` fill the ``?`` placeholders of ``statement`` in order.
+    """
+
+    model: type[T]
+    statement: str
+    parameters: Sequence[Any] | None = None
+    consistent_read: bool = False
+
+
+@dataclass
+class StatementResult[T: DynamoModel]:
+    """One page of typed PartiQL results returned by ``execute``."""
+
+    items: list[T]
+    next_token: str | None
+
+
+@dataclass
+class BatchStatementResult[T: DynamoModel]:
+    """Outcome of one ``BatchStatement``: the item it returned or its error."""
+
+    item: T | None
+    error: dict[str, Any] | None = None
+
+
 @dataclass
 class BatchGetResult[T: DynamoModel]:
     """Typed result returned by ``batch_get``."""
@@ -349,4 +535,4 @@ class BatchGetResult[T: DynamoModel]:
 class BatchWriteResult:
     """Result returned by ``batch_write``."""
 
-    unprocessed_items: dict[str, list[WriteRequestOutputTypeDef]]
+    unprocessed_items: "dict[str, list[WriteRequestOutputTypeDef]]"
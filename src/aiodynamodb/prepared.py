@@ -0,0 +1,254 @@
+"""Prepared requests: expressions built once, executed with bound parameters.
+
+Values that change between executions are written as ``Param("name")`` in
+condition and update expressions. Preparing a request builds the expression
+strings, ``ExpressionAttributeNames`` and the AttributeValues of all constant
+values once; every execution only serializes the values bound to the
+parameters (and, for item operations, the key).
+"""
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, Literal
+
+from boto3.dynamodb.conditions import ConditionBase
+from types_aiobotocore_dynamodb.type_defs import TableAttributeValueTypeDef
+
+from aiodynamodb._serializers import SERIALIZER, _serialize_custom_attribute
+from aiodynamodb._util import _projection_expression
+from aiodynamodb.conditions import CustomConditionExpressionBuilder, Param, _serialize_condition_value
+from aiodynamodb.custom_types import KeyT, ReturnValues
+from aiodynamodb.models import DynamoModel, QueryResult, TransactUpdate
+from aiodynamodb.projection import ProjectionExpressionArg
+from aiodynamodb.updates import UpdateAttr, UpdateExpressionBuilder
+
+if TYPE_CHECKING:
+    from aiodynamodb.client import DynamoDB
+
+# (placeholder, attribute the value is serialized against, parameter name)
+type _BoundValue = tuple[str, str | None, str]
+
+
+def _split_values(
+    builder: CustomConditionExpressionBuilder, values: dict[str, Any]
+) -> tuple[dict[str, Any], tuple[_BoundValue, ...]]:
+    """Split built placeholder values into constant AttributeValues and ``Param`` slots."""
+    constant_values: dict[str, Any] = {}
+    bound_values: list[_BoundValue] = []
+    for placeholder, value in values.items():
+        if isinstance(value, Param):
+            bound_values.append((placeholder, builder._value_attribute_names.get(placeholder), value.name))
+        else:
+            constant_values[placeholder] = SERIALIZER._to_dynamo(value)
+    return constant_values, tuple(bound_values)
+
+
+class _PreparedValues:
+    """Constant and bound expression values shared by the prepared request types."""
+
+    def __init__(
+        self,
+        model: type[DynamoModel],
+        constant_values: dict[str, Any],
+        bound_values: tuple[_BoundValue, ...],
+    ):
+        self.model = model
+        self._constant_values = constant_values
+        self._bound_values = bound_values
+        self.parameters = frozenset(name for _, _, name in bound_values)
+
+    def _bind(self, params: dict[str, Any]) -> dict[str, Any]:
+        if params.keys() != self.parameters:
+            missing = sorted(self.parameters - params.keys())
+            unexpected = sorted(params.keys() - self.parameters)
+            raise TypeError(f"Bind parameters do not match: missing {missing}, unexpected {unexpected}.")
+        values = dict(self._constant_values)
+        for placeholder, attribute_name, name in self._bound_values:
+            values[placeholder] = SERIALIZER._to_dynamo(
+                _serialize_condition_value(self.model, attribute_name, params[name])
+            )
+        return values
+
+
+class PreparedQuery[T: DynamoModel](_PreparedValues):
+    """A ``query`` or ``scan`` built once and executed with bound parameters.
+
+    Created by ``DynamoDB.prepare_query`` and ``DynamoDB.prepare_scan``. The
+    expression strings, ``ExpressionAttributeNames``, constant values and the
+    rest of the request are computed up front; each execution only serializes
+    the values bound to its ``Param`` placeholders.
+    """
+
+    model: type[T]
+
+    def __init__(
+        self,
+        db: "DynamoDB",
+        operation: Literal["query", "scan"],
+        model: type[T],
+        request_args: dict[str, Any],
+        *,
+        key_condition_expression: ConditionBase | None = None,
+        filter_expression: ConditionBase | None = None,
+        projection_expression: ProjectionExpressionArg | None = None,
+        trusted: bool | None = None,
+    ):
+        builder = CustomConditionExpressionBuilder(model)
+        names: dict[str, str] = {}
+        values: dict[str, Any] = {}
+        expressions = (
+            ("KeyConditionExpression", key_condition_expression, True),
+            ("FilterExpression", filter_expression, False),
+        )
+        for member, expression, is_key_condition in expressions:
+            if expression is None:
+                continue
+            built = builder.build_expression(expression, is_key_condition=is_key_condition)
+            request_args[member] = built.condition_expression
+            names.update(built.attribute_name_placeholders)
+            values.update(built.attribute_value_placeholders)
+
+        # chunked heads need all their attributes; their projection is applied after reassembly
+        request_projection = None if model.Meta.chunked else projection_expression
+        projection_payload = _projection_expression(model, request_projection, builder=builder)
+        if projection_payload:
+            request_args["ProjectionExpression"] = projection_payload["ProjectionExpression"]
+            names.update(projection_payload.get("ExpressionAttributeNames", {}))
+        if names:
+            request_args["ExpressionAttributeNames"] = names
+
+        super().__init__(model, *_split_values(builder, values))
+        self._db = db
+        self._operation = operation
+        self._request_args = request_args
+        self._projection = projection_expression
+        self._trusted = trusted
+
+    async def execute(
+        self,
+        *,
+        exclusive_start_key: dict[str, TableAttributeValueTypeDef] | None = None,
+        **params: Any,
+    ) -> AsyncIterator[QueryResult[T]]:
+        """Run the prepared request and yield paginated results.
+
+        Args:
+            exclusive_start_key: Pagination token from a previous page.
+            **params: A value for every ``Param`` of the prepared expressions.
+
+        Yields:
+            ``QueryResult`` pages containing validated model instances.
+
+        Raises:
+            TypeError: When ``params`` does not match the prepared parameters.
+        """
+        request_args = dict(self._request_args)
+        values = self._bind(params)
+        if values:
+            request_args["ExpressionAttributeValues"] = values
+        if exclusive_start_key is not None:
+            request_args["ExclusiveStartKey"] = exclusive_start_key
+        async for result in self._db._paginate(
+            self._operation,
+            self.model,
+            request_args,
+            projection=self._projection,
+            trusted=self._db._is_trusted(self._trusted),
+            serialized_values=True,
+        ):
+            yield result
+
+    async def items(self, **params: Any) -> AsyncIterator[T]:
+        """Run the prepared request and yield the items of every page."""
+        async for page in self.execute(**params):
+            for item in page.items:
+                yield item
+
+
+class PreparedUpdate[T: DynamoModel](_PreparedValues):
+    """An ``update`` built once and executed with a key and bound parameters.
+
+    Created by ``DynamoDB.prepare_update``. The ``UpdateExpression``,
+    ``ConditionExpression``, name map and constant values are computed up
+    front. Use ``execute`` to run it on its own or ``transact`` to include it
+    in ``transact_write``.
+    """
+
+    model: type[T]
+
+    def __init__(
+        self,
+        db: "DynamoDB",
+        model: type[T],
+        *,
+        update_expression: set[UpdateAttr],
+        condition_expression: ConditionBase | None = None,
+        return_values: ReturnValues | None = None,
+    ):
+        # one builder for both expressions so placeholders never collide
+        builder = UpdateExpressionBuilder(model)
+        request_args: dict[str, Any] = {"TableName": model.Meta.table_name}
+        names: dict[str, str] = {}
+        values: dict[str, Any] = {}
+        if condition_expression is not None:
+            built_condition = builder.build_expression(condition_expression)
+            request_args["ConditionExpression"] = built_condition.condition_expression
+            names.update(built_condition.attribute_name_placeholders)
+            values.update(built_condition.attribute_value_placeholders)
+        built = builder.build_update_expression(update_expression)
+        request_args["UpdateExpression"] = built.update_expression
+        names.update(built.expression_attribute_names)
+        values.update(built.expression_attribute_values)
+        if names:
+            request_args["ExpressionAttributeNames"] = names
+
+        super().__init__(model, *_split_values(builder, values))
+        self._db = db
+        self._request_args = request_args
+        self._return_values = return_values
+        meta = model.Meta
+        self._hash_key = meta.hash_key
+        self._range_key = meta.range_key
+
+    def _request(self, hash_key: KeyT, range_key: KeyT | None, params: dict[str, Any]) -> dict[str, Any]:
+        """Build the ``update_item`` arguments (also the ``Update`` member of a transaction)."""
+        key = {self._hash_key: SERIALIZER._to_dynamo(_serialize_custom_attribute(self.model, self._hash_key, hash_key))}
+        if self._range_key and range_key is not None:
+            key[self._range_key] = SERIALIZER._to_dynamo(
+                _serialize_custom_attribute(self.model, self._range_key, range_key)
+            )
+        request_args = dict(self._request_args)
+        request_args["Key"] = key
+        values = self._bind(params)
+        if values:
+            request_args["ExpressionAttributeValues"] = values
+        return request_args
+
+    async def execute(self, *, hash_key: KeyT, range_key: KeyT | None = None, **params: Any) -> T | None:
+        """Apply the prepared update to one item.
+
+        Args:
+            hash_key: Partition key value.
+            range_key: Sort key value, when the table defines one.
+            **params: A value for every ``Param`` of the prepared expressions.
+
+        Returns:
+            Validated model instance when DynamoDB returns ``Attributes``;
+            otherwise ``None``.
+
+        Raises:
+            TypeError: When ``params`` does not match the prepared parameters.
+        """
+        request_args = self._request(hash_key, range_key, params)
+        if self._return_values is not None:
+            request_args["ReturnValues"] = self._return_values
+        return await self._db._update_item(self.model, request_args)
+
+    def transact(self, *, hash_key: KeyT, range_key: KeyT | None = None, **params: Any) -> TransactUpdate[T]:
+        """Return a ``TransactUpdate`` running this update inside ``transact_write``."""
+        return TransactUpdate(
+            self.model,
+            hash_key=hash_key,
+            update_expression=self,
+            range_key=range_key,
+            params=params,
+        )
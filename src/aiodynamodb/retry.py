@@ -0,0 +1,123 @@
+"""Retry policy for throttled and transiently failing DynamoDB requests."""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
+
+# Error codes worth retrying: the request may succeed unchanged a moment later.
+_RETRYABLE_CODES = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "TransactionConflictException",
+    "TransactionInProgressException",
+})
+# Connection failures and timeouts (e.g. ``EndpointConnectionError``,
+# ``ConnectionClosedError``, ``ReadTimeoutError``), as in botocore's standard mode.
+_TRANSIENT_ERRORS = (ConnectionError, HTTPClientError)
+# Cancellation reasons of a transaction that do not depend on the data.
+_RETRYABLE_CANCELLATION_CODES = frozenset({
+    "None",
+    "ThrottlingError",
+    "TransactionConflict",
+    "ProvisionedThroughputExceeded",
+})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether ``error`` is transient, e.g. throttling, a transaction conflict or a dropped connection.
+
+    A ``TransactionCanceledException`` is retryable only when every cancelled
+    item failed for a transient reason; a failed condition check is not.
+    """
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    if not isinstance(error, ClientError):
+        return False
+    code = error.response.get("Error", {}).get("Code")
+    if code in _RETRYABLE_CODES:
+        return True
+    if code == "TransactionCanceledException":
+        reasons: list[dict[str, Any]] = error.response.get("CancellationReasons", [])  # type: ignore[assignment]
+        return bool(reasons) and all(reason.get("Code", "None") in _RETRYABLE_CANCELLATION_CODES for reason in reasons)
+    return False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How ``DynamoDB`` retries throttled and transiently failing requests.
+
+    Attempt ``n`` (counting from 1) is followed by a delay drawn uniformly
+    from ``[0, min(max_delay, base_delay * 2 ** (n - 1))]`` ("full jitter").
+    Every table keeps a retry budget: once more than ``failure_ratio`` of its
+    requests in the last ``budget_window`` seconds failed with a retryable
+    error (counted after ``min_requests`` requests), failures are raised
+    without retrying until the ratio falls again.
+
+    Attributes:
+        max_attempts: Attempts per request, including the first one.
+        base_delay: Delay ceiling in seconds after the first attempt.
+        max_delay: Upper bound of the delay ceiling in seconds.
+        failure_ratio: Failure ratio per table above which retries stop.
+        budget_window: Length of the failure ratio window in seconds.
+        min_requests: Requests in the window before the ratio is enforced.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.05
+    max_delay: float = 5.0
+    failure_ratio: float = 0.5
+    budget_window: float = 10.0
+    min_requests: int = 20
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}.")
+
+    def delay(self, attempt: int) -> float:
+        """Jittered delay in seconds after failed attempt number ``attempt``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class _RetryBudget:
+    """Requests and retryable failures of one table over a sliding time window.
+
+    The window is split into one-second buckets, so counting is O(1) and old
+    requests expire a bucket at a time.
+    """
+
+    def __init__(self, policy: RetryPolicy):
+        self._policy = policy
+        self._size = max(1, int(policy.budget_window))
+        self._requests = [0] * self._size
+        self._failures = [0] * self._size
+        self._second = int(time.monotonic())
+
+    def _bucket(self) -> int:
+        now = int(time.monotonic())
+        elapsed = now - self._second
+        if elapsed > 0:
+            for offset in range(1, min(elapsed, self._size) + 1):
+                index = (self._second + offset) % self._size
+                self._requests[index] = 0
+                self._failures[index] = 0
+            self._second = now
+        return now % self._size
+
+    def record(self, *, failed: bool) -> None:
+        bucket = self._bucket()
+        self._requests[bucket] += 1
+        if failed:
+            self._failures[bucket] += 1
+
+    def allows_retry(self) -> bool:
+        self._bucket()
+        requests = sum(self._requests)
+        if requests < self._policy.min_requests:
+            return True
+        return sum(self._failures) <= self._policy.failure_ratio * requests
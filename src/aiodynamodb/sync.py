@@ -0,0 +1,175 @@
+"""Blocking facade over ``DynamoDB`` for synchronous code."""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Collection, Coroutine, Iterator
+from typing import Any, Self, cast
+
+from boto3.dynamodb.conditions import ConditionBase
+from types_aiobotocore_dynamodb.type_defs import (
+    CreateTableOutputTypeDef,
+    DeleteTableOutputTypeDef,
+    TransactWriteItemsOutputTypeDef,
+)
+
+from aiodynamodb.client import BatchWriteOperation, DynamoDB, TransactWriteOperation
+from aiodynamodb.models import (
+    BatchGet,
+    BatchGetResult,
+    BatchStatement,
+    BatchStatementResult,
+    BatchWriteResult,
+    DynamoModel,
+    QueryResult,
+    StatementResult,
+    TransactGet,
+)
+
+
+class SyncDynamoDB:
+    """Blocking version of ``DynamoDB`` backed by an event loop in a background thread.
+
+    The loop and one ``DynamoDB`` instance live as long as the facade, so
+    connections are reused across calls. Methods take the same arguments as
+    their ``DynamoDB`` counterparts and block until the result is ready; calls
+    made from several threads at once run concurrently on the loop. ``query``
+    and ``scan`` return iterators that fetch one page at a time.
+
+    Usage::
+
+        with SyncDynamoDB(region_name="us-east-1") as db:
+            db.put(User(user_id="u1", name="Alice"))
+            user = db.get(User, hash_key="u1")
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Start the background loop and create the wrapped client.
+
+        Args:
+            *args: Positional arguments forwarded to ``DynamoDB``.
+            **kwargs: Keyword arguments forwarded to ``DynamoDB``.
+        """
+        self.db = DynamoDB(*args, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="aiodynamodb-sync", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        self._run(self.db._ensure_client())
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the wrapped client, then stop and close the background loop."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.db.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def _run[R](self, coroutine: Coroutine[Any, Any, R]) -> R:
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("SyncDynamoDB cannot be called from its own event loop thread.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _iterate[R](self, pages: AsyncIterator[R]) -> Iterator[R]:
+        """Drive an async page iterator from the calling thread, one page per step."""
+
+        async def next_page() -> tuple[bool, R | None]:
+            try:
+                return True, await anext(pages)
+            except StopAsyncIteration:
+                return False, None
+
+        async def aclose() -> None:
+            close = getattr(pages, "aclose", None)
+            if close is not None:
+                await close()
+
+        try:
+            while True:
+                has_page, page = self._run(next_page())
+                if not has_page:
+                    return
+                yield cast(R, page)
+        finally:
+            if not self._loop.is_closed():
+                self._run(aclose())
+
+    def exceptions(self) -> Any:
+        """Return the boto3 DynamoDB exception namespace for error handling."""
+        return self._run(self.db.exceptions())
+
+    def warmup(self, models: Collection[type[DynamoModel]] = (), **kwargs: Any) -> None:
+        """Blocking ``DynamoDB.warmup``."""
+        self._run(self.db.warmup(models, **kwargs))
+
+    def put(self, item: DynamoModel, *, condition_expression: ConditionBase | None = None) -> None:
+        """Blocking ``DynamoDB.put``."""
+        self._run(self.db.put(item, condition_expression=condition_expression))
+
+    def save(self, item: DynamoModel, *, condition_expression: ConditionBase | None = None) -> bool:
+        """Blocking ``DynamoDB.save``."""
+        return self._run(self.db.save(item, condition_expression=condition_expression))
+
+    def get[T: DynamoModel](self, model: type[T], **kwargs: Any) -> T | None:
+        """Blocking ``DynamoDB.get``."""
+        return self._run(self.db.get(model, **kwargs))
+
+    def delete[T: DynamoModel](self, model: type[T], **kwargs: Any) -> None:
+        """Blocking ``DynamoDB.delete``."""
+        self._run(self.db.delete(model, **kwargs))
+
+    def update[T: DynamoModel](self, model: type[T], **kwargs: Any) -> T | None:
+        """Blocking ``DynamoDB.update``."""
+        return self._run(self.db.update(model, **kwargs))
+
+    def query[T: DynamoModel](self, model: type[T], **kwargs: Any) -> Iterator[QueryResult[T]]:
+        """Iterator version of ``DynamoDB.query``, yielding one page at a time."""
+        return self._iterate(self.db.query(model, **kwargs))
+
+    def scan[T: DynamoModel](self, model: type[T], **kwargs: Any) -> Iterator[QueryResult[T]]:
+        """Iterator version of ``DynamoDB.scan``, yielding one page at a time."""
+        return self._iterate(self.db.scan(model, **kwargs))
+
+    def execute[T: DynamoModel](self, model: type[T], statement: str, *args: Any, **kwargs: Any) -> StatementResult[T]:
+        """Blocking ``DynamoDB.execute``."""
+        return self._run(self.db.execute(model, statement, *args, **kwargs))
+
+    def batch_execute(
+        self, statements: list[BatchStatement[DynamoModel]], **kwargs: Any
+    ) -> list[BatchStatementResult[DynamoModel]]:
+        """Blocking ``DynamoDB.batch_execute``."""
+        return self._run(self.db.batch_execute(statements, **kwargs))
+
+    def transact_get[T: DynamoModel](self, requests: list[TransactGet[T]], **kwargs: Any) -> list[T | None]:
+        """Blocking ``DynamoDB.transact_get``."""
+        return self._run(self.db.transact_get(requests, **kwargs))
+
+    def transact_write(
+        self, operations: list[TransactWriteOperation], **kwargs: Any
+    ) -> TransactWriteItemsOutputTypeDef:
+        """Blocking ``DynamoDB.transact_write``."""
+        return self._run(self.db.transact_write(operations, **kwargs))
+
+    def batch_get(self, requests: list[BatchGet[DynamoModel]], **kwargs: Any) -> BatchGetResult:
+        """Blocking ``DynamoDB.batch_get``."""
+        return self._run(self.db.batch_get(requests, **kwargs))
+
+    def batch_write(self, operations: list[BatchWriteOperation], **kwargs: Any) -> BatchWriteResult:
+        """Blocking ``DynamoDB.batch_write``."""
+        return self._run(self.db.batch_write(operations, **kwargs))
+
+    def create_table[T: DynamoModel](self, model: type[T], **kwargs: Any) -> CreateTableOutputTypeDef:
+        """Blocking ``DynamoDB.create_table``."""
+        return self._run(self.db.create_table(model, **kwargs))
+
+    def delete_table[T: DynamoModel](self, model: type[T]) -> DeleteTableOutputTypeDef:
+        """Blocking ``DynamoDB.delete_table``."""
+        return self._run(self.db.delete_table(model))
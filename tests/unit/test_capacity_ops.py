@@ -0,0 +1,115 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from boto3.dynamodb.conditions import Key
+
+from aiodynamodb import BatchPut, CapacityLimit, DynamoDB
+from tests.unit.entities import Order, User
+
+
+def _capture(sent: list[dict]):
+    def handler(params, **kwargs):
+        sent.append(params)
+
+    return handler
+
+
+def _consuming(consumed: dict):
+    """Short-circuit a call, reporting ``consumed`` as its ``ConsumedCapacity``."""
+
+    def handler(**kwargs):
+        return SimpleNamespace(status_code=200, headers={}), {"ConsumedCapacity": consumed, "Items": []}
+
+    return handler
+
+
+def test_capacity_limit_rejects_non_positive_rates():
+    with pytest.raises(ValueError, match="write capacity must be positive"):
+        CapacityLimit(User, write=0)
+
+
+async def test_consumed_capacity_is_requested_and_debited(db):
+    sent: list[dict] = []
+    async with DynamoDB(capacity_limits=[CapacityLimit(User, read=1, write=1, burst=100)]) as limited:
+        client = await limited._ensure_client()
+        client.meta.events.register("provide-client-params.dynamodb", _capture(sent))
+
+        await limited.put(User(user_id="u1", name="Alice"))
+        await limited.batch_write([BatchPut(User(user_id=f"u{index}", name="x")) for index in range(2, 5)])
+        await limited.get(User, hash_key="u1")
+        await limited.put(Order(order_id="o1", created_at="2024", total=1))
+
+        buckets = limited._capacity_limiter._buckets
+        # moto reports one unit per request, including the whole batch
+        assert buckets["users", None, "write"].tokens == pytest.approx(98, abs=0.5)
+        assert buckets["users", None, "read"].tokens == pytest.approx(99.5, abs=0.5)
+
+    assert [params.get("ReturnConsumedCapacity") for params in sent] == ["INDEXES"] * 3 + [None]
+
+
+async def test_requests_wait_until_overspent_capacity_is_refilled(db):
+    sent: list[dict] = []
+    consumed = {"TableName": "users", "CapacityUnits": 15.0, "Table": {"CapacityUnits": 15.0}}
+    async with DynamoDB(capacity_limits=[CapacityLimit(User, write=50, burst=0.2)]) as limited:
+        client = await limited._ensure_client()
+        client.meta.events.register("provide-client-params.dynamodb.PutItem", _capture(sent))
+        client.meta.events.register("before-call.dynamodb.PutItem", _consuming(consumed))
+
+        started = time.monotonic()
+        await limited.put(User(user_id="u1", name="Alice"))
+        await limited.put(User(user_id="u2", name="Bob"))
+        elapsed = time.monotonic() - started
+
+    # 10 units of burst, 15 consumed: the second put waits for 5 units at 50/s
+    assert len(sent) == 2
+    assert elapsed >= 0.09
+
+
+async def test_index_reads_draw_from_the_index_budget(db):
+    sent: list[dict] = []
+    consumed = {
+        "TableName": "orders",
+        "CapacityUnits": 3.0,
+        "Table": {"CapacityUnits": 0.0},
+        "GlobalSecondaryIndexes": {"order_gsi": {"CapacityUnits": 3.0}},
+    }
+    limits = [
+        CapacityLimit(Order, read=0.1, burst=100),
+        CapacityLimit(Order, read=0.1, burst=100, index="order_gsi"),
+    ]
+    async with DynamoDB(capacity_limits=limits) as limited:
+        client = await limited._ensure_client()
+        client.meta.events.register("provide-client-params.dynamodb.Query", _capture(sent))
+        client.meta.events.register("before-call.dynamodb.Query", _consuming(consumed))
+
+        async for _ in limited.query(Order, index_name="order_gsi", key_condition_expression=Key("order_id").eq("o1")):
+            pass
+
+        buckets = limited._capacity_limiter._buckets
+        assert buckets["orders", "order_gsi", "read"].tokens == pytest.approx(7, abs=0.5)
+        assert buckets["orders", None, "read"].tokens == pytest.approx(10)
+    assert sent[0]["ReturnConsumedCapacity"] == "INDEXES"
+
+
+async def test_query_pages_are_estimated_from_earlier_pages(db):
+    consumed = {"TableName": "users", "CapacityUnits": 8.0, "Table": {"CapacityUnits": 8.0}}
+    balances: list[float] = []
+    async with DynamoDB(capacity_limits=[CapacityLimit(User, read=0.1, burst=1000)]) as limited:
+        bucket = limited._capacity_limiter._buckets["users", None, "read"]
+        consuming = _consuming(consumed)
+
+        def handler(**kwargs):
+            balances.append(bucket.tokens)
+            return consuming(**kwargs)
+
+        client = await limited._ensure_client()
+        client.meta.events.register("before-call.dynamodb.Query", handler)
+
+        for _ in range(2):
+            async for _ in limited.query(User, key_condition_expression=Key("user_id").eq("u1")):
+                pass
+
+        assert bucket.page_units == pytest.approx(8)
+    # the first page is debited one unit up front, the second the eight the first one consumed
+    assert balances == [pytest.approx(99, abs=0.1), pytest.approx(84, abs=0.1)]
@@ -0,0 +1,237 @@
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from types_aiobotocore_dynamodb import DynamoDBClient
+
+from aiodynamodb import (
+    BatchDelete,
+    BatchGet,
+    BatchPut,
+    DynamoModel,
+    HashKey,
+    RangeKey,
+    TransactDelete,
+    TransactGet,
+    TransactPut,
+    table,
+)
+from aiodynamodb.projection import ProjectionAttr
+
+
+@table("documents", chunked=True)
+class Document(DynamoModel):
+    doc_id: HashKey[str]
+    version: RangeKey[str]
+    title: str
+    body: str
+    attachment: bytes = b""
+
+
+def _large_document(version: str = "v1") -> Document:
+    return Document(
+        doc_id="d1",
+        version=version,
+        title="large",
+        body="lorem ipsum " * 80_000,
+        attachment=bytes(range(256)) * 400,
+    )
+
+
+async def _stored_items(db) -> list[dict]:
+    c: DynamoDBClient
+    async with db._client() as c:
+        paginator = c.get_paginator("scan")
+        return [item async for page in paginator.paginate(TableName="documents") for item in page["Items"]]
+
+
+async def test_oversized_items_are_split_and_reassembled(db):
+    await db.create_table(Document)
+    document = _large_document()
+
+    await db.put(document)
+
+    stored = await _stored_items(db)
+    assert len(stored) == 4
+    assert await db.get(Document, hash_key="d1", range_key="v1") == document
+    assert await db.get(Document, hash_key="d1", range_key="v1", trusted=True) == document
+
+    projected = await db.get(Document, hash_key="d1", range_key="v1", projection_expression=[ProjectionAttr("title")])
+    assert projected is not None
+    assert projected.title == "large"
+    assert "body" not in projected.model_fields_set
+
+
+async def test_overwriting_removes_stale_chunks(db):
+    await db.create_table(Document)
+    await db.put(_large_document())
+    smaller = _large_document().model_copy(update={"body": "lorem ipsum " * 40_000})
+
+    await db.put(smaller)
+    assert len(await _stored_items(db)) == 3
+    assert await db.get(Document, hash_key="d1", range_key="v1") == smaller
+
+    small = Document(doc_id="d1", version="v1", title="small", body="tiny")
+    await db.put(small)
+    assert len(await _stored_items(db)) == 1
+    assert await db.get(Document, hash_key="d1", range_key="v1") == small
+
+
+async def test_small_items_are_stored_as_a_single_item(db):
+    await db.create_table(Document)
+    document = Document(doc_id="d1", version="v1", title="small", body="tiny")
+
+    await db.put(document)
+
+    assert len(await _stored_items(db)) == 1
+    assert await db.get(Document, hash_key="d1", range_key="v1") == document
+    assert await db.get(Document, hash_key="d1", range_key="v2") is None
+
+
+async def test_query_skips_chunks_and_reassembles_items(db):
+    await db.create_table(Document)
+    large = _large_document("v1")
+    small = Document(doc_id="d1", version="v2", title="small", body="tiny")
+    await db.put(large)
+    await db.put(small)
+
+    items = [
+        item
+        async for page in db.query(Document, key_condition_expression=Key("doc_id").eq("d1"))
+        for item in page.items
+    ]
+
+    assert items == [large, small]
+
+    projected = [
+        item
+        async for page in db.query(
+            Document, key_condition_expression=Key("doc_id").eq("d1"), projection_expression=[ProjectionAttr("title")]
+        )
+        for item in page.items
+    ]
+    assert [item.title for item in projected] == ["large", "small"]
+
+
+async def test_query_reassembles_chunks_from_the_page(db):
+    await db.create_table(Document)
+    # two chunks each, so both groups fit in one 1 MB page
+    for version in ("v1", "v2"):
+        await db.put(Document(doc_id="d1", version=version, title="large", body="lorem ipsum " * 36_000))
+    queries: list[dict] = []
+    client = await db._ensure_client()
+    client.meta.events.register("provide-client-params.dynamodb.Query", lambda params, **kwargs: queries.append(params))
+
+    pages = [page async for page in db.query(Document, key_condition_expression=Key("doc_id").eq("d1"))]
+
+    assert [item.version for page in pages for item in page.items] == ["v1", "v2"]
+    assert len(pages) == 1
+    assert len(queries) == 1
+
+
+async def test_filters_and_indexes_are_rejected_on_chunked_models(db):
+    with pytest.raises(ValueError, match="Cannot filter chunked model Document"):
+        async for _ in db.scan(Document, filter_expression=Attr("title").eq("large")):
+            pass
+    with pytest.raises(ValueError, match="Cannot read index 'by_title' of chunked model Document"):
+        db.prepare_query(Document, index_name="by_title", key_condition_expression=Key("title").eq("large"))
+
+
+async def test_delete_removes_chunks(db):
+    await db.create_table(Document)
+    await db.put(_large_document())
+    await db.put(Document(doc_id="d1", version="v2", title="small", body="tiny"))
+
+    await db.delete(Document, hash_key="d1", range_key="v1")
+
+    assert [item["version"] for item in await _stored_items(db)] == [{"S": "v2"}]
+    assert await db.get(Document, hash_key="d1", range_key="v1") is None
+
+
+async def test_batch_get_and_transact_get_reassemble_items(db):
+    await db.create_table(Document)
+    large = _large_document("v1")
+    small = Document(doc_id="d1", version="v2", title="small", body="tiny")
+    await db.put(large)
+    await db.put(small)
+
+    result = await db.batch_get([
+        BatchGet(Document, hash_key="d1", range_key="v1"),
+        BatchGet(Document, hash_key="d1", range_key="v2"),
+    ])
+    assert sorted(result.items[Document], key=lambda document: document.version) == [large, small]
+
+    fetched = await db.transact_get([
+        TransactGet(Document, hash_key="d1", range_key="v1"),
+        TransactGet(Document, hash_key="d1", range_key="v1", projection_expression=[ProjectionAttr("title")]),
+    ])
+    assert fetched[0] == large
+    assert fetched[1] is not None
+    assert fetched[1].title == "large"
+    assert "body" not in fetched[1].model_fields_set
+
+
+async def test_batch_write_splits_oversized_items(db):
+    await db.create_table(Document)
+    large = _large_document("v1")
+    small = Document(doc_id="d1", version="v2", title="small", body="tiny")
+
+    result = await db.batch_write([BatchPut(large), BatchPut(small)])
+
+    assert result.unprocessed_items == {}
+    assert len(await _stored_items(db)) == 5
+    assert await db.get(Document, hash_key="d1", range_key="v1") == large
+
+    await db.batch_write([BatchDelete(Document, hash_key="d1", range_key="v1")])
+    assert [item["version"] for item in await _stored_items(db)] == [{"S": "v2"}]
+
+
+async def test_transact_write_splits_oversized_items(db):
+    await db.create_table(Document)
+    large = _large_document()
+
+    await db.transact_write([TransactPut(large)])
+    assert len(await _stored_items(db)) == 4
+    assert await db.get(Document, hash_key="d1", range_key="v1") == large
+
+    await db.transact_write([TransactDelete(Document, hash_key="d1", range_key="v1")])
+    assert await _stored_items(db) == []
+
+
+def test_chunked_tables_need_a_string_range_key():
+    with pytest.raises(ValueError, match="chunked=True requires a str range_key"):
+
+        @table("no_range", chunked=True)
+        class NoRange(DynamoModel):
+            doc_id: HashKey[str]
+            body: str
+
+
+async def test_items_that_fit_are_written_without_a_chunk_lookup(db):
+    await db.create_table(Document)
+    operations: list[str] = []
+    client = await db._ensure_client()
+    client.meta.events.register("provide-client-params.dynamodb", lambda model, **kwargs: operations.append(model.name))
+
+    await db.put(Document(doc_id="d1", version="v1", title="small", body="tiny"))
+    await db.put(Document(doc_id="d1", version="v1", title="small", body="tinier"))
+    await db.delete(Document, hash_key="d1", range_key="v1")
+
+    assert operations == ["PutItem", "PutItem", "DeleteItem"]
+
+
+async def test_conditions_on_chunked_models_are_limited_to_key_attributes(db):
+    await db.create_table(Document)
+    ex = await db.exceptions()
+    create = Attr("doc_id").not_exists()
+    await db.put(Document(doc_id="d1", version="v1", title="small", body="tiny"), condition_expression=create)
+    with pytest.raises(ex.ConditionalCheckFailedException):
+        await db.put(Document(doc_id="d1", version="v1", title="small", body="again"), condition_expression=create)
+
+    await db.put(_large_document("v2"))
+    with pytest.raises(ex.TransactionCanceledException):
+        await db.put(Document(doc_id="d1", version="v2", title="small", body="tiny"), condition_expression=create)
+    assert await db.get(Document, hash_key="d1", range_key="v2") == _large_document("v2")
+
+    with pytest.raises(ValueError, match=r"Cannot condition chunked model Document on \['title'\]"):
+        await db.put(_large_document(), condition_expression=Attr("title").eq("large"))
+    with pytest.raises(ValueError, match=r"Cannot condition chunked model Document on \['title'\]"):
+        await db.delete(Document, hash_key="d1", range_key="v1", condition_expression=Attr("title").eq("large"))
@@ -0,0 +1,78 @@
+import re
+
+import pytest
+from boto3.dynamodb.conditions import ATTR_NAME_REGEX, Attr, ConditionExpressionBuilder, Key
+
+from aiodynamodb.conditions import CustomConditionExpressionBuilder, _split_attribute_path
+from aiodynamodb.projection import ProjectionAttr, ProjectionExpressionBuilder
+from aiodynamodb.updates import UpdateAttr, UpdateExpressionBuilder
+from tests.unit.entities import ComplexOrder
+
+PLACEHOLDER = re.compile(r"[#:][nv]\d+")
+
+
+def _resolve(expression: str, names: dict[str, str], values: dict[str, object]) -> str:
+    return PLACEHOLDER.sub(lambda match: str(names.get(match.group(), values.get(match.group()))), expression)
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["a", "a.b", "a[0].b", "a[1][2]", "a.b[0].c", "a]b", "a[b.c]", "[0]a", "a..b", "a[0", "#x", ""],
+)
+def test_attribute_paths_split_like_boto3(path):
+    literals, names = _split_attribute_path(path)
+
+    assert list(names) == ATTR_NAME_REGEX.findall(path)
+    assert "%s".join(literals) == ATTR_NAME_REGEX.sub("%s", path)
+
+
+@pytest.mark.parametrize(
+    ("condition", "is_key_condition"),
+    [
+        (Key("order_id").eq("o1") & Key("created_at").between(1, 2), True),
+        (Attr("total").gt(1) & (Attr("total").lt(10) | Attr("basket.items.qty").is_in([1, 2])), False),
+        (Attr("basket.items[1].name").begins_with("x") & ~Attr("basket.items.price").exists(), False),
+        (Attr("order_id").contains("o") & Attr("total").ne(3) & Attr("order_id").not_exists(), False),
+    ],
+)
+def test_conditions_match_boto3(condition, is_key_condition):
+    builder = CustomConditionExpressionBuilder(ComplexOrder)
+    built = builder.build_expression(condition, is_key_condition=is_key_condition)
+    stock = ConditionExpressionBuilder()
+    stock._build_name_placeholder = lambda value, names: ConditionExpressionBuilder._build_name_placeholder(
+        stock, type(value)(builder._normalize_attribute_name(value.name)), names
+    )
+    expected = stock.build_expression(condition, is_key_condition=is_key_condition)
+
+    assert _resolve(
+        built.condition_expression, built.attribute_name_placeholders, built.attribute_value_placeholders
+    ) == _resolve(
+        expected.condition_expression, expected.attribute_name_placeholders, expected.attribute_value_placeholders
+    )
+
+
+def test_each_distinct_name_gets_one_placeholder():
+    builder = UpdateExpressionBuilder(ComplexOrder)
+    condition = builder.build_expression(Attr("total").gt(1) & Attr("basket.items.qty").eq(1))
+    built = builder.build_update_expression({UpdateAttr("total").add(1)})
+    projection = ProjectionExpressionBuilder(ComplexOrder).build_projection_expression([
+        ProjectionAttr("basket.items.qty"),
+        ProjectionAttr("basket.items.name"),
+    ])
+
+    assert condition.condition_expression == "(#n0 > :v0 AND #n1.#n2[0].#n3 = :v1)"
+    assert built.update_expression == "ADD #n0 :v2"
+    assert built.expression_attribute_names == {"#n0": "total"}
+    assert projection.projection_expression == "#n0.#n1[0].#n2, #n0.#n1[0].#n3"
+    assert projection.expression_attribute_names == {"#n0": "basket", "#n1": "items", "#n2": "qty", "#n3": "name"}
+
+
+def test_reset_forgets_placeholders_and_their_attributes():
+    builder = CustomConditionExpressionBuilder(ComplexOrder)
+    builder.build_expression(Attr("total").gt(1) & Attr("order_id").eq("o1"))
+
+    builder.reset()
+    built = builder.build_expression(Attr("order_id").eq("o2"))
+
+    assert built.attribute_name_placeholders == {"#n0": "order_id"}
+    assert builder._value_attribute_names == {":v0": "order_id"}
@@ -0,0 +1,61 @@
+from boto3.dynamodb.conditions import Key
+from types_aiobotocore_dynamodb import DynamoDBClient
+
+from aiodynamodb import DynamoModel, HashKey, RangeKey, table
+from aiodynamodb._wire import _decode_item_payload
+from aiodynamodb.models import BatchGet
+
+
+@table("blobs")
+class Blob(DynamoModel):
+    blob_id: HashKey[str]
+    chunk: RangeKey[bytes]
+    data: bytes
+    tags: set[bytes] = set()
+    size: int = 0
+
+
+def test_item_members_skip_botocore_parsing():
+    response_dict = {
+        "status_code": 200,
+        "body": b'{"Items":[{"n":{"N":"1"}}],"Count":1,"LastEvaluatedKey":{"k":{"B":"AP8="}}}',
+    }
+    customized: dict = {}
+
+    _decode_item_payload(response_dict=response_dict, customized_response_dict=customized)
+
+    assert customized == {"Items": [{"n": {"N": "1"}}]}
+    # the envelope is left for botocore, so pagination keys keep their parsed shape
+    assert b"Items" not in response_dict["body"]
+    assert b"LastEvaluatedKey" in response_dict["body"]
+
+
+def test_error_responses_are_left_to_botocore():
+    response_dict = {"status_code": 400, "body": b'{"__type":"ValidationException"}'}
+    customized: dict = {}
+
+    _decode_item_payload(response_dict=response_dict, customized_response_dict=customized)
+
+    assert customized == {}
+    assert response_dict["body"] == b'{"__type":"ValidationException"}'
+
+
+async def test_reads_decode_binary_items_from_the_wire_format(db):
+    await db.create_table(Blob)
+    for chunk in (b"\x00", b"\x01", b"\x02"):
+        await db.put(Blob(blob_id="b1", chunk=chunk, data=b"\xff" + chunk, tags={chunk}, size=2))
+
+    c: DynamoDBClient
+    async with db._client() as c:
+        raw = await c.get_item(TableName="blobs", Key={"blob_id": {"S": "b1"}, "chunk": {"B": b"\x00"}})
+    assert raw["Item"]["data"] == {"B": "/wA="}
+
+    fetched = await db.get(Blob, hash_key="b1", range_key=b"\x00")
+    assert fetched == Blob(blob_id="b1", chunk=b"\x00", data=b"\xff\x00", tags={b"\x00"}, size=2)
+
+    pages = [page async for page in db.query(Blob, key_condition_expression=Key("blob_id").eq("b1"), limit=2)]
+    assert [item.chunk for page in pages for item in page.items] == [b"\x00", b"\x01", b"\x02"]
+    assert pages[0].last_evaluated_key == {"blob_id": "b1", "chunk": b"\x01"}
+
+    result = await db.batch_get([BatchGet(Blob, hash_key="b1", range_key=b"\x02")], trusted=True)
+    assert result.items[Blob] == [Blob(blob_id="b1", chunk=b"\x02", data=b"\xff\x02", tags={b"\x02"}, size=2)]
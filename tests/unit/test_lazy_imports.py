@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+import aiodynamodb
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    probe = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def test_package_import_loads_no_aws_dependencies():
+    loaded = _loaded_modules("import aiodynamodb")
+
+    assert not loaded & {"boto3", "botocore", "aioboto3", "aiobotocore", "pydantic"}
+
+
+def test_models_do_not_load_the_client_stack():
+    loaded = _loaded_modules("from aiodynamodb import DynamoModel, HashKey, Param, UpdateAttr, table")
+
+    assert not loaded & {"aioboto3", "aiobotocore", "aiohttp", "types_aiobotocore_dynamodb", "aiodynamodb.client"}
+
+
+@pytest.mark.parametrize("name", aiodynamodb.__all__)
+def test_every_public_name_resolves(name):
+    assert getattr(aiodynamodb, name) is not None
+    assert name in dir(aiodynamodb)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        aiodynamodb.Missing  # noqa: B018
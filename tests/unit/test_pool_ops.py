@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from aiodynamodb import DynamoDB
+from aiodynamodb._pool import _ClientPool
+from tests.unit.entities import User
+
+
+def _pool(size: int, strategy) -> _ClientPool:
+    return _ClientPool([(None, object()) for _ in range(size)], strategy)
+
+
+def test_round_robin_cycles_through_clients():
+    pool = _pool(3, "round_robin")
+
+    assert [pool.acquire() for _ in range(5)] == [0, 1, 2, 0, 1]
+    assert pool.in_flight == [2, 2, 1]
+
+
+def test_least_loaded_picks_the_idlest_client():
+    pool = _pool(3, "least_loaded")
+    first, second, third = pool.acquire(), pool.acquire(), pool.acquire()
+    assert (first, second, third) == (0, 1, 2)
+
+    pool.release(1)
+    assert pool.acquire() == 1
+    pool.release(0)
+    pool.release(2)
+    assert pool.in_flight == [0, 1, 0]
+    assert pool.acquire() == 2
+    assert pool.acquire() == 0
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError, match="pool_size must be at least 1"):
+        DynamoDB(pool_size=0)
+
+
+async def test_requests_are_spread_over_pooled_clients(db):
+    await db.put(User(user_id="u1", name="Alice"))
+    used: list[int] = []
+
+    async with DynamoDB(pool_size=3) as pooled:
+        assert pooled.in_flight == [0, 0, 0]
+        pool = pooled._pool
+        assert pool is not None
+        assert len({id(client) for client in pool.clients}) == 3
+        for index, client in enumerate(pool.clients):
+            client.meta.events.register(
+                "provide-client-params.dynamodb.GetItem", lambda index=index, **kwargs: used.append(index)
+            )
+
+        items = await asyncio.gather(*(pooled.get(User, hash_key="u1") for _ in range(6)))
+
+        assert items == [User(user_id="u1", name="Alice")] * 6
+        assert sorted(used) == [0, 0, 1, 1, 2, 2]
+        assert pooled.in_flight == [0, 0, 0]
+    assert pooled.in_flight == []
+
+
+async def test_per_loop_clients_are_not_shared_across_event_loops(db):
+    await db.put(User(user_id="u1", name="Alice"))
+    shared = DynamoDB(per_loop=True)
+
+    async def use() -> tuple[object, User | None]:
+        client = await shared._ensure_client()
+        assert await shared._ensure_client() is client
+        fetched = await shared.get(User, hash_key="u1")
+        await shared.close()
+        return client, fetched
+
+    results = await asyncio.gather(*(asyncio.to_thread(asyncio.run, use()) for _ in range(3)))
+    main_client = await shared._ensure_client()
+    await shared.close()
+
+    assert [fetched for _, fetched in results] == [User(user_id="u1", name="Alice")] * 3
+    clients = [client for client, _ in results] + [main_client]
+    assert len({id(client) for client in clients}) == 4
+    assert shared._loop_pools == {}
+
+
+async def test_per_loop_clients_of_ended_loops_are_dropped(db):
+    await db.put(User(user_id="u1", name="Alice"))
+    shared = DynamoDB(per_loop=True)
+    sizes: list[int] = []
+
+    async def use_without_closing() -> None:
+        await shared.get(User, hash_key="u1")
+        sizes.append(len(shared._loop_pools))
+
+    for _ in range(4):
+        await asyncio.to_thread(asyncio.run, use_without_closing())
+
+    assert sizes == [1, 1, 1, 1]
+    assert len(shared._loop_locks) == 1
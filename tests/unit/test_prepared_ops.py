@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from pydantic_core import TzInfo
+
+from aiodynamodb import Param
+from aiodynamodb.projection import ProjectionAttr
+from tests.unit.entities import Basket, ComplexOrder, Item, Order
+
+
+async def test_prepared_query_binds_values_per_execution(db):
+    basket = Basket(items=[Item(qty=1, price=1.5, name="foo")])
+    for user, day, total in (("o1", 1, 10), ("o1", 2, 20), ("o1", 3, 30), ("o2", 1, 40)):
+        created_at = datetime(2020, 1, day, tzinfo=TzInfo())
+        await db.put(ComplexOrder(order_id=user, created_at=created_at, total=total, basket=basket))
+
+    prepared = db.prepare_query(
+        ComplexOrder,
+        key_condition_expression=Key("order_id").eq(Param("order_id")) & Key("created_at").gte(Param("since")),
+        filter_expression=Attr("total").lt(Param("max_total")) & Attr("basket.items.qty").eq(1),
+        projection_expression=[ProjectionAttr("order_id"), ProjectionAttr("total")],
+    )
+
+    since = datetime(2020, 1, 2, tzinfo=TzInfo())
+    assert [order.total async for order in prepared.items(order_id="o1", since=since, max_total=100)] == [20, 30]
+    assert [order.total async for order in prepared.items(order_id="o1", since=since, max_total=25)] == [20]
+    assert [order.total async for order in prepared.items(order_id="o2", since=since, max_total=100)] == []
+    assert prepared.parameters == {"order_id", "since", "max_total"}
+
+
+async def test_prepared_query_pages_follow_the_query_api(db):
+    for day in range(1, 4):
+        await db.put(Order(order_id="o1", created_at=f"2026-01-0{day}", total=day))
+
+    prepared = db.prepare_query(Order, key_condition_expression=Key("order_id").eq(Param("order_id")), limit=2)
+    pages = [page async for page in prepared.execute(order_id="o1")]
+    assert [[item.total for item in page.items] for page in pages] == [[1, 2], [3]]
+
+    resumed = [page async for page in prepared.execute(order_id="o1", exclusive_start_key=pages[0].last_evaluated_key)]
+    assert [item.total for page in resumed for item in page.items] == [3]
+
+
+async def test_prepared_scan_and_parameter_checks(db):
+    await db.put(Order(order_id="o1", created_at="2026-01-01", total=5))
+    await db.put(Order(order_id="o2", created_at="2026-01-01", total=50))
+
+    prepared = db.prepare_scan(Order, filter_expression=Attr("total").gte(Param("min_total")))
+    assert [order.order_id async for order in prepared.items(min_total=10)] == ["o2"]
+
+    with pytest.raises(TypeError, match=r"missing \['min_total'\], unexpected \['total'\]"):
+        [order async for order in prepared.items(total=10)]
@@ -1,3 +1,10 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import Field, ValidationError
+
+from aiodynamodb import DynamoModel, HashKey, client, table
+from aiodynamodb.client import _projected_model
 from aiodynamodb.projection import ProjectionAttr, ProjectionExpressionBuilder
 from tests.unit.entities import ComplexOrder, User
 
@@ -24,3 +31,42 @@ def test_projection_builder_serializes_nested_list_paths():
         "#n1": "items",
         "#n2": "qty",
     }
+
+
+def test_projected_models_are_built_once_per_projection():
+    projection = [ProjectionAttr("order_id"), ProjectionAttr("basket.items.qty")]
+
+    projected = _projected_model(ComplexOrder, projection)
+
+    assert _projected_model(ComplexOrder, list(projection)) is projected
+    assert _projected_model(ComplexOrder, [ProjectionAttr("order_id")]) is not projected
+    # only the projected top-level fields are part of the sub-model
+    order = projected.validate({"order_id": "o1", "total": 5})
+    assert order.model_fields_set == {"order_id"}
+
+
+def test_projected_model_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(client, "_PROJECTED_MODEL_CACHE_SIZE", len(client._projected_models))
+    projection = [ProjectionAttr("basket.items[0].qty")]
+
+    projected = _projected_model(ComplexOrder, projection)
+
+    assert _projected_model(ComplexOrder, projection) is not projected
+    assert projected.validate({"basket": {"items": []}}).model_fields_set == {"basket"}
+
+
+def test_projected_model_validates_present_fields_and_defaults_the_rest():
+    @table("projected_users")
+    class ProjectedUser(DynamoModel):
+        user_id: HashKey[str]
+        name: str
+        visits: int = 0
+        tags: list[str] = Field(default_factory=list)
+
+    projected = _projected_model(ProjectedUser, [ProjectionAttr("user_id"), ProjectionAttr("visits")])
+
+    user = projected.validate({"user_id": "u1", "visits": Decimal("3"), "ignored": "x"})
+    assert (user.user_id, user.visits, user.tags) == ("u1", 3, [])
+    assert "name" not in user.model_fields_set
+    with pytest.raises(ValidationError):
+        projected.validate({"user_id": "u1", "visits": "many"})
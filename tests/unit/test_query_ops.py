@@ -1,8 +1,15 @@
 from datetime import datetime
 
+import pytest
 from boto3.dynamodb.conditions import Attr, Key
+from pydantic import ValidationError
 from pydantic_core import TzInfo
+from types_aiobotocore_dynamodb import DynamoDBClient
 
+from aiodynamodb._util import _add_filter_expressions, _condition_templates, _key_condition_expressions
+from aiodynamodb.client import _to_model
+from aiodynamodb.conditions import CustomConditionExpressionBuilder
+from aiodynamodb.projection import ProjectionAttr
 from tests.unit.entities import Basket, ComplexOrder, Item, Order
 
 
@@ -179,6 +186,33 @@ async def test_query_serializes_custom_key_condition_values(db):
     assert [item.total for item in filtered] == [200, 300]
 
 
+def _uncached_query_args(key_condition, filter_expression):
+    builder = CustomConditionExpressionBuilder(ComplexOrder)
+    key = builder.build_expression(key_condition, is_key_condition=True)
+    condition = builder.build_expression(filter_expression)
+    return {
+        "KeyConditionExpression": key.condition_expression,
+        "FilterExpression": condition.condition_expression,
+        "ExpressionAttributeNames": key.attribute_name_placeholders | condition.attribute_name_placeholders,
+        "ExpressionAttributeValues": key.attribute_value_placeholders | condition.attribute_value_placeholders,
+    }
+
+
+def test_expressions_of_the_same_shape_reuse_a_cached_template():
+    _condition_templates.clear()
+    for day, qty in ((1, [1, 2]), (2, [3, 4]), (3, [5, 6])):
+        key_condition = Key("order_id").eq(f"o{day}") & Key("created_at").gte(datetime(2020, 1, day, tzinfo=TzInfo()))
+        filter_expression = Attr("basket.items.qty").is_in(qty) | Attr("total").between(day, day * 10)
+        builder = CustomConditionExpressionBuilder(ComplexOrder)
+        args: dict = dict(_key_condition_expressions(ComplexOrder, key_condition, builder=builder))
+        _add_filter_expressions(ComplexOrder, filter_expression, query_args=args, builder=builder)
+
+        assert args == _uncached_query_args(key_condition, filter_expression)
+
+    # one template for the key condition and one for the filter
+    assert len(_condition_templates) == 2
+
+
 async def test_query_returns_model_instances(db):
     await db.put(Order(order_id="o1", created_at="2026-01-01", total=100))
     await db.put(Order(order_id="o1", created_at="2026-01-02", total=200))
@@ -240,3 +274,49 @@ async def test_deep_filter(db):
         filtered.extend(page.items)
 
     assert [item.total for item in filtered] == [300]
+
+
+async def test_query_pages_match_per_item_validation(db):
+    basket = Basket(items=[Item(qty=1, price=10.9, name="foo")])
+    for day in (1, 2, 3):
+        await db.put(
+            ComplexOrder(order_id="o1", created_at=datetime(2020, 1, day, tzinfo=TzInfo()), total=day, basket=basket)
+        )
+
+    c: DynamoDBClient
+    async with db._client() as c:
+        raw = (
+            await c.query(**{
+                "TableName": "complex_orders",
+                "KeyConditionExpression": "order_id = :o",
+                "ExpressionAttributeValues": {":o": {"S": "o1"}},
+            })
+        )["Items"]
+
+    pages = [page async for page in db.query(ComplexOrder, key_condition_expression=Key("order_id").eq("o1"))]
+    assert pages[0].items == [_to_model(item, ComplexOrder) for item in raw]
+
+    projected = [
+        page
+        async for page in db.query(
+            ComplexOrder,
+            key_condition_expression=Key("order_id").eq("o1"),
+            projection_expression=[ProjectionAttr("order_id"), ProjectionAttr("total")],
+        )
+    ]
+    assert [(item.order_id, item.total) for item in projected[0].items] == [("o1", 1), ("o1", 2), ("o1", 3)]
+    assert projected[0].items[0].model_fields_set == {"order_id", "total"}
+
+
+async def test_query_page_validation_reports_the_failing_item(db):
+    await db.put(Order(order_id="o1", created_at="2026-01-01", total=1))
+    c: DynamoDBClient
+    async with db._client() as c:
+        await c.put_item(
+            TableName="orders",
+            Item={"order_id": {"S": "o1"}, "created_at": {"S": "2026-01-02"}, "total": {"S": "many"}},
+        )
+
+    with pytest.raises(ValidationError, match="total"):
+        async for _ in db.query(Order, key_condition_expression=Key("order_id").eq("o1")):
+            pass
@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError, ConnectionClosedError, EndpointConnectionError, ParamValidationError
+
+from aiodynamodb import BatchPut, DynamoDB, RetryPolicy
+from aiodynamodb.retry import _is_retryable, _RetryBudget
+from tests.unit.entities import User
+
+
+def _error(code: str, **response) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}, **response}, "Operation")
+
+
+@pytest.mark.parametrize(
+    ("error", "retryable"),
+    [
+        (_error("ProvisionedThroughputExceededException"), True),
+        (_error("ThrottlingException"), True),
+        (_error("InternalServerError"), True),
+        (_error("ConditionalCheckFailedException"), False),
+        (_error("ValidationException"), False),
+        (
+            _error(
+                "TransactionCanceledException", CancellationReasons=[{"Code": "None"}, {"Code": "TransactionConflict"}]
+            ),
+            True,
+        ),
+        (_error("TransactionCanceledException", CancellationReasons=[{"Code": "ConditionalCheckFailed"}]), False),
+        (EndpointConnectionError(endpoint_url="http://localhost"), True),
+        (ConnectionClosedError(endpoint_url="http://localhost"), True),
+        (ParamValidationError(report="bad"), False),
+    ],
+)
+def test_retryable_errors_are_classified(error, retryable):
+    assert _is_retryable(error) is retryable
+
+
+def test_delay_is_jittered_below_the_capped_ceiling():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+    assert all(0 <= policy.delay(1) <= 0.1 for _ in range(100))
+    assert all(0 <= policy.delay(8) <= 0.3 for _ in range(100))
+    with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+        RetryPolicy(max_attempts=0)
+
+
+def test_budget_stops_retries_above_the_failure_ratio():
+    budget = _RetryBudget(RetryPolicy(failure_ratio=0.25, min_requests=4))
+    for _ in range(3):
+        budget.record(failed=False)
+    budget.record(failed=True)
+    assert budget.allows_retry()
+
+    budget.record(failed=True)
+    assert not budget.allows_retry()
+
+
+def _throttle(calls: list[str], failures: int):
+    def handler(model, **kwargs):
+        calls.append(model.name)
+        if len(calls) <= failures:
+            error = {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}}
+            return SimpleNamespace(status_code=400, headers={}), error
+        return None
+
+    return handler
+
+
+async def test_throttled_requests_are_retried(db):
+    calls: list[str] = []
+    async with DynamoDB(retry=RetryPolicy(base_delay=0)) as retrying:
+        client = await retrying._ensure_client()
+        client.meta.events.register("before-call.dynamodb.PutItem", _throttle(calls, failures=2))
+
+        await retrying.put(User(user_id="u1", name="Alice"))
+
+    assert calls == ["PutItem"] * 3
+    assert await db.get(User, hash_key="u1") == User(user_id="u1", name="Alice")
+
+
+async def test_connection_errors_are_retried_and_count_against_the_budget(db):
+    calls: list[str] = []
+
+    def disconnect(model, **kwargs):
+        calls.append(model.name)
+        if len(calls) <= 2:
+            raise EndpointConnectionError(endpoint_url="http://localhost")
+
+    async with DynamoDB(retry=RetryPolicy(base_delay=0)) as retrying:
+        client = await retrying._ensure_client()
+        client.meta.events.register("before-call.dynamodb.PutItem", disconnect)
+
+        await retrying.put(User(user_id="u1", name="Alice"))
+
+        budget = retrying._retry_budgets["users"]
+        assert (sum(budget._requests), sum(budget._failures)) == (3, 2)
+    assert calls == ["PutItem"] * 3
+    assert await db.get(User, hash_key="u1") == User(user_id="u1", name="Alice")
+
+
+async def test_retries_stop_after_max_attempts_or_when_the_budget_is_spent(db):
+    calls: list[str] = []
+    async with DynamoDB(retry=RetryPolicy(max_attempts=3, base_delay=0)) as retrying:
+        ex = await retrying.exceptions()
+        client = await retrying._ensure_client()
+        client.meta.events.register("before-call.dynamodb.PutItem", _throttle(calls, failures=10))
+
+        with pytest.raises(ex.ProvisionedThroughputExceededException):
+            await retrying.put(User(user_id="u1", name="Alice"))
+        assert len(calls) == 3
+
+        calls.clear()
+        retrying._retry_budgets.clear()
+        retrying.retry = RetryPolicy(base_delay=0, failure_ratio=0, min_requests=1)
+        with pytest.raises(ex.ProvisionedThroughputExceededException):
+            await retrying.put(User(user_id="u1", name="Alice"))
+        assert len(calls) == 1
+
+
+async def test_unprocessed_batch_items_are_retried(db):
+    sent: list[dict] = []
+
+    def capture(params, **kwargs):
+        sent.append(params["RequestItems"])
+
+    def unprocessed_once(**kwargs):
+        if len(sent) == 1:
+            return SimpleNamespace(status_code=200, headers={}), {"UnprocessedItems": sent[0]}
+        return None
+
+    async with DynamoDB(retry=RetryPolicy(base_delay=0)) as retrying:
+        client = await retrying._ensure_client()
+        client.meta.events.register("provide-client-params.dynamodb.BatchWriteItem", capture)
+        client.meta.events.register("before-call.dynamodb.BatchWriteItem", unprocessed_once)
+
+        result = await retrying.batch_write([BatchPut(User(user_id=f"u{index}", name="x")) for index in range(3)])
+
+    assert result.unprocessed_items == {}
+    assert len(sent) == 2
+    assert [await db.get(User, hash_key=f"u{index}") is not None for index in range(3)] == [True] * 3
@@ -0,0 +1,115 @@
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+
+from aiodynamodb import DynamoModel, HashKey, table
+from tests.unit.entities import Basket, Item, Order, User
+
+
+@table("save_profiles")
+class Profile(DynamoModel):
+    profile_id: HashKey[str]
+    name: str
+    bio: str | None = None
+    tags: set[str] = set()
+    basket: Basket | None = None
+
+
+async def _capture_requests(db) -> list[tuple[str, dict]]:
+    requests: list[tuple[str, dict]] = []
+
+    def capture(params, model, **kwargs):
+        requests.append((model.name, params))
+
+    client = await db._ensure_client()
+    client.meta.events.register("provide-client-params.dynamodb", capture)
+    return requests
+
+
+async def test_save_sends_only_changed_fields(db):
+    await db.create_table(Profile)
+    await db.put(Profile(profile_id="p1", name="Alice", bio="hi", tags={"a"}))
+    requests = await _capture_requests(db)
+
+    profile = await db.get(Profile, hash_key="p1")
+    assert profile is not None
+    assert not profile.dirty_fields
+    profile.name = "Alice"
+    assert await db.save(profile) is False
+
+    profile.name = "Alicia"
+    profile.bio = None
+    profile.basket = Basket(items=[Item(qty=1, price=2.5, name="x")])
+    assert profile.dirty_fields == {"name", "bio", "basket"}
+    assert await db.save(profile) is True
+    assert not profile.dirty_fields
+
+    operations = [operation for operation, _ in requests]
+    assert operations == ["GetItem", "UpdateItem"]
+    update = requests[-1][1]
+    assert update["UpdateExpression"] == "SET #s0 = :s0, #s2 = :s2 REMOVE #s1"
+    assert update["ExpressionAttributeNames"] == {"#s0": "name", "#s1": "bio", "#s2": "basket"}
+    assert await db.get(Profile, hash_key="p1") == Profile(
+        profile_id="p1", name="Alicia", tags={"a"}, basket=Basket(items=[Item(qty=1, price=2.5, name="x")])
+    )
+
+
+async def test_save_in_place_mutations_and_conditions(db):
+    await db.create_table(Profile)
+    await db.put(Profile(profile_id="p1", name="Alice", tags={"a"}))
+    [profile] = [item async for page in db.scan(Profile) for item in page.items]
+
+    profile.tags.add("b")
+    assert not profile.dirty_fields
+    profile.mark_dirty("tags")
+    ex = await db.exceptions()
+    with pytest.raises(ex.ConditionalCheckFailedException):
+        await db.save(profile, condition_expression=Attr("name").eq("Bob"))
+    assert profile.dirty_fields == {"tags"}
+
+    assert await db.save(profile, condition_expression=Attr("name").eq("Alice")) is True
+    assert (await db.get(Profile, hash_key="p1")) == Profile(profile_id="p1", name="Alice", tags={"a", "b"})
+    with pytest.raises(ValueError, match="Unknown field 'nope'"):
+        profile.mark_dirty("nope")
+
+
+async def test_save_puts_untracked_instances_and_rejects_key_changes(db):
+    user = User(user_id="u1", name="Alice")
+    assert await db.save(user) is True
+    assert await db.get(User, hash_key="u1") == user
+
+    user.email = "alice@example.com"
+    assert user.dirty_fields == {"email"}
+    assert await db.save(user) is True
+    assert await db.get(User, hash_key="u1") == User(user_id="u1", name="Alice", email="alice@example.com")
+
+    await db.put(Order(order_id="o1", created_at="2026-01-01", total=1))
+    [order] = [
+        item async for page in db.query(Order, key_condition_expression=Key("order_id").eq("o1")) for item in page.items
+    ]
+    order.created_at = "2026-01-02"
+    with pytest.raises(ValueError, match=r"changed key field\(s\) \['created_at'\]"):
+        await db.save(order)
+
+
+async def test_copies_track_changes_apart_from_the_original(db):
+    await db.create_table(Profile)
+    await db.put(Profile(profile_id="p1", name="Alice", bio="hi", tags={"a"}))
+    profile = await db.get(Profile, hash_key="p1")
+    assert profile is not None
+
+    renamed = profile.model_copy(update={"name": "Alicia"})
+    assert renamed.dirty_fields == {"name"}
+    assert not profile.dirty_fields
+
+    profile.bio = "hello"
+    copied = profile.model_copy()
+    deep = profile.model_copy(deep=True)
+    copied.bio = "hi"
+    assert profile.dirty_fields == {"bio"}
+    assert not copied.dirty_fields
+    assert deep.dirty_fields == {"bio"}
+
+    assert await db.save(renamed) is True
+    assert renamed.dirty_fields == frozenset()
+    assert profile.dirty_fields == {"bio"}
+    assert await db.get(Profile, hash_key="p1") == Profile(profile_id="p1", name="Alicia", bio="hi", tags={"a"})
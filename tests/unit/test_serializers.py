@@ -1,18 +1,31 @@
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Any
 
 import pytest
-from pydantic import BaseModel
+from boto3.dynamodb.types import TypeSerializer
+from pydantic import BaseModel, field_serializer, field_validator
 
+from aiodynamodb import DynamoModel, HashKey, RangeKey, table
 from aiodynamodb._serializers import (
     DESERIALIZER,
     SERIALIZER,
     _extract_nested_model,
+    _model_decoder,
+    _model_encoder,
     _resolve_key_annotation,
     _serialize_custom_attribute,
+    _serialize_dynamo_primitives,
 )
-from aiodynamodb.custom_types import Timestamp
+from aiodynamodb.custom_types import JSONStr, Timestamp, TimestampMillis
+from tests.unit.entities import Basket, ComplexOrder, Item
+
+
+def _reference_to_dynamo(model: BaseModel) -> dict[str, Any]:
+    """The model_dump + TypeSerializer path the compiled encoder replaces."""
+    serializer = TypeSerializer()
+    dumped = model.model_dump(mode="python", exclude_none=True)
+    return {k: serializer.serialize(_serialize_dynamo_primitives(v)) for k, v in dumped.items()}
 
 
 @pytest.mark.parametrize(
@@ -68,6 +81,16 @@ def test_serializer_casts_nested_floats_to_decimal():
     assert serialized["M"]["items"]["L"][1]["M"]["tax"] == {"N": "0.1"}
 
 
+def test_to_dynamo_compatible_is_deprecated():
+    @table("priced")
+    class Priced(DynamoModel):
+        pk: HashKey[str]
+        price: float
+
+    with pytest.warns(DeprecationWarning, match="use to_dynamo"):
+        assert Priced(pk="p", price=1.5).to_dynamo_compatible() == {"pk": "p", "price": Decimal("1.5")}
+
+
 def test_serialize_custom_attribute_supports_nested_model_paths():
     class BazModel(BaseModel):
         baz: Timestamp
@@ -93,3 +116,155 @@ def test_serialize_custom_attribute_supports_indexed_nested_paths():
     value = datetime(2020, 1, 1, tzinfo=UTC)
     serialized = _serialize_custom_attribute(FooModel, "foo[0].baz", value)
     assert serialized == int(value.timestamp())
+
+
+def test_compiled_encoder_matches_model_dump_path():
+    class Node(BaseModel):
+        name: str
+        children: list["Node"] = []
+        seen_at: datetime | None = None
+
+    @table("encoded")
+    class Encoded(DynamoModel):
+        pk: HashKey[str]
+        sk: RangeKey[TimestampMillis]
+        payload: JSONStr[Item]
+        blob: bytes = b"x"
+        amount: Decimal = Decimal("1.50")
+        ratio: float = 3
+        tags: set[str] = {"a"}
+        prices: list[float] = [1.1, 2]
+        by_name: dict[str, Item] = {}
+        maybe: Item | None = None
+        slots: list[Item | None] = []
+        anything: Any = None
+        node: Node
+
+    encoded = Encoded(
+        pk="p",
+        sk=datetime(2020, 1, 1, tzinfo=UTC),
+        payload=Item(qty=1, price=1.5, name="x"),
+        by_name={"a": Item(qty=2, price=2.0, name="y")},
+        slots=[None, Item(qty=3, price=1e-7, name="z")],
+        anything={"k": Item(qty=1, price=0.1, name="q"), "l": [1, None]},
+        node=Node(name="root", children=[Node(name="child", seen_at=datetime(2020, 1, 1))]),
+    )
+
+    assert _model_encoder(Encoded) is not None
+    assert encoded.to_dynamo() == _reference_to_dynamo(encoded)
+
+    order = ComplexOrder(
+        order_id="o1",
+        created_at=datetime(2020, 1, 1, tzinfo=UTC),
+        total=1,
+        basket=Basket(items=[Item(qty=1, price=10.9, name="a")]),
+    )
+    assert order.to_dynamo() == _reference_to_dynamo(order)
+
+
+def test_compiled_encoder_falls_back_for_custom_serializers():
+    class Doubled(BaseModel):
+        value: int
+
+        @field_serializer("value")
+        def _double(self, value: int) -> int:
+            return value * 2
+
+    @table("doubled")
+    class Wrapper(DynamoModel):
+        pk: HashKey[str]
+        inner: Doubled
+
+    assert _model_encoder(Doubled) is None
+    wrapper = Wrapper(pk="p", inner=Doubled(value=2))
+    assert wrapper.to_dynamo()["inner"] == {"M": {"value": {"N": "4"}}}
+
+
+def test_compiled_decoder_produces_field_types_directly():
+    @table("decoded")
+    class Decoded(DynamoModel):
+        pk: HashKey[str]
+        count: int
+        ratio: float
+        blob: bytes
+        basket: Basket
+        by_name: dict[str, Item] = {}
+        maybe: Item | None = None
+
+    raw = {
+        "pk": {"S": "p"},
+        "count": {"N": "3"},
+        "ratio": {"N": "0.5"},
+        "blob": {"B": b"\x00\x01"},
+        "basket": {"M": {"items": {"L": [{"M": {"qty": {"N": "1"}, "price": {"N": "10.9"}, "name": {"S": "a"}}}]}}},
+        "by_name": {"M": {"x": {"M": {"qty": {"N": "2"}, "price": {"N": "1"}, "name": {"S": "b"}}}}},
+        "maybe": {"NULL": True},
+        "not_a_field": {"S": "ignored"},
+    }
+
+    decoded = _model_decoder(Decoded)(raw)
+    assert decoded == {
+        "pk": "p",
+        "count": 3,
+        "ratio": 0.5,
+        "blob": b"\x00\x01",
+        "basket": {"items": [{"qty": 1, "price": 10.9, "name": "a"}]},
+        "by_name": {"x": {"qty": 2, "price": 1.0, "name": "b"}},
+        "maybe": None,
+    }
+    assert type(decoded["count"]) is int
+    assert Decoded.from_dynamo(raw) == Decoded.model_validate({k: DESERIALIZER._to_dynamo(v) for k, v in raw.items()})
+
+
+def test_compiled_decoder_only_builds_decimals_for_decimal_fields():
+    @table("metrics")
+    class Metrics(DynamoModel):
+        pk: HashKey[str]
+        seen_at: RangeKey[Timestamp]
+        value: int | float
+        samples: set[int]
+        weights: frozenset[float]
+        exact: Decimal
+        by_host: dict[str, int | float] = {}
+        extra: Any = None
+
+    raw = {
+        "pk": {"S": "p"},
+        "seen_at": {"N": "1700000000"},
+        "value": {"N": "1.5"},
+        "samples": {"NS": ["1", "2"]},
+        "weights": {"NS": ["0.25"]},
+        "exact": {"N": "0.1"},
+        "by_host": {"M": {"a": {"N": "3"}, "b": {"N": "3.5"}}},
+        "extra": {"N": "7"},
+    }
+
+    decoded = _model_decoder(Metrics)(raw)
+    assert decoded == {
+        "pk": "p",
+        "seen_at": 1700000000,
+        "value": 1.5,
+        "samples": {1, 2},
+        "weights": {0.25},
+        "exact": Decimal("0.1"),
+        "by_host": {"a": 3, "b": 3.5},
+        "extra": Decimal("7"),
+    }
+    assert type(decoded["seen_at"]) is int
+    assert [type(v) for v in decoded["by_host"].values()] == [int, float]
+    # untyped attributes keep the schema-less Decimal
+    assert type(decoded["extra"]) is Decimal
+    assert Metrics.from_dynamo(raw) == Metrics.model_validate({k: DESERIALIZER._to_dynamo(v) for k, v in raw.items()})
+
+
+def test_compiled_decoder_keeps_raw_input_for_before_validators():
+    class Tagged(BaseModel):
+        value: int
+
+        @field_validator("value", mode="before")
+        @classmethod
+        def _passthrough(cls, value: Any) -> Any:
+            return value
+
+    # the validator sees the same schema-less input as before the compiled decoder
+    assert type(_model_decoder(Tagged)({"value": {"N": "7"}})["value"]) is Decimal
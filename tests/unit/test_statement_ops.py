@@ -0,0 +1,84 @@
+from aiodynamodb import BatchStatement
+from tests.unit.entities import Order, User
+
+
+async def test_execute_decodes_items_and_follows_next_token(db):
+    for index in range(3):
+        await db.put(Order(order_id="o1", created_at=f"2026-01-0{index + 1}", total=index))
+    await db.put(Order(order_id="o2", created_at="2026-01-01", total=9))
+
+    result = await db.execute(Order, 'SELECT * FROM "orders" WHERE order_id = ?', ["o1"], limit=2)
+    items = result.items
+    while result.next_token is not None:
+        result = await db.execute(
+            Order, 'SELECT * FROM "orders" WHERE order_id = ?', ["o1"], next_token=result.next_token
+        )
+        items += result.items
+
+    assert sorted(items, key=lambda order: order.created_at) == [
+        Order(order_id="o1", created_at=f"2026-01-0{index + 1}", total=index) for index in range(3)
+    ]
+
+
+async def test_execute_runs_writes(db):
+    await db.put(User(user_id="u1", name="Alice"))
+
+    result = await db.execute(User, 'UPDATE "users" SET email = ? WHERE user_id = ?', ["a@example.com", "u1"])
+
+    assert result.items == []
+    assert await db.get(User, hash_key="u1") == User(user_id="u1", name="Alice", email="a@example.com")
+
+
+async def test_batch_execute_returns_items_and_errors_in_order(db):
+    await db.put(User(user_id="u1", name="Alice"))
+    await db.put(User(user_id="u2", name="Bob"))
+
+    results = await db.batch_execute([
+        BatchStatement(User, "SELECT * FROM users WHERE user_id = ?", ["u2"]),
+        BatchStatement(User, "SELECT * FROM users WHERE user_id = ?", ["missing"]),
+        BatchStatement(User, "SELECT * FROM users WHERE user_id = ?", ["u1"]),
+    ])
+
+    assert [result.item for result in results] == [
+        User(user_id="u2", name="Bob"),
+        None,
+        User(user_id="u1", name="Alice"),
+    ]
+    assert all(result.error is None for result in results)
+
+
+async def test_batch_execute_splits_requests_of_25(db):
+    for index in range(30):
+        await db.put(User(user_id=f"u{index}", name=f"user {index}"))
+    calls: list[int] = []
+
+    def capture(params, **kwargs):
+        calls.append(len(params["Statements"]))
+
+    client = await db._ensure_client()
+    client.meta.events.register("provide-client-params.dynamodb.BatchExecuteStatement", capture)
+    results = await db.batch_execute([
+        BatchStatement(User, "SELECT * FROM users WHERE user_id = ?", [f"u{index}"]) for index in range(30)
+    ])
+
+    assert sorted(calls) == [5, 25]
+    assert [result.item.name for result in results if result.item] == [f"user {index}" for index in range(30)]
+
+
+async def test_batch_execute_requests_name_only_their_own_tables(db, monkeypatch):
+    await db.put(User(user_id="u1", name="Alice"))
+    await db.put(Order(order_id="o1", created_at="2026-01-01", total=1))
+    request = db._request
+    table_names: list[set[str]] = []
+
+    async def capture(operation, tables, **args):
+        table_names.append(set(tables))
+        return await request(operation, tables, **args)
+
+    monkeypatch.setattr(db, "_request", capture)
+    await db.batch_execute([
+        *(BatchStatement(User, "SELECT * FROM users WHERE user_id = ?", ["u1"]) for _ in range(25)),
+        BatchStatement(Order, "SELECT * FROM orders WHERE order_id = ?", ["o1"]),
+    ])
+
+    assert table_names == [{"users"}, {"orders"}]
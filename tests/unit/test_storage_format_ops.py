@@ -1,11 +1,16 @@
+import base64
+import zlib
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel
+import pytest
+from pydantic import AfterValidator, BaseModel, TypeAdapter
 from pydantic_core import TzInfo
 from types_aiobotocore_dynamodb import DynamoDBClient
 
 from aiodynamodb import DynamoModel, HashKey, RangeKey, table
-from aiodynamodb.custom_types import JSONStr, Timestamp, TimestampMillis
+from aiodynamodb.custom_types import Compressed, Compression, JSONStr, Timestamp, TimestampMillis
+from aiodynamodb.projection import ProjectionAttr
 from tests.unit.entities import Basket, Item
 
 
@@ -66,3 +71,90 @@ async def test_items_are_stored_in_the_correct_raw_format(db):
         total=300,
         basket=Basket(items=[Item(qty=1, price=10.9, name="foo")]),
     )
+
+
+async def test_compressed_attributes_are_stored_as_binary(db):
+    class Settings(BaseModel):
+        flags: dict[str, bool]
+        created: datetime
+
+    @table("configs")
+    class Config(DynamoModel):
+        config_id: HashKey[str]
+        settings: Compressed[Settings]
+        blob: Compressed[bytes]
+        small: Annotated[Settings, Compression(threshold=1_000_000)]
+
+    await db.create_table(Config)
+    settings = Settings(
+        flags={f"flag_{i}": i % 2 == 0 for i in range(200)}, created=datetime(2020, 1, 3, tzinfo=TzInfo())
+    )
+    config = Config(config_id="c1", settings=settings, blob=b"\x00" * 4096, small=settings)
+    await db.put(config)
+
+    c: DynamoDBClient
+    async with db._client() as c:
+        item = (await c.get_item(TableName="configs", Key={"config_id": {"S": "c1"}}))["Item"]
+    # item payloads are read straight from the response body, binary is still base64
+    raw = {name: base64.b64decode(value["B"]) for name, value in item.items() if "B" in value}
+
+    assert len(raw["settings"]) < len(settings.model_dump_json()) // 4
+    assert zlib.decompress(raw["blob"][5:]) == b"\x00" * 4096
+    # below the threshold the JSON payload is stored as is
+    assert raw["small"] == settings.model_dump_json().encode()
+
+    assert await db.get(Config, hash_key="c1") == config
+    assert await db.get(Config, hash_key="c1", trusted=True) == config
+
+
+async def test_projected_reads_apply_annotated_metadata(db):
+    class Settings(BaseModel):
+        flags: dict[str, bool]
+
+    @table("annotated_configs")
+    class Config(DynamoModel):
+        config_id: HashKey[str]
+        settings: Annotated[Settings, Compression(threshold=0)]
+        owner: Annotated[str, AfterValidator(str.lower)]
+
+    await db.create_table(Config)
+    settings = Settings(flags={"dark": True})
+    await db.put(Config(config_id="c1", settings=settings, owner="alice"))
+    c: DynamoDBClient
+    async with db._client() as c:
+        await c.update_item(
+            TableName="annotated_configs",
+            Key={"config_id": {"S": "c1"}},
+            UpdateExpression="SET #o = :o",
+            ExpressionAttributeNames={"#o": "owner"},
+            ExpressionAttributeValues={":o": {"S": "ALICE"}},
+        )
+
+    projected = await db.get(
+        Config, hash_key="c1", projection_expression=[ProjectionAttr("settings"), ProjectionAttr("owner")]
+    )
+
+    assert projected is not None
+    assert projected.settings == settings
+    assert projected.owner == "alice"
+
+
+def test_compression_round_trips_through_validation():
+    blob = TypeAdapter(Compressed[bytes])
+
+    stored = blob.dump_python(b"a" * 2048)
+    assert stored.startswith(b"\x00adc\x01")
+    assert blob.validate_python(stored) == b"a" * 2048
+    # short blobs are stored untouched and validated back as they are
+    assert blob.dump_python(b"short") == b"short"
+    assert blob.validate_python(b"short") == b"short"
+
+
+def test_zstd_compression_round_trips():
+    pytest.importorskip("zstandard")
+    adapter = TypeAdapter(Annotated[bytes, Compression("zstd", threshold=0)])
+
+    stored = adapter.dump_python(b"z" * 1024)
+
+    assert stored.startswith(b"\x00adc\x02")
+    assert adapter.validate_python(stored) == b"z" * 1024
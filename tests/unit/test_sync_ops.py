@@ -0,0 +1,66 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from boto3.dynamodb.conditions import Key
+
+from aiodynamodb import BatchGet, BatchPut, SyncDynamoDB
+from tests.unit.entities import Order, User
+
+
+async def test_sync_facade_reuses_one_client(db):
+    with SyncDynamoDB() as sync_db:
+        client = sync_db._run(sync_db.db._ensure_client())
+        sync_db.put(User(user_id="u1", name="Alice"))
+        sync_db.batch_write([BatchPut(User(user_id="u2", name="Bob"))])
+
+        assert sync_db.get(User, hash_key="u1") == User(user_id="u1", name="Alice")
+        result = sync_db.batch_get([BatchGet(User, hash_key="u2")])
+        assert result.items[User] == [User(user_id="u2", name="Bob")]
+        assert sync_db._run(sync_db.db._ensure_client()) is client
+
+    assert sync_db._loop.is_closed()
+    assert not sync_db._thread.is_alive()
+
+
+async def test_sync_query_iterates_pages(db):
+    with SyncDynamoDB() as sync_db:
+        for index in range(5):
+            sync_db.put(Order(order_id="o1", created_at=f"2026-01-0{index + 1}", total=index))
+
+        pages = list(sync_db.query(Order, key_condition_expression=Key("order_id").eq("o1"), limit=2))
+
+        assert [len(page.items) for page in pages] == [2, 2, 1]
+        assert [order.total for order in next(sync_db.scan(Order, limit=10)).items] == [0, 1, 2, 3, 4]
+
+
+async def test_sync_calls_from_several_threads_run_concurrently(db):
+    in_flight = 0
+    all_in_flight = asyncio.Event()
+
+    async def barrier(**kwargs):
+        # every GetItem waits until all four are in flight; serialized calls would time out
+        nonlocal in_flight
+        in_flight += 1
+        if in_flight == 4:
+            all_in_flight.set()
+        await asyncio.wait_for(all_in_flight.wait(), timeout=5)
+
+    with SyncDynamoDB() as sync_db, ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda index: sync_db.put(User(user_id=f"u{index}", name=str(index))), range(4)))
+        client = sync_db._run(sync_db.db._ensure_client())
+        client.meta.events.register("before-call.dynamodb.GetItem", barrier)
+        fetched = list(executor.map(lambda index: sync_db.get(User, hash_key=f"u{index}"), range(4)))
+
+    assert [user.name for user in fetched if user] == [str(index) for index in range(4)]
+    assert in_flight == 4
+
+
+async def test_sync_facade_rejects_calls_from_its_loop_thread(db):
+    with SyncDynamoDB() as sync_db:
+
+        async def nested():
+            return sync_db.get(User, hash_key="u1")
+
+        with pytest.raises(RuntimeError, match="own event loop thread"):
+            sync_db._run(nested())
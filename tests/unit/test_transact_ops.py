@@ -8,6 +8,7 @@ from aiodynamodb import (
     DynamoDB,
     DynamoModel,
     HashKey,
+    Param,
     ProjectionAttr,
     TransactConditionCheck,
     TransactDelete,
@@ -117,6 +118,24 @@ async def test_transact_write_supports_update_operation(db):
     assert updated.total == 250
 
 
+async def test_transact_write_supports_prepared_update(db):
+    await db.put(User(user_id="u1", name="Alice"))
+    await db.put(User(user_id="u2", name="Bob"))
+    rename = db.prepare_update(
+        User,
+        update_expression={UpdateAttr("name").set(Param("name"))},
+        condition_expression=Attr("name").eq(Param("expected")),
+    )
+
+    await db.transact_write([
+        rename.transact(hash_key="u1", name="Alicia", expected="Alice"),
+        rename.transact(hash_key="u2", name="Robert", expected="Bob"),
+    ])
+
+    assert await db.get(User, hash_key="u1") == User(user_id="u1", name="Alicia")
+    assert await db.get(User, hash_key="u2") == User(user_id="u2", name="Robert")
+
+
 async def test_transact_write_update_serializes_timestamp_fields(db):
     @table("transact_update_events")
     class Event(DynamoModel):
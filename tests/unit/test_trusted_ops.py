@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from boto3.dynamodb.conditions import Key
+from pydantic import BaseModel
+from pydantic_core import TzInfo
+
+from aiodynamodb import BatchGet, DynamoModel, HashKey, ProjectionAttr, RangeKey, table
+from aiodynamodb.custom_types import JSONStr, Timestamp, TimestampMillis
+from tests.unit.entities import Basket, ComplexOrder, Item, Order, User
+
+
+async def test_trusted_get_builds_models_without_validation(db, monkeypatch):
+    class Settings(BaseModel):
+        enabled: bool
+        label: str
+
+    @table("trusted_settings")
+    class Stored(DynamoModel):
+        key: HashKey[str]
+        created_at: RangeKey[Timestamp]
+        seen_at: TimestampMillis
+        settings: JSONStr[Settings]
+        basket: Basket
+        tags: tuple[str, ...] = ()
+
+    await db.create_table(Stored)
+    created_at = datetime(2020, 1, 3, tzinfo=TzInfo())
+    stored = Stored(
+        key="k1",
+        created_at=created_at,
+        seen_at=datetime(2020, 1, 3, microsecond=1000, tzinfo=TzInfo()),
+        settings=Settings(enabled=True, label="x"),
+        basket=Basket(items=[Item(qty=1, price=10.9, name="foo")]),
+        tags=("a", "b"),
+    )
+    await db.put(stored)
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("trusted reads must not call model_validate")
+
+    monkeypatch.setattr(Stored, "model_validate", fail_validation)
+    fetched = await db.get(Stored, hash_key="k1", range_key=created_at, trusted=True)
+
+    assert fetched == stored
+    assert isinstance(fetched.basket.items[0], Item)
+    assert fetched.tags == ("a", "b")
+
+
+async def test_trusted_query_matches_validated_pages(db):
+    for day in range(1, 4):
+        await db.put(Order(order_id="o1", created_at=f"2026-01-0{day}", total=day * 100))
+
+    async def collect(trusted: bool):
+        pages = []
+        async for page in db.query(
+            Order,
+            key_condition_expression=Key("order_id").eq("o1"),
+            limit=2,
+            trusted=trusted,
+        ):
+            pages.append(page)
+        return pages
+
+    trusted_pages = await collect(True)
+    validated_pages = await collect(False)
+    assert trusted_pages == validated_pages
+    assert trusted_pages[0].last_evaluated_key == {"order_id": "o1", "created_at": "2026-01-02"}
+
+
+async def test_trusted_reads_client_default_applies_to_scan_and_batch_get(db):
+    db.trusted_reads = True
+    await db.put(User(user_id="u1", name="Alice", email="alice@example.com"))
+    await db.put(
+        ComplexOrder(
+            order_id="o1",
+            created_at=datetime(2020, 1, 1, tzinfo=TzInfo()),
+            total=100,
+            basket=Basket(items=[Item(qty=1, price=10.9, name="foo")]),
+        )
+    )
+
+    scanned = [item async for page in db.scan(User) for item in page.items]
+    assert scanned == [User(user_id="u1", name="Alice", email="alice@example.com")]
+
+    result = await db.batch_get([
+        BatchGet(User, hash_key="u1", projection_expression=[ProjectionAttr("user_id")]),
+        BatchGet(ComplexOrder, hash_key="o1", range_key=datetime(2020, 1, 1, tzinfo=TzInfo())),
+    ])
+    projected = result.items[User][0]
+    assert projected.user_id == "u1"
+    assert projected.email is None
+    assert "name" not in projected.model_fields_set
+    assert result.items[ComplexOrder][0].basket.items[0].price == 10.9
@@ -1,8 +1,10 @@
 from datetime import datetime
 
+import pytest
+from boto3.dynamodb.conditions import Attr
 from pydantic_core import TzInfo
 
-from aiodynamodb import DynamoModel, HashKey, UpdateAttr, table
+from aiodynamodb import DynamoModel, HashKey, Param, UpdateAttr, table
 from aiodynamodb.custom_types import Timestamp
 from tests.unit.entities import Basket, ComplexOrder, Item, User
 
@@ -83,6 +85,41 @@ async def test_update_supports_atomic_counter_increment(db):
     assert second == Counter(counter_id="c1", value=5)
 
 
+async def test_prepared_update_binds_key_and_values(db):
+    @table("prepared_counters")
+    class Counter(DynamoModel):
+        counter_id: HashKey[str]
+        value: int = 0
+        touched_at: Timestamp | None = None
+
+    await db.create_table(Counter)
+    await db.put(Counter(counter_id="c1"))
+    await db.put(Counter(counter_id="c2"))
+
+    increment = db.prepare_update(
+        Counter,
+        update_expression={UpdateAttr("value").add(Param("by")), UpdateAttr("touched_at").set(Param("at"))},
+        condition_expression=Attr("value").lt(Param("limit")) & Attr("counter_id").exists(),
+        return_values="ALL_NEW",
+    )
+    ts = datetime(2020, 1, 1, tzinfo=TzInfo())
+
+    assert await increment.execute(hash_key="c1", by=2, at=ts, limit=10) == Counter(
+        counter_id="c1", value=2, touched_at=ts
+    )
+    assert await increment.execute(hash_key="c1", by=3, at=ts, limit=10) == Counter(
+        counter_id="c1", value=5, touched_at=ts
+    )
+    assert await increment.execute(hash_key="c2", by=1, at=ts, limit=10) == Counter(
+        counter_id="c2", value=1, touched_at=ts
+    )
+    ex = await db.exceptions()
+    with pytest.raises(ex.ConditionalCheckFailedException):
+        await increment.execute(hash_key="c1", by=1, at=ts, limit=5)
+    with pytest.raises(TypeError, match=r"missing \['limit'\]"):
+        await increment.execute(hash_key="c1", by=1, at=ts)
+
+
 async def test_update_supports_specific_indexed_list_element(db):
     basket = Basket(items=[Item(qty=1, price=10.9, name="foo"), Item(qty=2, price=5.5, name="bar")])
     created_at = datetime(2020, 1, 1, tzinfo=TzInfo())
@@ -0,0 +1,27 @@
+from aiodynamodb import DynamoDB
+from aiodynamodb._serializers import _model_constructor_cache
+from aiodynamodb.client import _page_adapters
+from tests.unit.entities import Order, User
+
+
+async def test_warmup_opens_connections_and_primes_models(db):
+    calls: list[str] = []
+
+    async with DynamoDB(pool_size=2) as warm:
+        pool = warm._pool
+        assert pool is not None
+        for client in pool.clients:
+            client.meta.events.register(
+                "provide-client-params.dynamodb", lambda params, model, **kwargs: calls.append(model.name)
+            )
+
+        await warm.warmup(models=[User, Order], connections=4)
+
+        assert calls == ["DescribeTable"] * 4
+        assert User in _page_adapters and Order in _page_adapters
+        assert User in _model_constructor_cache
+        assert warm.in_flight == [0, 0]
+
+        calls.clear()
+        await warm.warmup()
+        assert calls == ["DescribeEndpoints"] * 2
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import pytest
+from boto3.dynamodb.conditions import Attr
+from botocore.validate import ParamValidator
+from pydantic_core import TzInfo
+
+from aiodynamodb import DynamoDB, DynamoModel, HashKey, table
+from aiodynamodb.models import (
+    BatchDelete,
+    BatchPut,
+    TransactConditionCheck,
+    TransactDelete,
+    TransactPut,
+    TransactUpdate,
+)
+from aiodynamodb.updates import UpdateAttr
+from tests.unit.entities import Basket, ComplexOrder, Item, Order
+
+
+@table("wire_blobs")
+class WireBlob(DynamoModel):
+    blob_id: HashKey[str]
+    data: bytes
+    tags: set[str] = set()
+    chunks: set[bytes] = set()
+    meta: dict[str, float] = {}
+    note: str | None = None
+
+
+async def _write_everything(db: DynamoDB) -> None:
+    await db.put(Order(order_id="o1", created_at="2026-01-01", total=100))
+    await db.put(
+        ComplexOrder(
+            order_id="o2",
+            created_at=datetime(2026, 1, 1, tzinfo=TzInfo()),
+            total=5,
+            basket=Basket(items=[Item(qty=2, price=1.1, name="café ☕")]),
+        ),
+        condition_expression=Attr("total").not_exists() | Attr("total").gte(0),
+    )
+    await db.put(WireBlob(blob_id="b1", data=b"\x00\xff", tags={"a"}, chunks={b"\x01"}, meta={"x": 0.5}, note='q"uote'))
+    await db.batch_write([
+        BatchPut(Order(order_id="o3", created_at="2026-01-03", total=3)),
+        BatchPut(WireBlob(blob_id="b2", data=b"\x10")),
+        BatchDelete(Order, hash_key="o9", range_key="2026-01-09"),
+    ])
+    await db.transact_write(
+        [
+            TransactPut(Order(order_id="o4", created_at="2026-01-04", total=4)),
+            TransactUpdate(
+                Order,
+                hash_key="o1",
+                range_key="2026-01-01",
+                update_expression={UpdateAttr("total").set(101)},
+                condition_expression=Attr("total").exists(),
+            ),
+            TransactConditionCheck(WireBlob, hash_key="b1", condition_expression=Attr("data").eq(b"\x00\xff")),
+            TransactDelete(Order, hash_key="o8", range_key="2026-01-08"),
+        ],
+        # botocore fills in a random token otherwise
+        client_request_token="wire-mode-token",
+    )
+
+
+async def _captured_bodies(db: DynamoDB) -> list[bytes]:
+    bodies: list[bytes] = []
+
+    def capture(request, **kwargs):
+        bodies.append(request.body)
+
+    client = await db._ensure_client()
+    client.meta.events.register("before-send.dynamodb", capture)
+    await _write_everything(db)
+    return bodies
+
+
+async def test_wire_mode_bodies_match_botocore_byte_for_byte(db):
+    await db.create_table(WireBlob)
+
+    expected = await _captured_bodies(db)
+    async with DynamoDB(wire_mode=True) as wire_db:
+        actual = await _captured_bodies(wire_db)
+
+    assert len(actual) == len(expected) == 5
+    assert actual == expected
+
+
+async def test_wire_mode_skips_parameter_validation(db, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("botocore validated a wire mode request")
+
+    async with DynamoDB(wire_mode=True) as wire_db:
+        monkeypatch.setattr(ParamValidator, "validate", fail)
+        await wire_db.put(Order(order_id="o1", created_at="2026-01-01", total=100))
+        with pytest.raises(AssertionError):
+            await wire_db.get(Order, hash_key="o1", range_key="2026-01-01")
+        monkeypatch.undo()
+
+    fetched = await db.get(Order, hash_key="o1", range_key="2026-01-01")
+    assert fetched == Order(order_id="o1", created_at="2026-01-01", total=100)